@@ -3,22 +3,31 @@
 This module coordinates the graph logic, UI rendering, physical hardware (buttons and LEDs), and audio manager to provide a cohesive game experience.
 """
 
+import time
 from tkinter import *
 from tkinter import messagebox
 from duckquest.graph.manager import GraphManager
 from duckquest.graph.logic import GraphLogic
 from duckquest.graph.renderer import GraphRenderer
 from duckquest.graph.ui import GraphUI
+from duckquest.graph import recording
+from duckquest.hardware.board_sync import BoardSync
 from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import INPUT_BUDGET_MS, timed, timings
 
 logger = setup_logger(__name__)  # Initialize module-level logger
 
+INPUT_POLL_MS = 10  # How often the Tk loop drains the button event queue
+
 
 # from duckquest.audio.manager import AudioManager
 class GameManager:
     """Manage the overall game state, including logic, UI, audio, and hardware interactions."""
 
-    def __init__(self, is_rpi: bool):
+    recorder = None  # SessionRecorder of the actions, if the session is recorded
+    pending_press = None  # ButtonEvent whose latency has not been recorded yet
+
+    def __init__(self, is_rpi: bool, root=None, record: bool = False):
         logger.info("Initializing GameManager")
 
         self.score = 0
@@ -26,7 +35,14 @@ class GameManager:
 
         logger.debug("Initializing graph structure and logic")
         self.graph = GraphManager()
+        self.graph.load_board_banks()
         self.logic = GraphLogic(self)
+        if record:
+            self.recorder = recording.SessionRecorder(
+                recording.session_path(), self.graph
+            )
+            self.recorder.board(self.difficulty, self.graph)
+            recording.prune_sessions()
 
         # Audio system placeholder
         # self.audio_manager = AudioManager()
@@ -34,7 +50,7 @@ class GameManager:
 
         logger.debug("Initializing graph rendering and UI")
         self.graph_renderer = GraphRenderer(self)
-        self.graph_ui = GraphUI(self)
+        self.graph_ui = GraphUI(self, root)
         self.root = self.graph_ui.root
 
         logger.debug("Importing hardware interfaces")
@@ -52,99 +68,184 @@ class GameManager:
             self.led_strip_manager = LEDStripManager()
             self.running = True
             self.button_manager = ButtonManager([17, 22, 23, 27, 16])  # GPIO pin setup
+            self.board_sync = BoardSync(self.led_strip_manager, self.graph, self.logic)
             logger.debug("Hardware initialized successfully")
         except Exception as e:
-            logger.critical(f"Failed to initialize hardware: {e}", exc_info=True)
+            logger.critical("Failed to initialize hardware: %s", e, exc_info=True)
             raise
 
+        self.board_sync.sync()
         self.check_buttons()
         logger.info("GameManager initialized")
 
     def check_buttons(self):
-        """Check whether a button is pressed and perform the corresponding action."""
+        """Handle the button presses queued since the last call, then re-arm."""
         if self.running:
+            self.handle_button_events()
+            self.root.after(INPUT_POLL_MS, self.check_buttons)
+
+    def handle_button_events(self):
+        """Run the action of every queued button press, oldest first."""
+        actions = {
+            17: self.select_node,
+            22: self.next_node,
+            23: self.previous_node,
+            27: self.reset_selection,
+            16: self.check_path,
+        }
+        for event in self.button_manager.poll_events():
+            # Any press cuts the score animation short and brings the board back
+            if self.led_strip_manager.cancel():
+                self.board_sync.invalidate()
+            if self.recorder:
+                self.recorder.write(recording.PRESS, event.pin)
+            action = actions.get(event.pin)
+            if action is None:
+                logger.warning("Press on unmapped pin %s ignored", event.pin)
+                continue
+            logger.debug("Button %s pressed: %s()", event.pin, action.__name__)
+            self.pending_press = event
             try:
-                pressed_button = self.button_manager.get_pressed_button()
-                if pressed_button == 17:
-                    logger.debug("Button 17 pressed: select_node()")
-                    self.select_node()
-                elif pressed_button == 22:
-                    logger.debug("Button 22 pressed: next_node()")
-                    self.next_node()
-                elif pressed_button == 23:
-                    logger.debug("Button 23 pressed: previous_node()")
-                    self.previous_node()
-                elif pressed_button == 27:
-                    logger.debug("Button 27 pressed: reset_selection()")
-                    self.reset_selection()
-                elif pressed_button == 16:
-                    logger.debug("Button 16 pressed: check_path()")
-                    self.check_path()
+                action()
             except Exception as e:
-                logger.warning(f"Error while handling button press: {e}", exc_info=True)
+                logger.warning(
+                    "Error while handling button press: %s", e, exc_info=True
+                )
+            self.press_handled()
+
+    def press_handled(self):
+        """Record the latency of the press being handled, once the display is updated.
+
+        Actions that then wait for the player, like the result dialog of check_path,
+        call it themselves so that the wait is not counted.
+        """
+        event, self.pending_press = self.pending_press, None
+        if event is None:
+            return
+        self.button_manager.events.handled(event)
+        if timings.enabled:
+            # From the GPIO edge to the display and LEDs being updated
+            latency_ns = int((time.monotonic() - event.timestamp) * 1e9)
+            timings.record("input.press_to_display", latency_ns)
 
-            self.root.after(100, self.check_buttons)
+    def update_display(self):
+        """Show the user's path and its cost on screen and on the board LEDs."""
+        self.graph_renderer.display_user_path()
+        self.graph_ui.update_path_display()
+        self.board_sync.sync()
 
+    @timed("action.next_node")
     def next_node(self):
         """Move selection to the next available node in a cyclic manner."""
         logger.debug("Switching to next node")
-        self.logic.selection_index = (self.logic.selection_index + 1) % len(
-            self.logic.available_nodes
-        )
-        self.graph_renderer.display_user_path()
+        self.logic.next_node()
+        if self.recorder:
+            self.recorder.write(recording.NEXT)
+        self.update_display()
 
+    @timed("action.previous_node")
     def previous_node(self):
         """Move selection to the previous available node in a cyclic manner."""
         logger.debug("Switching to previous node")
-        self.logic.selection_index = (self.logic.selection_index - 1) % len(
-            self.logic.available_nodes
-        )
-        self.graph_renderer.display_user_path()
+        self.logic.previous_node()
+        if self.recorder:
+            self.recorder.write(recording.PREVIOUS)
+        self.update_display()
 
+    @timed("action.select_node")
     def select_node(self):
         """Handle node selection."""
         logger.debug("Selecting current node")
         self.logic.change_current_node()
-        self.graph_renderer.display_user_path()
+        if self.recorder:
+            self.recorder.node(recording.SELECT, self.logic.current_node)
+        self.update_display()
 
+    @timed("action.reset_selection")
     def reset_selection(self):
         """Reset all selected nodes and edges."""
         logger.info("Resetting selection")
         self.logic.reset_selection()
-        self.graph_renderer.display_user_path()
+        if self.recorder:
+            self.recorder.write(recording.RESET)
+        self.update_display()
 
+    @timed("action.restart_game")
     def restart_game(self):
         """Restart the game."""
         logger.info("Restarting game")
         self.logic.restart_game()
-        self.graph_renderer.display_user_path()
+        if self.recorder:
+            self.recorder.write(recording.RESTART)
+            self.recorder.board(self.difficulty, self.graph)
+        self.update_display()
 
     def quit_game(self):
         """Close the application."""
         logger.info("Quitting game")
+        self.led_strip_manager.cancel()
         self.led_strip_manager.clear()
+        self.led_strip_manager.close()
         self.running = False
+        logger.info(
+            "Button latency stats: %s", self.button_manager.events.stats.summary()
+        )
+        if timings.enabled:
+            self.dump_timings()
         self.button_manager.cleanup()
+        if self.recorder:
+            self.recorder.write(recording.QUIT)
+            self.recorder.close()
         self.root.quit()
 
+    def latency_report(self) -> dict:
+        """Return the latency summary of every timed span and the input budget share."""
+        presses = timings.histograms.get("input.press_to_display")
+        within = presses.fraction_below(INPUT_BUDGET_MS * 1000) if presses else None
+        return {
+            "enabled": timings.enabled,
+            "input_budget_ms": INPUT_BUDGET_MS,
+            "within_budget": within,
+            "spans": timings.report(),
+        }
+
+    def dump_timings(self, path: str = None) -> str:
+        """Write the latency histograms to a JSON file and return its path."""
+        return timings.dump(path)
+
+    @timed("action.click")
     def on_click(self, event):
         """Handle node clicks and builds the user's selected path"""
-        if event.xdata and event.ydata:
-            logger.debug(f"Click at ({event.xdata}, {event.ydata})")
-            for node, position in self.graph.node_positions.items():
-                if (
-                    abs(event.xdata - position[0]) < 0.2
-                    and abs(event.ydata - position[1]) < 0.2
-                ):
-                    logger.debug(f"Node {node} selected via click")
-                    self.logic.handle_node_click(node)
-                    self.graph_renderer.display_user_path()
-                    break
+        if event.inaxes is not self.graph_renderer.ax:
+            return
+        logger.debug("Click at (%s, %s) px", event.x, event.y)
+        node = self.graph_renderer.node_at(event.x, event.y)
+        if node is not None:
+            logger.debug("Node %s selected via click", node)
+            self.logic.handle_node_click(node)
+            if self.recorder:
+                self.recorder.node(recording.CLICK, node)
+            self.update_display()
 
     def check_path(self):
         """Check if the user's selected path is the shortest path"""
         logger.info("Checking user's path against shortest path")
-        result, score = self.logic.check_shortest_path()
+        # Timed up to the result dialog, which waits for the player
+        with timings.span("action.check_path"):
+            result, score = self.logic.check_shortest_path()
+            if self.recorder:
+                path = self.logic.path
+                self.recorder.write(recording.CHECK, score, path.cost, len(path))
+                self.recorder.flush()  # A game ends here: keep it even if the power goes
+
+            # Played by the LED animation thread while the result dialog is open
+            self.led_strip_manager.blink(
+                self.led_strip_manager.score_effect(score / 100), 5, 200
+            )
+            self.led_strip_manager.clear()
+            # The effects paint over every edge: repaint the board once they are done
+            self.board_sync.invalidate()
+        self.press_handled()
 
         if result.startswith("Congratulations"):
             logger.info("Correct path selected")
@@ -155,28 +256,27 @@ class GameManager:
             messagebox.showerror("Error", result)
             self.reset_selection()
 
-        self.led_strip_manager.blink(
-            self.led_strip_manager.score_effect(score / 100), 5, 200
-        )
-        self.led_strip_manager.clear()
-
         self.score += score * self.difficulty
-        logger.debug(f"Updated score: {self.score}")
+        logger.debug("Updated score: %s", self.score)
         self.graph_ui.update_score_display(self.score)
 
+    @timed("action.toggle_shortest_path")
     def toggle_shortest_path(self):
         """Display or hide the shortest path directly on the graph"""
         logger.debug("Toggling shortest path display")
+        if self.recorder:
+            self.recorder.write(recording.SHOW_PATH)
         if not self.logic.shortest_path_displayed:
             path = self.graph.shortest_path(self.logic.start_node, self.logic.end_node)
             if path:
-                logger.info(f"Displaying shortest path: {path}")
+                logger.info("Displaying shortest path: %s", path)
                 self.graph_renderer.highlight_shortest_path(path)
+                self.board_sync.sync(highlight=path)
             else:
                 logger.error("No path found between start and end nodes")
                 messagebox.showerror("Error", "No path found.")
         else:
             logger.info("Hiding shortest path display")
-            self.graph_renderer.display_user_path()
+            self.update_display()
 
         self.logic.shortest_path_displayed = not self.logic.shortest_path_displayed
@@ -0,0 +1,218 @@
+"""Board bank files: pre-generated boards for instant restarts.
+
+A bank holds the accepted boards of one difficulty level as fixed-size binary records, read
+through mmap so that loading a board needs no parsing and only touches the pages it uses.
+
+File layout (little-endian):
+
+- a 64-byte header: magic, format version, difficulty, edge count, path capacity, record
+  count and a hash of the node and edge lists the weights refer to;
+- one record per board: the edge weights (uint8, in GraphManager.edges order), the optimal
+  cost (uint16), the optimal path length (uint16) and the optimal path as node indices
+  (uint16, in GraphManager.nodes order, padded with PATH_PAD).
+
+Banks are produced offline by tuning.py and loaded by GraphManager at startup.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import NamedTuple
+import numpy as np
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BANK_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "banks")
+BANK_MAGIC = b"DQBK"
+BANK_VERSION = 2
+PATH_PAD = 0xFFFF  # Fills the unused tail of a stored path
+HEADER_SIZE = 64
+# magic, version, difficulty, edge count, path capacity, record count, topology hash
+HEADER = struct.Struct("<4sHHIHI16s")
+
+
+class BankBoard(NamedTuple):
+    """One board read from a bank."""
+
+    index: int
+    weights: np.ndarray  # uint8, in GraphManager.edges order
+    cost: int
+    path: np.ndarray  # Node indices in GraphManager.nodes order
+
+
+def topology_hash(nodes: list[str], edges: list[tuple[str, str]]) -> bytes:
+    """Return a 16-byte hash of the node and edge lists a bank is tied to."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\n".join(nodes).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update("\n".join(f"{u}-{v}" for u, v in edges).encode("utf-8"))
+    return digest.digest()
+
+
+def bank_path(difficulty: int, directory: str = BANK_DIR) -> str:
+    """Return the path of the bank file for a difficulty level."""
+    return os.path.join(directory, f"difficulty_{difficulty}.bank")
+
+
+def record_dtype(num_edges: int, path_capacity: int) -> np.dtype:
+    """Return the packed record layout of a bank."""
+    return np.dtype(
+        [
+            ("weights", np.uint8, (num_edges,)),
+            ("cost", "<u2"),
+            ("path_length", "<u2"),
+            ("path", "<u2", (path_capacity,)),
+        ]
+    )
+
+
+def write_bank(
+    path: str,
+    difficulty: int,
+    topology: bytes,
+    weights: np.ndarray,
+    costs: np.ndarray,
+    paths: np.ndarray,
+) -> None:
+    """Write boards to a bank file.
+
+    *weights* is a (boards, edges) matrix, *costs* has one entry per board and *paths* is a
+    (boards, capacity) matrix of node indices padded with PATH_PAD.
+    """
+    weights = np.asarray(weights, dtype=np.uint8)
+    paths = np.asarray(paths, dtype=np.uint16)
+    if (
+        weights.ndim != 2
+        or paths.ndim != 2
+        or not (len(weights) == len(costs) == len(paths))
+    ):
+        raise ValueError(
+            "Expected (boards, edges) weights, one cost and one path per board."
+        )
+    records = np.empty(
+        len(weights), dtype=record_dtype(weights.shape[1], paths.shape[1])
+    )
+    records["weights"] = weights
+    records["cost"] = costs
+    records["path_length"] = (paths != PATH_PAD).sum(axis=1)
+    records["path"] = paths
+
+    header = HEADER.pack(
+        BANK_MAGIC,
+        BANK_VERSION,
+        difficulty,
+        weights.shape[1],
+        paths.shape[1],
+        len(records),
+        topology,
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # A running game may have the bank mapped: never truncate the file under it
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        file.write(records.tobytes())
+    os.replace(temporary, path)
+    logger.info(f"Wrote {len(records)} boards to bank {path}")
+
+
+class BoardBank:
+    """Read-only, memory-mapped collection of pre-generated boards for one difficulty.
+
+    The mapping is released by close(), or on leaving a with block. Boards returned by
+    board() are views into it and must not be used afterwards.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            # The mapping stays valid after the file is closed
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> None:
+        """Check the header and map the records."""
+        path = self.path
+        if len(self._mmap) < HEADER_SIZE:
+            raise ValueError(f"Truncated board bank header in {path}.")
+        (
+            magic,
+            version,
+            self.difficulty,
+            self.num_edges,
+            self.path_capacity,
+            count,
+            self.topology,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != BANK_MAGIC or version != BANK_VERSION:
+            raise ValueError(f"{path} is not a version {BANK_VERSION} board bank.")
+
+        dtype = record_dtype(self.num_edges, self.path_capacity)
+        if len(self._mmap) < HEADER_SIZE + count * dtype.itemsize:
+            raise ValueError(f"Truncated board bank {path}.")
+        self.records = np.frombuffer(
+            self._mmap, dtype=dtype, count=count, offset=HEADER_SIZE
+        )
+        logger.debug(f"Mapped {count} boards from bank {path}")
+
+    def close(self) -> None:
+        """Unmap the bank file."""
+        if not self._mmap.closed:
+            self.records = None  # Drops the view, or the mapping could not be closed
+            self._mmap.close()
+            logger.debug(f"Unmapped bank {self.path}")
+
+    def __enter__(self) -> "BoardBank":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def board(self, index: int) -> BankBoard:
+        """Return one board, as views into the mapped file."""
+        record = self.records[index]
+        return BankBoard(
+            index,
+            record["weights"],
+            int(record["cost"]),
+            record["path"][: record["path_length"]],
+        )
+
+    def random_board(self, rng: np.random.Generator) -> BankBoard:
+        """Return a random board."""
+        return self.board(int(rng.integers(len(self.records))))
+
+
+def load_board_banks(
+    topology: bytes, directory: str = BANK_DIR
+) -> dict[int, BoardBank]:
+    """Load every bank in *directory* built for the graph with the given topology hash."""
+    banks = {}
+    if not os.path.isdir(directory):
+        logger.debug(f"No board bank directory at {directory}")
+        return banks
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".bank"):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            bank = BoardBank(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping board bank {path}: {e}")
+            continue
+        if bank.topology != topology or not len(bank):
+            logger.warning(f"Skipping board bank {path}: built for another graph")
+            bank.close()
+            continue
+        banks[bank.difficulty] = bank
+    logger.info(f"Board banks available for difficulties: {sorted(banks)}")
+    return banks
@@ -0,0 +1,147 @@
+"""Compiled board files: a binary cache of a board definition, read through mmap.
+
+Board definitions are JSON files under duckquest/data/boards/. The first time a definition is
+loaded it is compiled into this format and stored in the cache directory under the hash of
+the JSON content, so editing the file compiles it again and later loads only map the arrays.
+
+File layout (little-endian), every section padded to a multiple of 8 bytes:
+
+- a 64-byte header: magic, format version, node count, edge count, start and goal node
+  indices, size of the node name block and the content hash of the definition;
+- CSR adjacency: offsets (int32, nodes + 1), neighbor ids and edge ids (int32, 2 * edges),
+  as built by CompactGraph;
+- edge ends (int32, edges x 2) in definition order;
+- node positions (float64, nodes x 2);
+- node names, UTF-8 and newline-separated.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import numpy as np
+from duckquest.graph.compact import CompactGraph
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+COMPILED_MAGIC = b"DQBD"
+COMPILED_VERSION = 1
+HEADER_SIZE = 64
+# magic, version, nodes, edges, start, goal, name block size, content hash
+HEADER = struct.Struct("<4sHIIIII16s")
+
+
+def content_hash(data: bytes) -> bytes:
+    """Return the 16-byte hash a compiled board is keyed by."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack("<H", COMPILED_VERSION))
+    digest.update(data)
+    return digest.digest()
+
+
+def _padded(data: bytes) -> bytes:
+    """Pad a section to a multiple of 8 bytes."""
+    return data + b"\0" * (-len(data) % 8)
+
+
+def write_compiled(
+    path: str,
+    nodes: list[str],
+    edges: list[tuple[str, str]],
+    positions: dict[str, tuple[float, float]],
+    start: str,
+    end: str,
+    digest: bytes,
+) -> None:
+    """Compile a board into *path*; the file appears atomically once complete."""
+    core = CompactGraph(nodes, edges)
+    index = core.index
+    ends = np.array([(index[u], index[v]) for u, v in edges], dtype="<i4")
+    points = np.array([positions[node] for node in nodes], dtype="<f8")
+    names = "\n".join(nodes).encode("utf-8")
+
+    header = HEADER.pack(
+        COMPILED_MAGIC,
+        COMPILED_VERSION,
+        len(nodes),
+        len(edges),
+        index[start],
+        index[end],
+        len(names),
+        digest,
+    )
+    sections = [
+        core.offsets.astype("<i4"),
+        core.neighbor_ids.astype("<i4"),
+        core.edge_ids.astype("<i4"),
+        ends,
+        points,
+    ]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        for section in sections:
+            file.write(_padded(section.tobytes()))
+        file.write(names)
+    os.replace(temporary, path)
+    logger.info(f"Compiled board with {len(nodes)} nodes to {path}")
+
+
+class CompiledBoard:
+    """Read-only, memory-mapped compiled board."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            # The mapping stays valid after the file is closed
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER_SIZE:
+            raise ValueError(f"Truncated compiled board header in {path}.")
+        (
+            magic,
+            version,
+            num_nodes,
+            num_edges,
+            self.start_id,
+            self.end_id,
+            names_size,
+            self.digest,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+            raise ValueError(f"{path} is not a version {COMPILED_VERSION} board.")
+
+        offset = HEADER_SIZE
+
+        def section(dtype, count, shape=None):
+            nonlocal offset
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset += count * np.dtype(dtype).itemsize
+            offset += -offset % 8
+            return array if shape is None else array.reshape(shape)
+
+        try:
+            self.offsets = section("<i4", num_nodes + 1)
+            self.neighbor_ids = section("<i4", 2 * num_edges)
+            self.edge_ids = section("<i4", 2 * num_edges)
+            self.ends = section("<i4", 2 * num_edges, (num_edges, 2))
+            self.points = section("<f8", 2 * num_nodes, (num_nodes, 2))
+        except ValueError as e:
+            raise ValueError(f"Truncated compiled board {path}.") from e
+        names = self._mmap[offset : offset + names_size]
+        if len(names) != names_size:
+            raise ValueError(f"Truncated compiled board {path}.")
+        self.nodes = names.decode("utf-8").split("\n") if names_size else []
+        logger.debug(f"Mapped compiled board {path}")
+
+    @property
+    def edges(self) -> list[tuple[str, str]]:
+        """Return the edges as node name pairs, in definition order."""
+        nodes = self.nodes
+        return [(nodes[u], nodes[v]) for u, v in self.ends.tolist()]
+
+    @property
+    def positions(self) -> dict[str, tuple[float, float]]:
+        """Return the position of every node."""
+        return {node: (x, y) for node, (x, y) in zip(self.nodes, self.points.tolist())}
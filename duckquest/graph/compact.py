@@ -0,0 +1,166 @@
+"""Array-backed graph core for DuckQuest.
+
+Stores an undirected graph with integer node ids, CSR adjacency arrays and a NumPy weight
+array parallel to the edge list. Used by GraphManager's compact backend for large generated
+boards and batch simulations, where networkx dict-of-dicts lookups dominate.
+
+The arrays serve the bulk operations (searches, weight updates). Single edge and neighbor
+lookups go through a dict and plain lists instead, built on first use: a NumPy slice costs
+several microseconds per lookup, more than the networkx dicts it replaces.
+"""
+
+import copy
+import heapq
+import numpy as np
+import networkx as nx
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+UNREACHABLE = -1
+
+
+class CompactGraph:
+    """Undirected weighted graph stored as CSR arrays."""
+
+    def __init__(self, nodes: list[str], edges: list[tuple[str, str]]):
+        self.nodes = list(nodes)
+        self.edges = list(edges)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+
+        # Each edge k is stored in both directions at slots 2k and 2k + 1; a stable sort by
+        # head node keeps every neighbor list in edge insertion order, like networkx does.
+        ends = np.array(
+            [(self.index[u], self.index[v]) for u, v in self.edges], dtype=np.int32
+        ).reshape(-1, 2)
+        heads = ends.ravel()
+        tails = ends[:, ::-1].ravel()
+        edge_ids = np.repeat(np.arange(len(self.edges), dtype=np.int32), 2)
+        order = np.argsort(heads, kind="stable")
+
+        self.offsets = np.zeros(len(self.nodes) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(heads, minlength=len(self.nodes)), out=self.offsets[1:])
+        self.neighbor_ids = tails[order]
+        self.edge_ids = edge_ids[order]
+        self.weights = np.zeros(len(self.edges), dtype=np.uint8)
+        self._lookups = {}  # Shared with with_weights() copies, filled by _tables()
+        logger.debug(
+            f"CompactGraph built with {len(self.nodes)} nodes and {len(self.edges)} edges"
+        )
+
+    @classmethod
+    def from_csr(
+        cls,
+        nodes: list[str],
+        edges: list[tuple[str, str]],
+        offsets,
+        neighbor_ids,
+        edge_ids,
+    ) -> "CompactGraph":
+        """Wrap CSR arrays built earlier, such as those of a compiled board file."""
+        graph = cls.__new__(cls)
+        graph.nodes = list(nodes)
+        graph.edges = list(edges)
+        graph.index = {node: i for i, node in enumerate(graph.nodes)}
+        graph.offsets = offsets
+        graph.neighbor_ids = neighbor_ids
+        graph.edge_ids = edge_ids
+        graph.weights = np.zeros(len(graph.edges), dtype=np.uint8)
+        graph._lookups = {}
+        logger.debug(
+            f"CompactGraph wrapped around {len(graph.nodes)} nodes of CSR arrays"
+        )
+        return graph
+
+    def with_weights(self, weights) -> "CompactGraph":
+        """Return a graph sharing this one's nodes and CSR arrays, with other weights."""
+        graph = copy.copy(self)
+        graph.weights = np.asarray(weights, dtype=np.uint8)
+        return graph
+
+    def node_id(self, node: str) -> int:
+        """Return the integer id of a node."""
+        return self.index[node]
+
+    def _tables(self) -> tuple[dict, list]:
+        """Return the (node, node) -> edge id dict and the neighbor lists, by node id."""
+        if not self._lookups:
+            edge_index = {}
+            for k, (u, v) in enumerate(self.edges):
+                edge_index.setdefault((u, v), k)
+                edge_index.setdefault((v, u), k)
+            offsets = self.offsets.tolist()
+            neighbor_ids = self.neighbor_ids.tolist()
+            adjacency = [
+                [self.nodes[j] for j in neighbor_ids[offsets[i] : offsets[i + 1]]]
+                for i in range(len(self.nodes))
+            ]
+            self._lookups.update(edges=edge_index, adjacency=adjacency)
+        return self._lookups["edges"], self._lookups["adjacency"]
+
+    def neighbors(self, node: str) -> list[str]:
+        """Return the neighbors of a node, in edge insertion order."""
+        return list(self._tables()[1][self.index[node]])
+
+    def edge_id(self, node1: str, node2: str) -> int | None:
+        """Return the position of an edge in the edge list, or None if it does not exist."""
+        return self._tables()[0].get((node1, node2))
+
+    def has_edge(self, node1: str, node2: str) -> bool:
+        """Return True if the two nodes are adjacent."""
+        return self.edge_id(node1, node2) is not None
+
+    def edge_weight(self, node1: str, node2: str) -> int | None:
+        """Return the weight of the edge between two nodes."""
+        edge = self.edge_id(node1, node2)
+        return None if edge is None else int(self.weights[edge])
+
+    def set_weights(self, weights) -> None:
+        """Replace all edge weights at once, in edge list order."""
+        weights = np.asarray(weights, dtype=np.uint8)
+        if weights.shape != self.weights.shape:
+            raise ValueError(
+                f"Expected {len(self.weights)} weights, got {weights.shape[0]}."
+            )
+        self.weights = weights.copy()
+
+    def dijkstra(self, source: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the distance from *source* and the next hop towards it for every node.
+
+        Unreachable nodes have a distance and next hop of UNREACHABLE.
+        """
+        offsets = self.offsets.tolist()
+        neighbor_ids = self.neighbor_ids.tolist()
+        slot_weights = self.weights[self.edge_ids].tolist()
+
+        distances = [UNREACHABLE] * len(self.nodes)
+        next_hops = [UNREACHABLE] * len(self.nodes)
+        distances[source] = 0
+        heap = [(0, source)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            for slot in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbor_ids[slot]
+                candidate = distance + slot_weights[slot]
+                known = distances[neighbor]
+                if known == UNREACHABLE or candidate < known:
+                    distances[neighbor] = candidate
+                    next_hops[neighbor] = node
+                    heapq.heappush(heap, (candidate, neighbor))
+        return np.array(distances, dtype=np.int64), np.array(next_hops, dtype=np.int32)
+
+    def to_networkx(self, colors: dict = None) -> nx.Graph:
+        """Build the equivalent networkx graph, with weight and color edge attributes."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        for (u, v), weight in zip(self.edges, self.weights.tolist()):
+            attributes = {}
+            if weight:
+                attributes["weight"] = weight
+                if colors is not None:
+                    attributes["color"] = colors[weight]
+            graph.add_edge(u, v, **attributes)
+        logger.debug("networkx view built from CompactGraph")
+        return graph
@@ -0,0 +1,117 @@
+"""Help screen with the game rules, drawn over the graph.
+
+The rules are read once from the package data, independent of the working directory. The
+text artists live on their own axes, created once, and the rendered page is cached as a
+bitmap after its first full draw: showing help again only copies that bitmap to the canvas.
+The cache is dropped when the window is resized.
+"""
+
+import json
+from functools import lru_cache
+from importlib import resources
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+HEADER_STYLE = {"fontsize": 12, "fontweight": "bold", "color": "black"}
+LINE_STYLE = {"fontsize": 10, "wrap": True, "color": "black"}
+
+
+@lru_cache(maxsize=1)
+def load_rules() -> tuple:
+    """Return the rule sections from duckquest/data/rules.json, read once."""
+    text = resources.files("duckquest").joinpath("data", "rules.json").read_text()
+    rules = tuple(json.loads(text)["rules"])
+    logger.debug(f"Loaded {len(rules)} rule sections")
+    return rules
+
+
+class HelpScreen:
+    """Rules page shown on top of the graph axis."""
+
+    def __init__(self, ax, canvas):
+        self.graph_ax = ax
+        self.canvas = canvas
+        # Same place as the graph, above it; hidden until shown
+        self.ax = ax.figure.add_axes(ax.get_position(), label="help")
+        self.ax.set_facecolor("#282C34")  # Dark background for better visibility
+        self.ax.axis("off")  # Hide axes
+        self.ax.set_visible(False)
+        self._bitmap = None
+        self._build_text()
+
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+
+    @property
+    def visible(self) -> bool:
+        """Return True while the help page covers the graph."""
+        return self.ax.get_visible()
+
+    def _build_text(self):
+        """Lay out the rules once as text artists on the help axis."""
+        try:
+            rules = load_rules()
+        except (OSError, KeyError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to load rules: {e}")
+            self.ax.text(0.5, 0.5, "Error loading rules.", ha="center", va="center")
+            return
+
+        y_position = 1.1  # Start near the top
+        line_spacing = 0.04  # Space between lines
+        for section in rules:
+            self.ax.text(
+                0.05,
+                y_position,
+                section["header"],
+                ha="left",
+                va="top",
+                transform=self.ax.transAxes,
+                **HEADER_STYLE,
+            )
+            y_position -= line_spacing * 1.5  # Add extra space after the header
+            for line in section["content"]:
+                self.ax.text(
+                    0.07,
+                    y_position,
+                    line,
+                    ha="left",
+                    va="top",
+                    transform=self.ax.transAxes,
+                    **LINE_STYLE,
+                )
+                y_position -= line_spacing
+            y_position -= line_spacing * 0.5  # Extra spacing after each section
+        logger.debug("Help text laid out")
+
+    def show(self):
+        """Cover the graph with the help page."""
+        self.graph_ax.set_visible(False)
+        self.ax.set_visible(True)
+        if self._bitmap is None:
+            # First display or window resized: lay out the page and cache it
+            self.canvas.draw()
+            logger.info("Help screen rendered")
+        else:
+            self.canvas.restore_region(self._bitmap)
+            self.canvas.blit(self.canvas.figure.bbox)
+            logger.info("Help screen restored from cache")
+
+    def hide(self):
+        """Give the area back to the graph; the caller redraws it."""
+        self.ax.set_visible(False)
+        self.graph_ax.set_visible(True)
+
+    def invalidate(self):
+        """Drop the cached page so the next show() lays it out again."""
+        self._bitmap = None
+
+    def _on_draw(self, event):
+        """Cache the page after a full redraw that showed it."""
+        if self.visible:
+            self._bitmap = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+
+    def _on_resize(self, event):
+        """The cached page no longer matches the canvas size."""
+        logger.debug("Help screen cache invalidated by resize")
+        self.invalidate()
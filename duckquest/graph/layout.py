@@ -0,0 +1,361 @@
+"""Board layouts: nodes, edges, node positions and the start and goal nodes.
+
+Boards are defined in versioned JSON files under duckquest/data/boards/; classic.json is the
+44-node board of the physical game. load_board() goes through a compiled binary cache of
+each definition (see boardfile.py), so a board is only parsed when its file changes.
+
+The generators build planar, board-like graphs of any size with coordinates, used to
+stress-test the engine and for the big-screen version of the game:
+
+- grid_board: a square grid with a fraction of its nodes punched out as holes
+- delaunay_board: random points joined by a Delaunay triangulation, pruned down to its
+  Euclidean minimum spanning tree plus a random share of the other edges
+
+Generated boards are always connected. Nodes are named like the classic board, a letter
+followed by a number (A1 ... Z1, A2 ... Z2, A3 ...). The start and goal are picked by
+select_ends().
+"""
+
+import json
+import math
+import os
+from dataclasses import dataclass, field
+import numpy as np
+from duckquest.graph.boardfile import CompiledBoard, content_hash, write_compiled
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+END_MODES = ("left-right", "diameter", "random")
+BOARD_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "boards")
+BOARD_FORMAT = 1  # Version of the JSON board definitions
+
+
+@dataclass
+class BoardLayout:
+    """Topology and drawing positions of a board."""
+
+    nodes: list[str]
+    edges: list[tuple[str, str]]
+    positions: dict[str, tuple[float, float]]
+    start: str
+    end: str
+    name: str = "board"
+    compiled: CompiledBoard = field(default=None, repr=False, compare=False)
+
+
+def node_name(index: int) -> str:
+    """Return the name of the node at *index*: A1 ... Z1, A2 ... Z2 and so on."""
+    return f"{LETTERS[index % 26]}{index // 26 + 1}"
+
+
+def _find(parent: list[int], i: int) -> int:
+    """Return the union-find root of *i*, halving the path on the way."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent: list[int], u: int, v: int) -> bool:
+    """Merge the sets of *u* and *v*; return False if they were already one set."""
+    ru, rv = _find(parent, u), _find(parent, v)
+    if ru == rv:
+        return False
+    parent[ru] = rv
+    return True
+
+
+def _components(num_nodes: int, pairs: np.ndarray) -> np.ndarray:
+    """Return the connected component label of every node."""
+    parent = list(range(num_nodes))
+    for u, v in pairs.tolist():
+        _union(parent, u, v)
+    return np.array([_find(parent, i) for i in range(num_nodes)], dtype=np.int64)
+
+
+def _hop_distances(num_nodes: int, pairs: np.ndarray, source: int) -> np.ndarray:
+    """Return the number of edges from *source* to every node (-1 if unreachable)."""
+    neighbors = [[] for _ in range(num_nodes)]
+    for u, v in pairs.tolist():
+        neighbors[u].append(v)
+        neighbors[v].append(u)
+    hops = [-1] * num_nodes
+    hops[source] = 0
+    frontier = [source]
+    while frontier:
+        following = []
+        for node in frontier:
+            for neighbor in neighbors[node]:
+                if hops[neighbor] < 0:
+                    hops[neighbor] = hops[node] + 1
+                    following.append(neighbor)
+        frontier = following
+    return np.array(hops, dtype=np.int64)
+
+
+def select_ends(
+    points: np.ndarray,
+    pairs: np.ndarray,
+    mode: str = "left-right",
+    rng: np.random.Generator = None,
+) -> tuple[int, int]:
+    """Pick the start and goal node indices of a connected board with edges *pairs*.
+
+    - "left-right": the leftmost and rightmost nodes, like the classic board
+    - "diameter": two nodes about as many edges apart as possible (double BFS sweep)
+    - "random": two distinct nodes drawn from *rng*
+    """
+    if mode == "left-right":
+        return int(np.argmin(points[:, 0])), int(np.argmax(points[:, 0]))
+    if mode == "diameter":
+        far = int(np.argmax(_hop_distances(len(points), pairs, 0)))
+        return far, int(np.argmax(_hop_distances(len(points), pairs, far)))
+    if mode == "random":
+        rng = rng or np.random.default_rng()
+        start, end = rng.choice(len(points), size=2, replace=False).tolist()
+        return start, end
+    raise ValueError(f"Unknown start/goal mode '{mode}', expected one of {END_MODES}.")
+
+
+def _build(
+    points: np.ndarray, pairs: np.ndarray, ends: str, rng, name: str
+) -> BoardLayout:
+    """Keep the largest connected component and turn index arrays into a layout."""
+    labels = _components(len(points), pairs)
+    keep = labels == np.bincount(labels).argmax()
+    new_ids = np.cumsum(keep) - 1
+    points = points[keep]
+    pairs = new_ids[pairs[keep[pairs[:, 0]]]]
+
+    start, end = select_ends(points, pairs, ends, rng)
+    nodes = [node_name(i) for i in range(len(points))]
+    layout = BoardLayout(
+        nodes=nodes,
+        edges=[(nodes[u], nodes[v]) for u, v in pairs.tolist()],
+        positions={node: (x, y) for node, (x, y) in zip(nodes, points.tolist())},
+        start=nodes[start],
+        end=nodes[end],
+        name=name,
+    )
+    logger.info(
+        f"Generated {name} board: {len(layout.nodes)} nodes, {len(layout.edges)} edges, "
+        f"{layout.start} -> {layout.end}"
+    )
+    return layout
+
+
+def grid_board(
+    rows: int,
+    cols: int,
+    holes: float = 0.1,
+    jitter: float = 0.0,
+    ends: str = "left-right",
+    seed: int = None,
+) -> BoardLayout:
+    """Build a grid board with a fraction *holes* of its nodes removed.
+
+    *jitter* moves every node by up to that fraction of the grid step, so the board looks
+    less regular. Only the largest connected part of the grid is kept.
+    """
+    if rows < 1 or cols < 2:
+        raise ValueError("A grid board needs at least one row and two columns.")
+    if not 0 <= holes < 1:
+        raise ValueError(f"Hole fraction must be in [0, 1), got {holes}.")
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    ys, xs = np.divmod(np.arange(rows * cols), cols)
+    points = np.column_stack([xs, ys]).astype(float)
+    if jitter:
+        points += rng.uniform(-jitter / 2, jitter / 2, size=points.shape)
+
+    pairs = np.concatenate(
+        [
+            np.column_stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()]),
+            np.column_stack([ids[:-1, :].ravel(), ids[1:, :].ravel()]),
+        ]
+    )
+    present = rng.random(rows * cols) >= holes
+    pairs = pairs[present[pairs[:, 0]] & present[pairs[:, 1]]]
+    # Holes are isolated nodes now; _build drops them with the smaller components
+    return _build(points, pairs, ends, rng, "grid")
+
+
+def delaunay_board(
+    num_points: int,
+    extra_edges: float = 0.5,
+    aspect: float = 2.0,
+    ends: str = "left-right",
+    seed: int = None,
+) -> BoardLayout:
+    """Build a board from random points joined by a pruned Delaunay triangulation.
+
+    The Euclidean minimum spanning tree of the triangulation keeps the board connected;
+    each other triangulation edge is kept with probability *extra_edges*. Points are spread
+    over a rectangle *aspect* times wider than tall, with the density of a unit grid.
+    """
+    # matplotlib's Delaunay triangulation, imported here to keep startup light
+    from matplotlib.tri import Triangulation
+
+    if num_points < 3:
+        raise ValueError("A Delaunay board needs at least three points.")
+    rng = np.random.default_rng(seed)
+    height = math.sqrt(num_points / aspect)
+    points = rng.random((num_points, 2)) * (aspect * height, height)
+    triangulation = Triangulation(points[:, 0], points[:, 1])
+    pairs = np.sort(triangulation.edges, axis=1)
+
+    # Kruskal over the triangulation edges, shortest first
+    lengths = np.hypot(*(points[pairs[:, 0]] - points[pairs[:, 1]]).T)
+    parent = list(range(num_points))
+    in_tree = np.zeros(len(pairs), dtype=bool)
+    for k in np.argsort(lengths, kind="stable").tolist():
+        in_tree[k] = _union(parent, *pairs[k].tolist())
+    keep = in_tree | (rng.random(len(pairs)) < extra_edges)
+    return _build(points, pairs[keep], ends, rng, "delaunay")
+
+
+def board_cache_dir() -> str:
+    """Return the directory of compiled boards (DUCKQUEST_CACHE_DIR, else the user cache)."""
+    root = os.environ.get("DUCKQUEST_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "duckquest",
+    )
+    return os.path.join(root, "boards")
+
+
+def _board_path(name: str) -> str:
+    """Return the definition file of a board name, or *name* itself if it is a path."""
+    if name.endswith(".json") or os.sep in name:
+        return name
+    return os.path.join(BOARD_DIR, f"{name}.json")
+
+
+def parse_board(data: bytes, name: str = "board") -> BoardLayout:
+    """Parse and check a JSON board definition."""
+    definition = json.loads(data)
+    if definition.get("format") != BOARD_FORMAT:
+        raise ValueError(
+            f"Board '{name}' has format {definition.get('format')}, expected {BOARD_FORMAT}."
+        )
+    nodes = list(definition["nodes"])
+    known = set(nodes)
+    edges = [tuple(edge) for edge in definition["edges"]]
+    positions = {node: tuple(xy) for node, xy in definition["positions"].items()}
+    if len(known) != len(nodes):
+        raise ValueError(f"Board '{name}' lists a node twice.")
+    unknown = {node for edge in edges for node in edge} - known
+    unknown |= {definition["start"], definition["end"]} - known
+    if unknown:
+        raise ValueError(f"Board '{name}' refers to unknown nodes {sorted(unknown)}.")
+    if known - set(positions):
+        raise ValueError(f"Board '{name}' has nodes without a position.")
+    return BoardLayout(
+        nodes, edges, positions, definition["start"], definition["end"], name
+    )
+
+
+def load_board(name: str = "classic", cache_dir: str = None) -> BoardLayout:
+    """Load a board definition, through its compiled form when it is cached.
+
+    *name* is a file name in duckquest/data/boards/ without extension, or a path to a JSON
+    definition. The compiled form is looked up by the hash of the file content; it is
+    built and cached on a miss. If the cache cannot be written, the parsed definition is
+    returned as is.
+    """
+    path = _board_path(name)
+    name = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "rb") as file:
+        data = file.read()
+    digest = content_hash(data)
+    cached = os.path.join(
+        cache_dir or board_cache_dir(), f"{name}-{digest.hex()}.board"
+    )
+
+    compiled = None
+    if os.path.exists(cached):
+        try:
+            compiled = CompiledBoard(cached)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Recompiling board '{name}': {e}")
+    if compiled is None or compiled.digest != digest:
+        layout = parse_board(data, name)
+        try:
+            write_compiled(
+                cached,
+                layout.nodes,
+                layout.edges,
+                layout.positions,
+                layout.start,
+                layout.end,
+                digest,
+            )
+            compiled = CompiledBoard(cached)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Board '{name}' used without a compiled cache: {e}")
+            return layout
+
+    nodes = compiled.nodes
+    logger.debug(f"Board '{name}' loaded from {cached}")
+    return BoardLayout(
+        nodes=nodes,
+        edges=compiled.edges,
+        positions=compiled.positions,
+        start=nodes[compiled.start_id],
+        end=nodes[compiled.end_id],
+        name=name,
+        compiled=compiled,
+    )
+
+
+def save_board(layout: BoardLayout, path: str) -> None:
+    """Write a layout as a JSON board definition, one edge and one position per line."""
+    lines = [
+        "{",
+        f'  "format": {BOARD_FORMAT},',
+        f'  "name": {json.dumps(layout.name)},',
+        f'  "start": {json.dumps(layout.start)},',
+        f'  "end": {json.dumps(layout.end)},',
+        f'  "nodes": {json.dumps(layout.nodes)},',
+        '  "edges": [',
+        ",\n".join(f"    {json.dumps(list(edge))}" for edge in layout.edges),
+        "  ],",
+        '  "positions": {',
+        ",\n".join(
+            f"    {json.dumps(node)}: {json.dumps(list(layout.positions[node]))}"
+            for node in layout.nodes
+        ),
+        "  }",
+        "}",
+    ]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    logger.info(f"Board '{layout.name}' written to {path}")
+
+
+def classic_board() -> BoardLayout:
+    """Return the 44-node board of the physical game."""
+    return load_board("classic")
+
+
+BOARD_KINDS = ("classic", "grid", "delaunay")
+
+
+def generate_board(
+    kind: str, nodes: int = 1000, ends: str = "left-right", seed: int = None
+) -> BoardLayout:
+    """Build a board of one of BOARD_KINDS with about *nodes* nodes.
+
+    Grid boards are twice as wide as tall. The classic board ignores every option.
+    """
+    if kind == "classic":
+        return classic_board()
+    if kind == "grid":
+        rows = max(1, round(math.sqrt(nodes / 2)))
+        return grid_board(rows, max(2, round(nodes / rows)), ends=ends, seed=seed)
+    if kind == "delaunay":
+        return delaunay_board(nodes, ends=ends, seed=seed)
+    raise ValueError(f"Unknown board kind '{kind}', expected one of {BOARD_KINDS}.")
@@ -3,7 +3,8 @@
 Handles node selection, path construction, and score calculation.
 """
 
-import networkx as nx
+import numpy as np
+from duckquest.graph.path import UserPath
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)  # Initialize module-level logger
@@ -12,43 +13,106 @@ logger = setup_logger(__name__)  # Initialize module-level logger
 class GraphLogic:
     """Manage the logic and operations of the graph for the game."""
 
-    def __init__(self, game_manager):
+    def __init__(self, game_manager, seed: int = None):
         self.game_manager = game_manager
         self.graph = self.game_manager.graph
 
-        self.selected_path = []
-        self.user_path_edges = []
-        self.selected_nodes = set()
+        self.path = UserPath(self.graph)
         self.shortest_path_displayed = False
+        # Picks boards from the bank or seeds random ones; fixed *seed* makes games replayable
+        self.rng = np.random.default_rng(seed)
 
         # Initialize the graph
-        self.start_node = "A1"
-        self.end_node = "Q2"
+        self.start_node = self.graph.start_node
+        self.end_node = self.graph.end_node
 
         self.current_node = self.start_node
         self.available_nodes = self.get_available_nodes()
         self.selection_index = 0
 
         logger.info(
-            f"Initializing GraphLogic from {self.start_node} to {self.end_node}"
+            "Initializing GraphLogic from %s to %s", self.start_node, self.end_node
         )
-        self.graph.assign_weights_and_colors(self.game_manager.difficulty)
+        self.new_board()
         logger.debug("Graph weights and colors assigned")
         self.change_current_node()
 
+    @property
+    def selected_path(self) -> list[str]:
+        """Nodes selected by the player, in order."""
+        return list(self.path.nodes)
+
+    @selected_path.setter
+    def selected_path(self, nodes):
+        self.path = UserPath.from_nodes(self.graph, nodes)
+
+    @property
+    def selected_nodes(self):
+        """Set-like view of the selected nodes."""
+        return self.path.nodes.keys()
+
+    @property
+    def user_path_edges(self) -> list[tuple[str, str]]:
+        """Edges of the player's path, in the order they were selected."""
+        return list(self.path.edges.values())
+
     def get_available_nodes(self):
         """Return a list of available neighboring nodes."""
         neighbors = [
             self.current_node,
             *reversed(self.graph.neighbors(self.current_node)),
         ]
-        logger.debug(f"Available neighbors from {self.current_node}: {neighbors}")
+        logger.debug("Available neighbors from %s: %s", self.current_node, neighbors)
         return neighbors
 
+    def new_board(self):
+        """Load a board from the bank for the current difficulty, or draw a random one."""
+        difficulty = self.game_manager.difficulty
+        bank = self.graph.board_banks.get(difficulty)
+        if bank is None:
+            seed = int(self.rng.integers(np.iinfo(np.int64).max))
+            self.graph.assign_weights_and_colors(difficulty, seed=seed)
+        else:
+            board = bank.random_board(self.rng)
+            path = [self.graph.nodes[i] for i in board.path]
+            self.graph.apply_weights(board.weights, optimal_path=(board.cost, path))
+            logger.info(
+                "Board %s loaded from bank (optimal cost %s)", board.index, board.cost
+            )
+        # Known for bank boards, one Dijkstra run otherwise; reused by every check
+        self.optimal_cost = self.graph.shortest_path_cost(
+            self.start_node, self.end_node
+        )
+
+    def remaining_cost(self) -> int | None:
+        """Return the cheapest cost from the current node to the goal, or None."""
+        # One table per board towards the goal, then a lookup per move
+        return self.graph.path_table(self.end_node)[0].get(self.current_node)
+
+    def path_estimate(self) -> tuple[int, int | None, int]:
+        """Return the cost so far, the best total possible from here and its score.
+
+        The score is the one the player would get by finishing on the best path from the
+        current node; it is 0 when the goal cannot be reached.
+        """
+        remaining = self.remaining_cost()
+        if remaining is None or not self.optimal_cost:
+            return self.path.cost, None, 0
+        best = self.path.cost + remaining
+        return self.path.cost, best, min(100, int(100 * self.optimal_cost / best))
+
+    def next_node(self):
+        """Move the selection to the next available node, cyclically."""
+        self.selection_index = (self.selection_index + 1) % len(self.available_nodes)
+
+    def previous_node(self):
+        """Move the selection to the previous available node, cyclically."""
+        self.selection_index = (self.selection_index - 1) % len(self.available_nodes)
+
     def change_current_node(self):
         """Update the current node to the selected node."""
         self.current_node = self.available_nodes[self.selection_index]
-        logger.info(f"Current node changed to {self.current_node}")
+        logger.info("Current node changed to %s", self.current_node)
         self.available_nodes = self.get_available_nodes()
         self.handle_node_click(self.current_node)
         self.selection_index = 0
@@ -56,9 +120,7 @@ class GraphLogic:
     def reset_selection(self):
         """Reset all selected nodes and edges"""
         logger.info("Resetting user selection")
-        self.selected_path = []
-        self.user_path_edges = []
-        self.selected_nodes = set()
+        self.path.clear()
 
         self.current_node = self.start_node
         self.available_nodes = self.get_available_nodes()
@@ -67,45 +129,40 @@ class GraphLogic:
     def restart_game(self):
         """Restart the game by randomizing edge weights"""
         logger.info("Restarting game logic and reassigning weights")
-        self.graph.assign_weights_and_colors(self.game_manager.difficulty)
+        self.new_board()
         self.shortest_path_displayed = False
         self.reset_selection()
 
     def calculate_score(self):
         """Calculate the score based on the optimal path"""
         logger.debug("Calculating score for user's path")
-        try:
-            shortest_path = self.graph.shortest_path(self.start_node, self.end_node)
-            W_optimal = sum(
-                self.graph.graph[u][v]["weight"]
-                for u, v in zip(shortest_path, shortest_path[1:])
-            )
-            logger.debug(f"Shortest path: {shortest_path}, optimal weight: {W_optimal}")
-        except nx.NetworkXNoPath:
+        W_optimal = self.optimal_cost
+        if W_optimal is None:
             logger.warning("No path exists between start and end node")
             return "No path between selected nodes.", 0
+        logger.debug("Optimal weight: %s", W_optimal)
 
         if (
-            not self.selected_path
-            or self.selected_path[0] != self.start_node
-            or self.selected_path[-1] != self.end_node
+            not self.path
+            or next(iter(self.path)) != self.start_node
+            or self.path.last != self.end_node
         ):
             logger.warning("Invalid path boundaries selected by user")
             return "Your path must start at the beginning and end at the goal.", 0
 
-        # Calculate the weight of the path selected by the user
-        W_user = sum(self.graph.graph[u][v]["weight"] for u, v in self.user_path_edges)
-        logger.debug(f"User path weight: {W_user}")
+        # Weight of the path selected by the user, kept up to date on every click
+        W_user = self.path.cost
+        logger.debug("User path weight: %s", W_user)
 
         # Score calculation
         score = int(max(0, 100 * (W_optimal / W_user)))
-        logger.info(f"Score calculated: {score}%")
+        logger.info("Score calculated: %s%%", score)
         return f"Your score: {score} %", score
 
     def check_shortest_path(self):
         """Check if the user's selected path is the shortest path"""
         logger.info("Checking if user path is the shortest path")
-        if len(self.selected_path) < 2:
+        if len(self.path) < 2:
             logger.warning("Path too short to evaluate")
             return "Please select a valid path with at least two nodes.", 0
 
@@ -123,22 +180,10 @@ class GraphLogic:
 
     def handle_node_click(self, node: str):
         """Handles a single node click"""
-        logger.debug(f"Handling click on node: {node}")
-        if node in self.selected_nodes:
-            logger.debug(f"Deselecting node: {node}")
-            self.selected_nodes.remove(node)
-            self.selected_path = [n for n in self.selected_path if n != node]
-            self.user_path_edges = [
-                edge for edge in self.user_path_edges if node not in edge
-            ]
+        logger.debug("Handling click on node: %s", node)
+        if node in self.path:
+            logger.debug("Deselecting node: %s", node)
+            self.path.remove(node)
         else:
-            logger.debug(f"Selecting node: {node}")
-            self.selected_nodes.add(node)
-            if self.selected_path and self.selected_path[-1] != node:
-                edge = (self.selected_path[-1], node)
-                if self.graph.graph.has_edge(*edge) or self.graph.graph.has_edge(
-                    *edge[::-1]
-                ):
-                    self.user_path_edges.append(edge)
-                    logger.debug(f"Edge added to path: {edge}")
-            self.selected_path.append(node)
+            logger.debug("Selecting node: %s", node)
+            self.path.add(node)
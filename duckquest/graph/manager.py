@@ -1,10 +1,32 @@
 """Graph data manager for DuckQuest.
 
 Creates and stores the graph structure, assigns weights and colors to edges, and provides utilities for pathfinding and neighbor queries.
+
+Shortest paths are answered from a distance/predecessor table computed once per target node
+with a single Dijkstra run from that node. Tables are dropped whenever the weights change.
+
+Two storage backends are available: "networkx" (default) keeps a networkx graph, while
+"compact" keeps integer ids and CSR arrays (see compact.py) and only builds the networkx
+graph lazily when something needs it, such as the renderer.
+
+The compact backend can use any solver from solvers.py, chosen per board with set_solver().
+Solvers that only answer point queries (bidirectional, A*) are used for shortest_path and
+shortest_path_cost; path tables always come from a single-source solver.
+
+The board itself (nodes, edges, positions, CSR adjacency) is a BoardTopology built once per
+process and shared by every GraphManager; a GraphManager only holds the state of one session.
+
+Edge weights are drawn for all edges at once from a seeded numpy Generator, so any board can
+be replayed from its seed.
 """
 
-import random
+import numpy as np
 import networkx as nx
+from duckquest.graph.bank import BANK_DIR, load_board_banks
+from duckquest.graph.compact import CompactGraph, UNREACHABLE
+from duckquest.graph.layout import BoardLayout
+from duckquest.graph.solvers import SOLVERS, make_solver
+from duckquest.graph.topology import BoardTopology, shared_topology
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -31,194 +53,286 @@ WEIGHTS_MAP = {
     11: [1, 5, 3, 4, 2],
 }
 
+# Lookup table from weight to color, indexed by weight
+COLOR_TABLE = np.empty(max(COLORS) + 1, dtype=object)
+COLOR_TABLE[list(COLORS)] = list(COLORS.values())
+
+
+def new_seed() -> int:
+    """Return a fresh 64-bit seed from OS entropy."""
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
+
+
+def sample_weights(
+    rng: np.random.Generator, difficulty: int, num_edges: int, boards: int = None
+) -> np.ndarray:
+    """Draw edge weights for one board, or for *boards* boards at once.
+
+    Returns a uint8 array of shape (num_edges,), or (boards, num_edges) when *boards* is set.
+    """
+    available_weights = np.asarray(WEIGHTS_MAP[difficulty], dtype=np.uint8)
+    shape = num_edges if boards is None else (boards, num_edges)
+    return available_weights[rng.integers(len(available_weights), size=shape)]
+
 
 class GraphManager:
     """A general-purpose graph manager with weighted edges and predefined node positions."""
 
-    def __init__(self):
-        logger.info("Initializing GraphManager")
-        self.graph = nx.Graph()
-        self.nodes = self._initialize_nodes()
-        self.edges = self._initialize_edges()
-        self.node_positions = self._initialize_node_positions()
-
-        # Add nodes and edges to the graph
-        self.graph.add_nodes_from(self.nodes)
-        self.graph.add_edges_from(self.edges)
-        logger.debug(
-            f"Added {len(self.nodes)} nodes and {len(self.edges)} edges to graph"
+    def __init__(
+        self,
+        backend: str = "networkx",
+        solver: str = "dijkstra",
+        layout: BoardLayout = None,
+        topology: BoardTopology = None,
+    ):
+        logger.info("Initializing GraphManager (backend=%s)", backend)
+        if backend not in ("networkx", "compact"):
+            raise ValueError(f"Unknown graph backend '{backend}'.")
+        self.backend = backend
+        self.solver = None  # Name of the shortest path solver, set below
+        self._solver = None  # Solver built for the current weights
+        # Static board, shared with every other GraphManager on the same topology
+        if topology is None:
+            topology = shared_topology() if layout is None else BoardTopology(layout)
+        self.topology = topology
+        self.nodes = topology.nodes
+        self.edges = topology.edges
+        self.node_positions = topology.positions
+        self.start_node = topology.start
+        self.end_node = topology.end
+        self.topology_hash = topology.hash
+
+        # Per-session state
+        self.board_banks = {}  # difficulty -> BoardBank of pre-generated boards
+        self._path_tables = {}  # target -> (distances, next hop towards the target)
+        self._known_paths = {}  # (start, end) -> (cost, path) supplied with the weights
+        self.weights = np.zeros(len(self.edges), dtype=np.uint8)  # In self.edges order
+        self.seed = None  # Seed of the current board, if it was drawn randomly
+
+        if backend == "compact":
+            self.core = topology.session_core()
+            self._graph = None  # Built on first access
+        else:
+            self.core = None
+            # The networkx graph carries the weights, so each session has its own one
+            self._graph = nx.Graph()
+            self._graph.add_nodes_from(self.nodes)
+            self._graph.add_edges_from(self.edges)
+        self.set_solver(solver)
+
+    @property
+    def graph(self) -> nx.Graph:
+        """Return the networkx graph, building it from the compact core if needed."""
+        if self._graph is None:
+            self._graph = self.core.to_networkx(COLORS)
+        return self._graph
+
+    def assign_weights_and_colors(self, difficulty=6, seed: int = None) -> None:
+        """Assign weights and colors based on difficulty level.
+
+        Passing the *seed* of a previous board replays that board exactly.
+        """
+        self.seed = new_seed() if seed is None else seed
+        logger.info(
+            "Assigning edge weights and colors (difficulty=%s, seed=%s)",
+            difficulty,
+            self.seed,
         )
+        rng = np.random.default_rng(self.seed)
+        self.apply_weights(sample_weights(rng, difficulty, len(self.edges)), self.seed)
 
-    def _initialize_nodes(self) -> list[str]:
-        """Create the list of graph nodes."""
-        return [
-            f"{letter}{number}"
-            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            for number in (1, 2)
-            if not (letter > "R" and number == 2)
-        ]
-
-    def _initialize_edges(self) -> list[tuple[str, str]]:
-        """Define the edges of the graph."""
-        return [
-            ("A1", "B1"),
-            ("A1", "C1"),
-            ("A1", "D1"),
-            ("B1", "C1"),
-            ("B1", "D1"),
-            ("B1", "E1"),
-            ("B1", "F1"),
-            ("C1", "E1"),
-            ("C1", "H1"),
-            ("D1", "G1"),
-            ("E1", "F1"),
-            ("E1", "K1"),
-            ("F1", "L1"),
-            ("F1", "M1"),
-            ("G1", "M1"),
-            ("H1", "I1"),
-            ("I1", "J1"),
-            ("I1", "Q1"),
-            ("J1", "K1"),
-            ("J1", "P1"),
-            ("K1", "L1"),
-            ("K1", "O1"),
-            ("L1", "N1"),
-            ("M1", "V1"),
-            ("N1", "U1"),
-            ("N1", "W1"),
-            ("O1", "P1"),
-            ("O1", "T1"),
-            ("P1", "R1"),
-            ("P1", "S1"),
-            ("Q1", "R1"),
-            ("R1", "Z1"),
-            ("S1", "T1"),
-            ("S1", "Z1"),
-            ("T1", "U1"),
-            ("T1", "Y1"),
-            ("U1", "X1"),
-            ("V1", "W1"),
-            ("W1", "D2"),
-            ("X1", "Y1"),
-            ("X1", "B2"),
-            ("Y1", "A2"),
-            ("Z1", "A2"),
-            ("Z1", "H2"),
-            ("A2", "F2"),
-            ("A2", "G2"),
-            ("B2", "C2"),
-            ("B2", "E2"),
-            ("C2", "D2"),
-            ("C2", "L2"),
-            ("E2", "F2"),
-            ("E2", "K2"),
-            ("F2", "J2"),
-            ("G2", "H2"),
-            ("G2", "J2"),
-            ("H2", "I2"),
-            ("I2", "J2"),
-            ("I2", "P2"),
-            ("J2", "O2"),
-            ("K2", "L2"),
-            ("K2", "M2"),
-            ("K2", "O2"),
-            ("L2", "R2"),
-            ("M2", "N2"),
-            ("M2", "R2"),
-            ("N2", "O2"),
-            ("N2", "Q2"),
-            ("O2", "P2"),
-            ("O2", "Q2"),
-            ("P2", "Q2"),
-        ]
-
-    def _initialize_node_positions(self) -> dict[str, tuple[float, float]]:
-        """Define predefined node positions for visualization."""
-        return {
-            "A1": (0, 2.5),
-            "B1": (0.8, 2.5),
-            "C1": (1.5, 3.5),
-            "D1": (1, 1.5),
-            "E1": (2, 2.5),
-            "F1": (2.3, 1.5),
-            "G1": (1.5, 0.5),
-            "H1": (1.7, 4.6),
-            "I1": (2.3, 4.5),
-            "J1": (3, 3.8),
-            "K1": (2.9, 2.6),
-            "L1": (3.3, 1.2),
-            "M1": (2.5, 0.6),
-            "N1": (4, 1),
-            "O1": (4, 3.2),
-            "P1": (3.9, 4.1),
-            "Q1": (3.3, 5),
-            "R1": (4.5, 4.8),
-            "S1": (5.3, 4.1),
-            "T1": (4.7, 2.5),
-            "U1": (4.7, 1.6),
-            "V1": (3.8, 0),
-            "W1": (4.8, 0.3),
-            "X1": (5.5, 2),
-            "Y1": (5.5, 3),
-            "Z1": (6, 4.7),
-            "A2": (6.2, 3),
-            "B2": (6.1, 1.5),
-            "C2": (6.1, 0.7),
-            "D2": (5.7, 0),
-            "E2": (7, 2),
-            "F2": (7, 2.7),
-            "G2": (7.3, 4),
-            "H2": (7.5, 4.8),
-            "I2": (8.5, 4.3),
-            "J2": (7.6, 3),
-            "K2": (7.5, 1.5),
-            "L2": (7.1, 0.1),
-            "M2": (8, 1),
-            "N2": (8.5, 1.3),
-            "O2": (8.5, 2.5),
-            "P2": (8.5, 3.2),
-            "Q2": (10, 2.5),
-            "R2": (8, 0.5),
-        }
-
-    def assign_weights_and_colors(self, difficulty=6) -> None:
-        """Assign weights and colors based on difficulty level."""
-        logger.info(f"Assigning edge weights and colors (difficulty={difficulty})")
-        available_weights = WEIGHTS_MAP[difficulty]
-        for edge in self.graph.edges():
-            weight = random.choice(available_weights)
-            self.graph[edge[0]][edge[1]]["weight"] = weight
-            self.graph[edge[0]][edge[1]]["color"] = COLORS[weight]
+    def apply_weights(
+        self,
+        weights,
+        seed: int = None,
+        optimal_path: tuple[int, list[str]] = None,
+    ) -> None:
+        """Write a full weight vector (in self.edges order) and its colors in bulk.
+
+        *optimal_path* is an already known (cost, path) pair, such as the one stored with a
+        bank board; queries between its two ends are then answered without a search.
+        """
+        # Copied: bank boards are views into a mapping that is closed with the bank
+        weights = np.array(weights, dtype=np.uint8)
+        if weights.shape != (len(self.edges),):
+            raise ValueError(
+                f"Expected {len(self.edges)} weights, got {weights.shape}."
+            )
+        self.weights = weights
+        self.seed = seed
+        if self.core is not None:
+            self.core.set_weights(weights)
+            self._graph = None  # Rebuilt with the new weights when next needed
+        else:
+            colors = COLOR_TABLE[weights]
+            nx.set_edge_attributes(
+                self.graph,
+                {
+                    edge: {"weight": weight, "color": color}
+                    for edge, weight, color in zip(self.edges, weights.tolist(), colors)
+                },
+            )
+        self._path_tables.clear()
+        self._known_paths.clear()
+        self._solver = None
+        if optimal_path is not None:
+            cost, path = optimal_path
+            self._known_paths[(path[0], path[-1])] = (cost, list(path))
         logger.debug("All edge weights and colors assigned")
 
+    def set_solver(self, name: str) -> None:
+        """Choose the shortest path solver used for the following queries."""
+        if name not in SOLVERS:
+            raise ValueError(f"Unknown shortest path solver '{name}'.")
+        if self.core is None and name != "dijkstra":
+            raise ValueError(f"Solver '{name}' needs the compact backend.")
+        self.solver = name
+        self._solver = None
+        self._path_tables.clear()
+        logger.debug("Shortest path solver set to '%s'", name)
+
+    def get_solver(self):
+        """Return the solver for the current weights, building it on first use."""
+        if self._solver is None:
+            positions = [self.node_positions[node] for node in self.core.nodes]
+            self._solver = make_solver(self.solver, self.core, positions)
+        return self._solver
+
+    def _search(self, start: str, end: str) -> tuple[int, list[str]] | None:
+        """Answer a point query with a solver that has no path tables, and remember it."""
+        result = self.get_solver().search(
+            self.core.node_id(start), self.core.node_id(end)
+        )
+        if result is not None:
+            cost, ids = result
+            result = (cost, [self.core.nodes[i] for i in ids])
+            self._known_paths[(start, end)] = result
+        return result
+
+    def load_board_banks(self, directory: str = BANK_DIR) -> None:
+        """Map the pre-generated board banks that match this graph, replacing any others."""
+        self.close_board_banks()
+        self.board_banks = load_board_banks(self.topology_hash, directory)
+
+    def close_board_banks(self) -> None:
+        """Unmap the board banks."""
+        for bank in self.board_banks.values():
+            bank.close()
+        self.board_banks = {}
+
+    def path_table(self, target: str) -> tuple[dict[str, int], dict[str, str]]:
+        """Return the optimal cost to *target* and the next hop towards it for every node.
+
+        The table is computed with one Dijkstra run from *target* (the graph is undirected)
+        and cached until the weights are reassigned.
+        """
+        table = self._path_tables.get(target)
+        if table is None:
+            logger.debug("Computing shortest path table towards %s", target)
+            if self.core is not None:
+                table = self._compact_path_table(target)
+            else:
+                predecessors, distances = nx.dijkstra_predecessor_and_distance(
+                    self.graph, target, weight="weight"
+                )
+                next_hops = {
+                    node: pred[0] for node, pred in predecessors.items() if pred
+                }
+                table = (distances, next_hops)
+            self._path_tables[target] = table
+        return table
+
+    def _compact_path_table(self, target: str) -> tuple[dict, dict]:
+        """Build the path table towards *target* from the compact core."""
+        source = self.core.node_id(target)
+        solver = self.get_solver()
+        if not solver.single_source:
+            solver = make_solver("dijkstra", self.core)
+        distances, next_hops = solver.table(source)
+        nodes = self.core.nodes
+        reachable = [i for i, d in enumerate(distances.tolist()) if d != UNREACHABLE]
+        return (
+            {nodes[i]: int(distances[i]) for i in reachable},
+            {nodes[i]: nodes[next_hops[i]] for i in reachable if i != source},
+        )
+
+    def has_node(self, node: str) -> bool:
+        """Return True if the node exists in the graph."""
+        if self.core is not None:
+            return node in self.core.index
+        return node in self.graph
+
+    def has_edge(self, node1: str, node2: str) -> bool:
+        """Return True if an edge connects the two nodes."""
+        if self.core is not None:
+            return self.core.has_edge(node1, node2)
+        return self.graph.has_edge(node1, node2)
+
     def shortest_path(self, start: str, end: str) -> list[str] | None:
         """Return the shortest path between two nodes."""
-        logger.debug(f"Computing shortest path from {start} to {end}")
-        try:
-            path = nx.shortest_path(
-                self.graph, source=start, target=end, weight="weight"
-            )
-            logger.info(f"Shortest path found from {start} to {end}: {path}")
-            return path
-        except nx.NetworkXNoPath:
-            logger.warning(f"No path between {start} and {end}")
+        logger.debug("Looking up shortest path from %s to %s", start, end)
+        if not (self.has_node(start) and self.has_node(end)):
+            logger.warning("Unknown node in shortest path query: %s -> %s", start, end)
+            return None
+        if (start, end) in self._known_paths:
+            return list(self._known_paths[(start, end)][1])
+        if self.core is not None and not SOLVERS[self.solver].single_source:
+            result = self._search(start, end)
+            if result is None:
+                logger.warning("No path between %s and %s", start, end)
+                return None
+            return list(result[1])
+        distances, next_hops = self.path_table(end)
+        if start not in distances:
+            logger.warning("No path between %s and %s", start, end)
+            return None
+        path = [start]
+        while path[-1] != end:
+            path.append(next_hops[path[-1]])
+        logger.info("Shortest path found from %s to %s: %s", start, end, path)
+        return path
+
+    def shortest_path_cost(self, start: str, end: str) -> int | None:
+        """Return the total weight of the shortest path between two nodes."""
+        if not (self.has_node(start) and self.has_node(end)):
+            logger.warning("Unknown node in shortest path query: %s -> %s", start, end)
             return None
+        if (start, end) in self._known_paths:
+            return self._known_paths[(start, end)][0]
+        if self.core is not None and not SOLVERS[self.solver].single_source:
+            result = self._search(start, end)
+            if result is None:
+                logger.warning("No path between %s and %s", start, end)
+            return None if result is None else result[0]
+        cost = self.path_table(end)[0].get(start)
+        if cost is None:
+            logger.warning("No path between %s and %s", start, end)
+        return cost
 
     def edge_weight(self, node1: str, node2: str) -> int | None:
         """Return the weight of the edge between two nodes."""
-        if not self.graph.has_edge(node1, node2):
-            logger.warning(f"Edge not found between {node1} and {node2}")
+        if self.core is not None:
+            edge = self.core.edge_id(node1, node2)
+            found = edge is not None
+            weight = (int(self.core.weights[edge]) or None) if found else None
+        else:
+            data = self.graph.get_edge_data(node1, node2)
+            found = data is not None
+            weight = data.get("weight") if found else None
+        if not found:
+            logger.warning("Edge not found between %s and %s", node1, node2)
             return None
-        weight = self.graph[node1][node2].get("weight")
-        logger.debug(f"Edge weight between {node1} and {node2}: {weight}")
+        logger.debug("Edge weight between %s and %s: %s", node1, node2, weight)
         return weight
 
     def neighbors(self, node: str) -> list[str]:
         """Return the neighbors of a node."""
-        if node not in self.graph:
-            logger.error(f"Node '{node}' does not exist in the graph.")
+        if not self.has_node(node):
+            logger.error("Node '%s' does not exist in the graph.", node)
             raise ValueError(f"Node '{node}' does not exist in the graph.")
-        neighbors = list(self.graph.neighbors(node))
-        logger.debug(f"Neighbors of {node}: {neighbors}")
+        if self.core is not None:
+            neighbors = self.core.neighbors(node)
+        else:
+            neighbors = list(self.graph.neighbors(node))
+        logger.debug("Neighbors of %s: %s", node, neighbors)
         return neighbors
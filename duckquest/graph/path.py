@@ -0,0 +1,87 @@
+"""Indexed model of the path selected by the player.
+
+Nodes are kept in an insertion-ordered dict and edges under a frozenset key, so selecting,
+deselecting and membership tests cost the same whatever the length of the path. The
+total weight of the selected edges is kept up to date on every change.
+"""
+
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def edge_key(node1: str, node2: str) -> frozenset:
+    """Return the direction-free key of an edge."""
+    return frozenset((node1, node2))
+
+
+class UserPath:
+    """Ordered nodes and edges of the player's path, with its running cost."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = {}  # Node -> None, in selection order
+        self.edges = {}  # Edge key -> (node1, node2) as selected, in selection order
+        self.weights = {}  # Edge key -> weight when the edge was selected
+        self.incident = {}  # Node -> keys of the selected edges touching it
+        self.cost = 0
+
+    @classmethod
+    def from_nodes(cls, graph, nodes) -> "UserPath":
+        """Build a path by selecting *nodes* in order."""
+        path = cls(graph)
+        for node in nodes:
+            path.add(node)
+        return path
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    @property
+    def last(self) -> str | None:
+        """Return the last selected node, or None for an empty path."""
+        return next(reversed(self.nodes), None)
+
+    def has_edge(self, node1: str, node2: str) -> bool:
+        """Return True if the edge, in either direction, is part of the path."""
+        return edge_key(node1, node2) in self.edges
+
+    def add(self, node: str) -> None:
+        """Append a node, and the edge from the previous node if there is one."""
+        last = self.last
+        self.nodes[node] = None
+        if last is None or last == node or not self.graph.has_edge(last, node):
+            return
+        key = edge_key(last, node)
+        weight = self.graph.edge_weight(last, node)
+        self.edges[key] = (last, node)
+        self.weights[key] = weight
+        self.incident.setdefault(last, []).append(key)
+        self.incident.setdefault(node, []).append(key)
+        self.cost += weight
+        logger.debug(
+            "Edge added to path: (%s, %s) (path cost %s)", last, node, self.cost
+        )
+
+    def remove(self, node: str) -> None:
+        """Remove a node and every selected edge touching it."""
+        del self.nodes[node]
+        for key in self.incident.pop(node, ()):
+            del self.edges[key]
+            self.cost -= self.weights.pop(key)
+            (other,) = key - {node}
+            self.incident[other].remove(key)
+
+    def clear(self) -> None:
+        """Remove every node and edge."""
+        self.nodes.clear()
+        self.edges.clear()
+        self.weights.clear()
+        self.incident.clear()
+        self.cost = 0
@@ -0,0 +1,330 @@
+"""Binary session recordings: every game action, written as it happens and replayable.
+
+When the game is started with --record, GameManager appends one record per action to a
+session file under logs/sessions/. Records are small fixed-layout structs written through a
+buffered file, so recording costs a pack and a memory copy per press; the buffer is flushed
+after each path check and when the game quits. Only the MAX_SESSIONS latest files are kept.
+
+File layout (little-endian):
+
+- a 32-byte header: magic, format version, wall clock time of the session start and the
+  topology hash of the board the node ids refer to;
+- one record per event: the event kind (uint8) and the time since the session start in
+  microseconds (uint64), then a payload whose layout depends on the kind (see PAYLOADS).
+  BOARD payloads are followed by the edge weights (uint8, in GraphManager.edges order).
+
+A replay feeds the events into a headless GraphLogic at full speed and compares the recorded
+selections and scores with the ones it computes.
+"""
+
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, NamedTuple
+import numpy as np
+from duckquest.graph.layout import BoardLayout
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.utils.logger import LOG_DIR, setup_logger
+
+logger = setup_logger(__name__)
+
+SESSION_DIR = os.path.join(LOG_DIR, "sessions")
+MAX_SESSIONS = 100  # Older session files are deleted when a new session starts
+SESSION_MAGIC = b"DQEV"
+SESSION_VERSION = 1
+# magic, version, start time (seconds since the epoch), topology hash
+HEADER = struct.Struct("<4sH2xd16s")
+RECORD = struct.Struct("<BQ")  # kind, microseconds since the session start
+
+# Event kinds
+BOARD = 1
+PRESS = 2
+SELECT = 3
+NEXT = 4
+PREVIOUS = 5
+CLICK = 6
+RESET = 7
+RESTART = 8
+CHECK = 9
+SHOW_PATH = 10
+QUIT = 11
+
+EVENT_NAMES = {
+    BOARD: "board",
+    PRESS: "press",
+    SELECT: "select",
+    NEXT: "next",
+    PREVIOUS: "previous",
+    CLICK: "click",
+    RESET: "reset",
+    RESTART: "restart",
+    CHECK: "check",
+    SHOW_PATH: "show_path",
+    QUIT: "quit",
+}
+
+NO_SEED = 2**64 - 1  # Seed of a board taken from a bank
+
+PAYLOADS = {
+    BOARD: struct.Struct("<BQH"),  # difficulty, seed, edge count; weights follow
+    PRESS: struct.Struct("<B"),  # GPIO pin
+    SELECT: struct.Struct("<H"),  # Node id that became the current node
+    NEXT: struct.Struct(""),
+    PREVIOUS: struct.Struct(""),
+    CLICK: struct.Struct("<H"),  # Node id
+    RESET: struct.Struct(""),
+    RESTART: struct.Struct(""),
+    CHECK: struct.Struct("<BIH"),  # score, path cost, path length in nodes
+    SHOW_PATH: struct.Struct(""),
+    QUIT: struct.Struct(""),
+}
+
+
+class Event(NamedTuple):
+    """One recorded event."""
+
+    kind: int
+    time_us: int
+    values: tuple
+    weights: np.ndarray = None  # BOARD events only
+
+    @property
+    def name(self) -> str:
+        return EVENT_NAMES[self.kind]
+
+
+def session_path(directory: str = SESSION_DIR) -> str:
+    """Return a new session file name, from the current local time."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(directory, f"session_{stamp}_{os.getpid()}.dqev")
+
+
+def prune_sessions(directory: str = SESSION_DIR, keep: int = MAX_SESSIONS) -> list[str]:
+    """Delete all but the *keep* most recent session files; return the deleted paths."""
+    if not os.path.isdir(directory):
+        return []
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(".dqev")
+    ]
+    paths.sort(key=os.path.getmtime)
+    stale = paths[: max(0, len(paths) - keep)]
+    for path in stale:
+        os.remove(path)
+    if stale:
+        logger.info("Deleted %s old session recordings from %s", len(stale), directory)
+    return stale
+
+
+class SessionRecorder:
+    """Append the events of one game session to a binary file."""
+
+    def __init__(self, path: str, graph: GraphManager):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.node_ids = {node: i for i, node in enumerate(graph.nodes)}
+        self._start = time.monotonic_ns()
+        self._file = open(path, "ab")
+        self._file.write(
+            HEADER.pack(
+                SESSION_MAGIC, SESSION_VERSION, time.time(), graph.topology_hash
+            )
+        )
+        logger.info(f"Recording session to {path}")
+
+    def write(self, kind: int, *values) -> None:
+        """Append one event with its payload values."""
+        elapsed_us = (time.monotonic_ns() - self._start) // 1000
+        self._file.write(RECORD.pack(kind, elapsed_us) + PAYLOADS[kind].pack(*values))
+
+    def board(self, difficulty: int, graph: GraphManager) -> None:
+        """Record the board now loaded in *graph*."""
+        seed = NO_SEED if graph.seed is None else graph.seed
+        self.write(BOARD, difficulty, seed, len(graph.weights))
+        self._file.write(graph.weights.tobytes())
+
+    def node(self, kind: int, node: str) -> None:
+        """Record an event whose payload is a node."""
+        self.write(kind, self.node_ids[node])
+
+    def flush(self) -> None:
+        """Push the buffered events to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the session file."""
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"Session recording closed: {self.path}")
+
+
+@dataclass
+class Session:
+    """A session file read back: its header and events."""
+
+    path: str
+    started: float  # Seconds since the epoch
+    topology_hash: bytes
+    events: list[Event]
+    truncated: bool = False  # The last record was cut short, e.g. by a power loss
+
+
+def read_session(path: str) -> Session:
+    """Read every event of a session file."""
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"Truncated session header in {path}.")
+    magic, version, started, digest = HEADER.unpack_from(data)
+    if magic != SESSION_MAGIC or version != SESSION_VERSION:
+        raise ValueError(f"{path} is not a version {SESSION_VERSION} session.")
+
+    session = Session(path, started, digest, [])
+    offset = HEADER.size
+    while offset < len(data):
+        if offset + RECORD.size > len(data):
+            session.truncated = True
+            break
+        kind, time_us = RECORD.unpack_from(data, offset)
+        payload = PAYLOADS.get(kind)
+        if payload is None:
+            raise ValueError(f"Unknown event kind {kind} at byte {offset} of {path}.")
+        end = offset + RECORD.size + payload.size
+        if end > len(data):
+            session.truncated = True
+            break
+        values = payload.unpack_from(data, offset + RECORD.size)
+        weights = None
+        if kind == BOARD:
+            if end + values[2] > len(data):
+                session.truncated = True
+                break
+            weights = np.frombuffer(data, dtype=np.uint8, count=values[2], offset=end)
+            end += values[2]
+        session.events.append(Event(kind, time_us, values, weights))
+        offset = end
+    if session.truncated:
+        logger.warning(f"{path} ends with a truncated record")
+    return session
+
+
+class ReplayLogic(GraphLogic):
+    """GraphLogic whose new boards are the recorded ones instead of random draws."""
+
+    def __init__(self, game_manager, boards: Iterator[Event]):
+        self.boards = boards
+        super().__init__(game_manager)
+
+    def new_board(self):
+        board = next(self.boards, None)
+        if board is None:
+            raise ValueError("The session restarts more often than it records boards.")
+        difficulty, seed, _ = board.values
+        self.game_manager.difficulty = difficulty
+        self.graph.apply_weights(board.weights, None if seed == NO_SEED else seed)
+        self.optimal_cost = self.graph.shortest_path_cost(
+            self.start_node, self.end_node
+        )
+
+
+class ReplayGame:
+    """Headless stand-in for GameManager that plays back a recorded session."""
+
+    def __init__(
+        self,
+        session: Session,
+        backend: str = "compact",
+        layout: BoardLayout = None,
+    ):
+        self.session = session
+        self.difficulty = 6
+        self.graph = GraphManager(backend=backend, layout=layout)
+        if self.graph.topology_hash != session.topology_hash:
+            raise ValueError(f"{session.path} was recorded on a different board.")
+        self.logic = ReplayLogic(
+            self, iter([event for event in session.events if event.kind == BOARD])
+        )
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of a replay: what was played, how fast, and where it diverged."""
+
+    events: int = 0
+    games: int = 0
+    scores: list[int] = field(default_factory=list)
+    mismatches: list[str] = field(default_factory=list)
+    latencies_ns: dict = field(default_factory=dict)  # Event name -> call durations
+    duration_s: float = 0.0
+
+    def log(self, path: str):
+        """Write the report to the log."""
+        rate = self.events / self.duration_s if self.duration_s else 0
+        logger.info(
+            f"{path}: {self.events} events, {self.games} checks replayed in "
+            f"{self.duration_s * 1000:.1f} ms ({rate:,.0f} events/s)"
+        )
+        if self.scores:
+            logger.info(f"Scores: {' '.join(str(score) for score in self.scores)}")
+        for name, values in sorted(self.latencies_ns.items()):
+            p50, p95, p99 = np.percentile(values, (50, 95, 99)) / 1000
+            logger.info(
+                f"{name:<9} p50 {p50:8.1f} us | p95 {p95:8.1f} us | p99 {p99:8.1f} us"
+            )
+        for mismatch in self.mismatches:
+            logger.error(f"Replay diverged at {mismatch}")
+
+
+def replay_session(
+    session: Session, backend: str = "compact", layout: BoardLayout = None
+) -> ReplayReport:
+    """Play a recorded session against GraphLogic and check that it ends the same way."""
+    game = ReplayGame(session, backend, layout)
+    logic, graph = game.logic, game.graph
+    nodes = graph.nodes
+    report = ReplayReport()
+
+    actions = {
+        NEXT: lambda event: logic.next_node(),
+        PREVIOUS: lambda event: logic.previous_node(),
+        SELECT: lambda event: logic.change_current_node(),
+        CLICK: lambda event: logic.handle_node_click(nodes[event.values[0]]),
+        RESET: lambda event: logic.reset_selection(),
+        RESTART: lambda event: logic.restart_game(),
+        CHECK: lambda event: logic.check_shortest_path(),
+        SHOW_PATH: lambda event: graph.shortest_path(logic.start_node, logic.end_node),
+    }
+    started = time.perf_counter()
+    for event in session.events:
+        report.events += 1
+        action = actions.get(event.kind)
+        if action is None:
+            continue  # Boards are loaded by restarts; presses and quit change nothing
+        start = time.perf_counter_ns()
+        result = action(event)
+        report.latencies_ns.setdefault(event.name, []).append(
+            time.perf_counter_ns() - start
+        )
+
+        if event.kind == SELECT and nodes[event.values[0]] != logic.current_node:
+            report.mismatches.append(
+                f"{event.time_us / 1e6:.3f} s: selected {logic.current_node}, "
+                f"recorded {nodes[event.values[0]]}"
+            )
+        elif event.kind == CHECK:
+            score = result[1]
+            report.games += 1
+            report.scores.append(score)
+            if (score, logic.path.cost, len(logic.path)) != event.values:
+                report.mismatches.append(
+                    f"{event.time_us / 1e6:.3f} s: check scored {score} "
+                    f"(cost {logic.path.cost}), recorded {event.values[0]} "
+                    f"(cost {event.values[1]})"
+                )
+        elif event.kind == SHOW_PATH:
+            logic.shortest_path_displayed = not logic.shortest_path_displayed
+    report.duration_s = time.perf_counter() - started
+    return report
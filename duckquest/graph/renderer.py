@@ -1,11 +1,23 @@
 """Graph rendering logic using matplotlib.
 
 Handles visual display of the graph, selected paths, shortest paths, and weight-color legends for educational feedback.
+
+The graph artists (nodes, edges and labels) are built once per graph and kept as animated
+artists. Later updates only recolor the nodes and edges that changed and blit the region
+they cover on top of a cached background, instead of clearing and redrawing the whole figure.
+An overlay (the help screen) can hide the graph; coming back from it copies the cached
+background to the canvas instead of redrawing the figure.
 """
 
+import math
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba_array
+from matplotlib.transforms import Bbox
+from duckquest.graph.spatial import SpatialGrid
 from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import timed, timings
 
 logger = setup_logger(__name__)
 
@@ -17,6 +29,10 @@ COLORS = {
     5: (1, 0, 0),  # Bright Red
 }
 
+NODE_SIZE = 500  # Marker area in points^2
+EDGE_WIDTH = 5  # Line width in points
+FONT_SIZE = 8
+
 
 class GraphRenderer:
     """Responsible for rendering the graph and highlighting user interaction."""
@@ -29,16 +45,73 @@ class GraphRenderer:
         self.ax = None
         self.canvas = None
 
-    def init_ui(self, ax, canvas):
-        """Initialize the Matplotlib axis and canvas for rendering."""
+        # Retained artists, rebuilt only when the axis is cleared or the graph changes
+        self.node_artist = None  # PathCollection
+        self.edge_artist = None  # LineCollection
+        self.label_artists = {}
+        self._nodes = []
+        self._edges = []
+        self._node_xy = None
+        self._edge_xy = None
+        self._node_rgba = None
+        self._edge_rgba = None
+        self._background = None
+        self._background_size = None
+        self.overlay = None  # Page that can cover the graph, such as the help screen
+
+        # Hit-testing grid in display pixels, rebuilt when the layout or the view changes
+        self._hit_grid = None
+        self._hit_nodes = []
+        self._hit_key = None
+
+    def init_ui(self, ax, canvas, overlay=None):
+        """Initialize the Matplotlib axis and canvas for rendering.
+
+        *overlay* is an object with `visible` and `hide()` that can be shown over the graph.
+        """
         self.ax = ax
         self.canvas = canvas
+        self.overlay = overlay
+        # Every full redraw (first display, resize, help screen) refreshes the background
+        self.canvas.mpl_connect("draw_event", self._on_draw)
         logger.debug("UI initialized with axis and canvas")
 
+    def invalidate(self):
+        """Drop the retained artists so the next display rebuilds the whole graph."""
+        logger.debug("Renderer artists invalidated")
+        self.node_artist = None
+        self.edge_artist = None
+        self.label_artists = {}
+        self._background = None
+        self._hit_grid = None
+
+    def node_at(self, x: float, y: float) -> str | None:
+        """Return the node drawn under a display-pixel position, or None."""
+        if self.ax is None:
+            return None
+        positions = self.graph.node_positions
+        # Two reference points pin down the (linear) data-to-pixel transform
+        key = (
+            id(positions),
+            len(positions),
+            self.ax.transData.transform([(0, 0), (1, 1)]).tobytes(),
+            self.canvas.figure.dpi,
+        )
+        if self._hit_grid is None or key != self._hit_key:
+            self._hit_nodes = list(positions)
+            xy = np.array(list(positions.values()), dtype=float).reshape(-1, 2)
+            self._hit_grid = SpatialGrid(
+                self.ax.transData.transform(xy), self._node_radius()
+            )
+            self._hit_key = key
+            logger.debug("Hit-testing grid rebuilt for the current layout")
+        index = self._hit_grid.nearest(x, y)
+        return None if index is None else self._hit_nodes[index]
+
+    @timed("render.display_graph")
     def display_graph(self, edge_colors: list = None, node_colors: dict = None):
         """Display the graph in the main window with a legend for edge weights and colors"""
-        logger.debug("Rendering full graph")
-        self.ax.clear()
+        logger.debug("Rendering graph")
         # Determine edge colors if not provided
         if edge_colors is None:
             edge_colors = [
@@ -54,23 +127,18 @@ class GraphRenderer:
         node_colors_list = [
             node_colors.get(node, "lightblue") for node in self.graph.graph.nodes()
         ]
-        # Draw the graph
-        nx.draw(
-            self.graph.graph,
-            pos=self.graph.node_positions,
-            ax=self.ax,
-            with_labels=True,
-            node_size=500,
-            node_color=node_colors_list,
-            font_size=8,
-            font_color="black",
-            edge_color=edge_colors,
-            width=5,
-        )
+        edge_rgba = to_rgba_array(edge_colors)
+        node_rgba = to_rgba_array(node_colors_list)
 
-        self.display_legend(self.ax)
-        self.canvas.draw()
-        logger.info("Graph rendered on canvas")
+        # Any graph update takes the screen back from the overlay
+        uncovered = self.overlay is not None and self.overlay.visible
+        if uncovered:
+            self.overlay.hide()
+
+        if self._artists_valid():
+            self._update_artists(edge_rgba, node_rgba, full=uncovered)
+        else:
+            self._build_artists(edge_rgba, node_rgba)
 
     def display_legend(self, ax):
         """Add a legend for edge weights and colors"""
@@ -94,10 +162,7 @@ class GraphRenderer:
         logger.debug("Displaying user-selected path")
         edge_colors = []
         for edge in self.graph.graph.edges():
-            if (
-                edge in self.logic.user_path_edges
-                or (edge[1], edge[0]) in self.logic.user_path_edges
-            ):
+            if self.logic.path.has_edge(*edge):
                 edge_colors.append("cyan")
             else:
                 edge_colors.append(
@@ -108,22 +173,24 @@ class GraphRenderer:
             node: (
                 "yellow"
                 if node == self.logic.available_nodes[self.logic.selection_index]
-                and node in self.logic.selected_nodes
+                and node in self.logic.path
                 else (
                     "green"
                     if node == self.logic.available_nodes[self.logic.selection_index]
-                    else "cyan" if node in self.logic.selected_nodes else "lightblue"
+                    else "cyan"
+                    if node in self.logic.path
+                    else "lightblue"
                 )
             )
             for node in self.graph.graph.nodes()
         }
 
         self.display_graph(edge_colors, node_colors)
-        logger.info("User path rendered")
+        logger.debug("User path rendered")
 
     def highlight_shortest_path(self, path: list):
         """Highlight the shortest path in purple"""
-        logger.debug(f"Highlighting shortest path: {path}")
+        logger.debug("Highlighting shortest path: %s", path)
         edges_in_path = [(path[i], path[i + 1]) for i in range(len(path) - 1)]
         edge_colors = []
         for edge in self.graph.graph.edges():
@@ -136,3 +203,169 @@ class GraphRenderer:
 
         self.display_graph(edge_colors)
         logger.info("Shortest path highlighted")
+
+    def _artists_valid(self) -> bool:
+        """Return True if the retained artists still match the axis and the graph."""
+        return (
+            self.node_artist is not None
+            and self.node_artist.axes is self.ax
+            and len(self._nodes) == self.graph.graph.number_of_nodes()
+            and len(self._edges) == self.graph.graph.number_of_edges()
+        )
+
+    def _build_artists(self, edge_rgba: np.ndarray, node_rgba: np.ndarray):
+        """Clear the axis and create the node, edge and label artists from scratch."""
+        logger.debug("Building graph artists")
+        self.ax.clear()
+        positions = self.graph.node_positions
+        self._nodes = list(self.graph.graph.nodes())
+        self._edges = list(self.graph.graph.edges())
+        self._node_xy = np.array([positions[node] for node in self._nodes], dtype=float)
+        self._edge_xy = np.array(
+            [(positions[u], positions[v]) for u, v in self._edges], dtype=float
+        ).reshape(-1, 2, 2)
+
+        self.edge_artist = nx.draw_networkx_edges(
+            self.graph.graph,
+            pos=positions,
+            ax=self.ax,
+            edgelist=self._edges,
+            edge_color=edge_rgba,
+            width=EDGE_WIDTH,
+        )
+        self.node_artist = nx.draw_networkx_nodes(
+            self.graph.graph,
+            pos=positions,
+            ax=self.ax,
+            nodelist=self._nodes,
+            node_size=NODE_SIZE,
+            node_color=node_rgba,
+        )
+        self.label_artists = nx.draw_networkx_labels(
+            self.graph.graph,
+            pos=positions,
+            ax=self.ax,
+            font_size=FONT_SIZE,
+            font_color="black",
+        )
+        self.ax.set_axis_off()
+
+        # Animated artists are left out of full redraws and painted over the background
+        for artist in self._animated_artists():
+            artist.set_animated(True)
+
+        self._edge_rgba = edge_rgba
+        self._node_rgba = node_rgba
+        self.display_legend(self.ax)
+        with timings.span("render.canvas_draw"):
+            self.canvas.draw()
+        logger.info("Graph rendered on canvas")
+
+    def _update_artists(
+        self, edge_rgba: np.ndarray, node_rgba: np.ndarray, full: bool = False
+    ):
+        """Recolor only the changed nodes and edges and blit the region they cover.
+
+        With *full*, the whole figure is restored from the background and blitted, for when
+        something else covered the graph.
+        """
+        changed_edges = np.flatnonzero(np.any(edge_rgba != self._edge_rgba, axis=1))
+        changed_nodes = np.flatnonzero(np.any(node_rgba != self._node_rgba, axis=1))
+        if not full and not len(changed_edges) and not len(changed_nodes):
+            logger.debug("Graph unchanged, nothing to redraw")
+            return
+
+        self.edge_artist.set_color(edge_rgba)
+        self.node_artist.set_facecolor(node_rgba)
+        self._edge_rgba = edge_rgba
+        self._node_rgba = node_rgba
+
+        if self._background is None:
+            # No cached background yet (canvas never drawn): fall back to a full redraw
+            with timings.span("render.canvas_draw"):
+                self.canvas.draw()
+            return
+
+        if full:
+            with timings.span("render.blit"):
+                self.canvas.restore_region(self._background)
+                self._draw_animated()
+                self.canvas.blit(self.canvas.figure.bbox)
+            logger.debug("Graph restored from the cached background")
+            return
+
+        dirty = self._dirty_bbox(changed_edges, changed_nodes)
+        with timings.span("render.blit"):
+            self.canvas.restore_region(self._background)
+            self._draw_animated(self._labels_in(dirty))
+            self.canvas.blit(dirty)
+        logger.debug(
+            "Blitted %d edges and %d nodes", len(changed_edges), len(changed_nodes)
+        )
+
+    def _dirty_bbox(self, changed_edges: np.ndarray, changed_nodes: np.ndarray) -> Bbox:
+        """Return the display-space box covering the changed nodes and edges."""
+        transform = self.ax.transData
+        node_radius = self._node_radius()
+        edge_pad = EDGE_WIDTH / 2 * self.canvas.figure.dpi / 72 + 2
+
+        boxes = []
+        if len(changed_nodes):
+            xy = transform.transform(self._node_xy[changed_nodes])
+            boxes.append((xy.min(axis=0) - node_radius, xy.max(axis=0) + node_radius))
+        if len(changed_edges):
+            xy = transform.transform(self._edge_xy[changed_edges].reshape(-1, 2))
+            boxes.append((xy.min(axis=0) - edge_pad, xy.max(axis=0) + edge_pad))
+
+        lower = np.min([low for low, _ in boxes], axis=0)
+        upper = np.max([high for _, high in boxes], axis=0)
+        dirty = Bbox.from_extents(*lower, *upper)
+        return Bbox.intersection(dirty, self.ax.bbox) or dirty
+
+    def _node_radius(self) -> float:
+        """Return the node marker radius in display pixels, with a small margin."""
+        return math.sqrt(NODE_SIZE) / 2 * self.canvas.figure.dpi / 72 + 2
+
+    def _labels_in(self, bbox: Bbox) -> list:
+        """Return the label artists of the nodes overlapping a display-space box."""
+        xy = self.ax.transData.transform(self._node_xy)
+        radius = self._node_radius()
+        inside = (
+            (xy[:, 0] + radius >= bbox.x0)
+            & (xy[:, 0] - radius <= bbox.x1)
+            & (xy[:, 1] + radius >= bbox.y0)
+            & (xy[:, 1] - radius <= bbox.y1)
+        )
+        return [self.label_artists[self._nodes[i]] for i in np.flatnonzero(inside)]
+
+    def _animated_artists(self) -> list:
+        """Return the retained artists in drawing order."""
+        return [self.edge_artist, self.node_artist, *self.label_artists.values()]
+
+    def _draw_animated(self, labels: list = None):
+        """Paint the retained artists onto the canvas buffer.
+
+        Only the given labels are drawn when *labels* is set; text layout is the most
+        expensive part of a redraw, and labels outside the blitted region are not shown.
+        """
+        if labels is None:
+            labels = self.label_artists.values()
+        for artist in (self.edge_artist, self.node_artist, *labels):
+            self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full redraw and repaint the graph on it."""
+        size = tuple(self.canvas.figure.bbox.size)
+        if not self.ax.get_visible():
+            # Covered by an overlay: keep the background unless the canvas was resized
+            if size != self._background_size:
+                self._background = None
+            return
+        if not self._artists_valid():
+            self._background = None
+            return
+        # The whole figure, so that it also repaints what an overlay drew outside the axis
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._background_size = size
+        self._draw_animated()
+        logger.debug("Background cached after full redraw")
@@ -0,0 +1,322 @@
+"""Headless game simulation for load testing and score analysis.
+
+A Simulator plays complete games against GraphLogic without Tk, rendering or hardware,
+driving it through the same calls as the buttons (select, next, previous, reset, check)
+from a scripted or random policy. Episodes are spread over a process pool; the report gives
+throughput, the score distribution and latency percentiles of every GraphLogic call.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import numpy as np
+from duckquest.graph.layout import BoardLayout
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Button actions and the GraphLogic method each one calls
+ACTIONS = {
+    "select": "change_current_node",
+    "next": "next_node",
+    "previous": "previous_node",
+    "reset": "reset_selection",
+    "check": "check_shortest_path",
+}
+
+
+class HeadlessGame:
+    """Stand-in for GameManager with only what GraphLogic needs: a graph and a difficulty."""
+
+    def __init__(
+        self,
+        difficulty: int = 6,
+        backend: str = "compact",
+        seed: int = None,
+        use_banks: bool = False,
+        layout: BoardLayout = None,
+    ):
+        self.difficulty = difficulty
+        self.graph = GraphManager(backend=backend, layout=layout)
+        if use_banks:
+            self.graph.load_board_banks()
+        self.logic = GraphLogic(self, seed=seed)
+
+
+def step_towards(logic: GraphLogic, target: str) -> str:
+    """Return the action that brings the selection to *target*, or selects it."""
+    index = logic.available_nodes.index(target)
+    if index == logic.selection_index:
+        return "select"
+    forward = (index - logic.selection_index) % len(logic.available_nodes)
+    return "next" if forward <= len(logic.available_nodes) - forward else "previous"
+
+
+class Policy(ABC):
+    """Decides the next button press of a simulated player."""
+
+    name = "policy"
+
+    @abstractmethod
+    def choose(self, logic: GraphLogic, rng: np.random.Generator) -> str:
+        """Return one of the ACTIONS keys."""
+
+    def _common(self, logic: GraphLogic) -> str | None:
+        """Select the start after a restart and check the path at the goal."""
+        if not logic.path:
+            return step_towards(logic, logic.current_node)
+        if logic.current_node == logic.end_node:
+            return "check"
+        return None
+
+
+class OptimalPolicy(Policy):
+    """Follows the shortest path to the goal."""
+
+    name = "optimal"
+
+    def choose(self, logic, rng):
+        action = self._common(logic)
+        if action:
+            return action
+        path = logic.graph.shortest_path(logic.current_node, logic.end_node)
+        return step_towards(logic, path[1])
+
+
+class GreedyPolicy(Policy):
+    """Always takes the cheapest edge to a node it has not visited yet."""
+
+    name = "greedy"
+
+    def choose(self, logic, rng):
+        action = self._common(logic)
+        if action:
+            return action
+        options = [node for node in logic.available_nodes[1:] if node not in logic.path]
+        if not options:
+            return "reset"
+        target = min(
+            options, key=lambda node: logic.graph.edge_weight(logic.current_node, node)
+        )
+        return step_towards(logic, target)
+
+
+class RandomPolicy(Policy):
+    """Presses random buttons, checking at the goal and resetting now and then."""
+
+    name = "random"
+
+    def __init__(self, reset_probability: float = 0.01):
+        self.reset_probability = reset_probability
+
+    def choose(self, logic, rng):
+        action = self._common(logic)
+        if action:
+            return action
+        if rng.random() < self.reset_probability:
+            return "reset"
+        return ("select", "next", "previous")[rng.integers(3)]
+
+
+POLICIES = {
+    policy.name: policy for policy in (OptimalPolicy, GreedyPolicy, RandomPolicy)
+}
+
+
+@dataclass
+class EpisodeBatch:
+    """Results of a batch of episodes: one score and step count per game."""
+
+    scores: np.ndarray
+    steps: np.ndarray
+    latencies_ns: dict = field(default_factory=dict)  # Action -> call durations
+
+    @classmethod
+    def merge(cls, batches: list["EpisodeBatch"]) -> "EpisodeBatch":
+        """Concatenate several batches."""
+        actions = {action for batch in batches for action in batch.latencies_ns}
+        return cls(
+            np.concatenate([batch.scores for batch in batches]),
+            np.concatenate([batch.steps for batch in batches]),
+            {
+                action: np.concatenate(
+                    [batch.latencies_ns.get(action, []) for batch in batches]
+                ).astype(np.int64)
+                for action in actions
+            },
+        )
+
+
+def play_episodes(
+    game: HeadlessGame,
+    policy: Policy,
+    episodes: int,
+    rng: np.random.Generator,
+    max_steps: int = 500,
+) -> EpisodeBatch:
+    """Play *episodes* games on a fresh board each and time every GraphLogic call."""
+    logic = game.logic
+    timings = {action: [] for action in (*ACTIONS, "restart")}
+    scores = np.zeros(episodes, dtype=np.int64)
+    steps = np.zeros(episodes, dtype=np.int64)
+
+    for episode in range(episodes):
+        start = time.perf_counter_ns()
+        logic.restart_game()
+        timings["restart"].append(time.perf_counter_ns() - start)
+
+        for step in range(1, max_steps + 1):
+            # Out of moves: the game is checked as it stands
+            action = policy.choose(logic, rng) if step < max_steps else "check"
+            method = getattr(logic, ACTIONS[action])
+            start = time.perf_counter_ns()
+            result = method()
+            timings[action].append(time.perf_counter_ns() - start)
+            if action == "check":
+                scores[episode] = result[1]
+                steps[episode] = step
+                break
+
+    return EpisodeBatch(
+        scores,
+        steps,
+        {
+            action: np.array(values, dtype=np.int64)
+            for action, values in timings.items()
+        },
+    )
+
+
+_worker_game = None  # Per-process game, built once by the pool initializer
+
+
+def _init_worker(
+    difficulty: int, backend: str, use_banks: bool, layout: BoardLayout
+) -> None:
+    """Build the headless game once per worker process, with logging muted."""
+    global _worker_game
+    # Per-call log lines would dominate the measured latencies
+    logging.disable(logging.WARNING)
+    _worker_game = HeadlessGame(difficulty, backend, use_banks=use_banks, layout=layout)
+
+
+def _play_chunk(
+    seed: np.random.SeedSequence, policy_name: str, episodes: int, max_steps: int
+) -> EpisodeBatch:
+    """Play one chunk of episodes in a worker process."""
+    rng = np.random.default_rng(seed)
+    _worker_game.logic.rng = np.random.default_rng(seed.spawn(1)[0])
+    return play_episodes(
+        _worker_game, POLICIES[policy_name](), episodes, rng, max_steps
+    )
+
+
+@dataclass
+class SimulationReport:
+    """Summary of a simulation run."""
+
+    policy: str
+    episodes: int
+    elapsed: float
+    batch: EpisodeBatch
+
+    @property
+    def episodes_per_second(self) -> float:
+        return self.episodes / self.elapsed
+
+    def score_histogram(self, bins: int = 10) -> np.ndarray:
+        """Return the number of games in each score bin from 0 to 100."""
+        return np.histogram(self.batch.scores, bins=bins, range=(0, 100))[0]
+
+    def latency_percentiles(self, percentiles=(50, 95, 99)) -> dict:
+        """Return {action: [percentile values in microseconds]} for every call made."""
+        return {
+            action: np.percentile(values, percentiles) / 1000
+            for action, values in sorted(self.batch.latencies_ns.items())
+            if len(values)
+        }
+
+    def log(self):
+        """Write the report to the log."""
+        scores = self.batch.scores
+        logger.info(
+            "%s '%s' games in %.2fs (%.0f games/s)",
+            self.episodes,
+            self.policy,
+            self.elapsed,
+            self.episodes_per_second,
+        )
+        logger.info(
+            "Score mean %.1f | median %.0f | optimal %.1f%% | steps mean %.1f",
+            scores.mean(),
+            np.median(scores),
+            100 * np.mean(scores == 100),
+            self.batch.steps.mean(),
+        )
+        histogram = " ".join(str(count) for count in self.score_histogram())
+        logger.info("Score histogram (0-100, 10 bins): %s", histogram)
+        for action, (p50, p95, p99) in self.latency_percentiles().items():
+            logger.info(
+                "%-9s p50 %8.1f us | p95 %8.1f us | p99 %8.1f us", action, p50, p95, p99
+            )
+
+
+class Simulator:
+    """Run many headless games in parallel."""
+
+    def __init__(
+        self,
+        difficulty: int = 6,
+        backend: str = "compact",
+        use_banks: bool = False,
+        workers: int = None,
+        max_steps: int = 500,
+        layout: BoardLayout = None,
+    ):
+        self.difficulty = difficulty
+        self.backend = backend
+        self.use_banks = use_banks
+        self.workers = workers
+        self.max_steps = max_steps
+        self.layout = layout  # Classic board when None
+
+    def run(
+        self,
+        policy: str,
+        episodes: int,
+        chunk_size: int = 500,
+        seed: int = None,
+    ) -> SimulationReport:
+        """Play *episodes* games with a policy from POLICIES and return the report."""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'.")
+        if episodes < 1:
+            raise ValueError("At least one episode is required.")
+        chunks = [chunk_size] * (episodes // chunk_size)
+        if episodes % chunk_size:
+            chunks.append(episodes % chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        logger.info(
+            "Simulating %s games (policy=%s, difficulty=%s)",
+            episodes,
+            policy,
+            self.difficulty,
+        )
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.difficulty, self.backend, self.use_banks, self.layout),
+        ) as pool:
+            futures = [
+                pool.submit(_play_chunk, chunk_seed, policy, size, self.max_steps)
+                for chunk_seed, size in zip(seeds, chunks)
+            ]
+            batches = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+        return SimulationReport(policy, episodes, elapsed, EpisodeBatch.merge(batches))
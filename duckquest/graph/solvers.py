@@ -0,0 +1,275 @@
+"""Interchangeable shortest-path solvers over the compact graph core.
+
+Every solver is built for one board: it copies the CSR arrays and the edge weights of a
+CompactGraph into Python lists once, then answers queries between integer node ids.
+
+- "dijkstra": binary heap Dijkstra, the reference implementation
+- "dial": Dijkstra with a circular bucket queue, one bucket per distance; weights are
+  small integers, so a node is queued and taken out in constant time
+- "bidirectional": two Dijkstra searches, from the source and from the target, that stop
+  once they meet
+- "astar": A* guided by the straight-line distance to the target in the board layout
+
+Solvers that can explore the whole graph from one node (`single_source`) also build the
+distance and next hop tables used by GraphManager's path tables.
+"""
+
+import heapq
+import math
+from abc import ABC, abstractmethod
+import numpy as np
+from duckquest.graph.compact import CompactGraph, UNREACHABLE
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Solver(ABC):
+    """Shortest paths between node ids of one board."""
+
+    name = "solver"
+    single_source = False  # True if table() is available
+
+    def __init__(self, core: CompactGraph, positions=None):
+        self.core = core
+        self.offsets = core.offsets.tolist()
+        self.neighbor_ids = core.neighbor_ids.tolist()
+        self.slot_weights = core.weights[core.edge_ids].tolist()
+
+    @abstractmethod
+    def search(self, source: int, target: int) -> tuple[int, list[int]] | None:
+        """Return the (cost, node ids) of a shortest path, or None if there is none."""
+
+    def table(self, source: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the distance from *source* and the next hop towards it for every node.
+
+        Unreachable nodes have a distance and next hop of UNREACHABLE.
+        """
+        raise NotImplementedError(f"Solver '{self.name}' only answers point queries.")
+
+    @staticmethod
+    def _walk_back(previous: list[int], source: int, target: int) -> list[int]:
+        """Follow predecessors from *target* back to *source* and return the path."""
+        path = [target]
+        while path[-1] != source:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return path
+
+    def _result(self, distances, previous, source, target):
+        """Turn full distance and predecessor lists into a search() result."""
+        if distances[target] == UNREACHABLE:
+            return None
+        return distances[target], self._walk_back(previous, source, target)
+
+
+class DijkstraSolver(Solver):
+    """Dijkstra with a binary heap."""
+
+    name = "dijkstra"
+    single_source = True
+
+    def _run(self, source: int, target: int = None) -> tuple[list, list]:
+        offsets, neighbor_ids, slot_weights = (
+            self.offsets,
+            self.neighbor_ids,
+            self.slot_weights,
+        )
+        distances = [UNREACHABLE] * (len(offsets) - 1)
+        previous = [UNREACHABLE] * (len(offsets) - 1)
+        distances[source] = 0
+        heap = [(0, source)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            if node == target:
+                break
+            for slot in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbor_ids[slot]
+                candidate = distance + slot_weights[slot]
+                known = distances[neighbor]
+                if known == UNREACHABLE or candidate < known:
+                    distances[neighbor] = candidate
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (candidate, neighbor))
+        return distances, previous
+
+    def search(self, source, target):
+        return self._result(*self._run(source, target), source, target)
+
+    def table(self, source):
+        distances, previous = self._run(source)
+        return np.array(distances, dtype=np.int64), np.array(previous, dtype=np.int32)
+
+
+class DialSolver(DijkstraSolver):
+    """Dijkstra with a circular bucket queue (Dial's algorithm).
+
+    With weights of at most C, every queued distance lies within C of the current one, so
+    C + 1 buckets indexed by distance modulo C + 1 are enough.
+    """
+
+    name = "dial"
+
+    def __init__(self, core, positions=None):
+        super().__init__(core, positions)
+        self.max_weight = max(self.slot_weights, default=0)
+
+    def _run(self, source, target=None):
+        offsets, neighbor_ids, slot_weights = (
+            self.offsets,
+            self.neighbor_ids,
+            self.slot_weights,
+        )
+        distances = [UNREACHABLE] * (len(offsets) - 1)
+        previous = [UNREACHABLE] * (len(offsets) - 1)
+        distances[source] = 0
+        size = self.max_weight + 1
+        buckets = [[] for _ in range(size)]
+        buckets[0].append(source)
+        queued = 1
+        distance = 0
+        while queued:
+            bucket = buckets[distance % size]
+            # Zero-weight edges push into the bucket being drained, hence the inner loop
+            while bucket:
+                node = bucket.pop()
+                queued -= 1
+                if distances[node] != distance:
+                    continue  # Stale entry, the node was reached cheaper since
+                if node == target:
+                    return distances, previous
+                for slot in range(offsets[node], offsets[node + 1]):
+                    neighbor = neighbor_ids[slot]
+                    candidate = distance + slot_weights[slot]
+                    known = distances[neighbor]
+                    if known == UNREACHABLE or candidate < known:
+                        distances[neighbor] = candidate
+                        previous[neighbor] = node
+                        buckets[candidate % size].append(neighbor)
+                        queued += 1
+            distance += 1
+        return distances, previous
+
+
+class BidirectionalSolver(Solver):
+    """Two alternating Dijkstra searches, from each end, stopped once they meet."""
+
+    name = "bidirectional"
+
+    def search(self, source, target):
+        if source == target:
+            return 0, [source]
+        offsets, neighbor_ids, slot_weights = (
+            self.offsets,
+            self.neighbor_ids,
+            self.slot_weights,
+        )
+        # Distances, predecessors and heap of each direction; the graph is undirected
+        distances = ({source: 0}, {target: 0})
+        previous = ({}, {})
+        heaps = ([(0, source)], [(0, target)])
+        settled = (set(), set())
+        best, meeting = math.inf, None  # Meeting edge, as (forward end, backward end)
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            distance, node = heapq.heappop(heaps[side])
+            if node in settled[side]:
+                continue
+            settled[side].add(node)
+            mine, other = distances[side], distances[1 - side]
+            for slot in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbor_ids[slot]
+                candidate = distance + slot_weights[slot]
+                if candidate < mine.get(neighbor, math.inf):
+                    mine[neighbor] = candidate
+                    previous[side][neighbor] = node
+                    heapq.heappush(heaps[side], (candidate, neighbor))
+                if neighbor in other and candidate + other[neighbor] < best:
+                    best = candidate + other[neighbor]
+                    meeting = (node, neighbor) if side == 0 else (neighbor, node)
+        if meeting is None:
+            return None
+
+        head, tail = meeting
+        path = [head]
+        while path[-1] != source:
+            path.append(previous[0][path[-1]])
+        path.reverse()
+        path.append(tail)
+        while path[-1] != target:
+            path.append(previous[1][path[-1]])
+        return int(best), path
+
+
+class AStarSolver(Solver):
+    """A* with the straight-line distance to the target as heuristic.
+
+    An edge never spans more than the longest edge of the layout and never costs less
+    than the lightest weight, so the distance scaled by their ratio never overestimates.
+    """
+
+    name = "astar"
+
+    def __init__(self, core, positions=None):
+        super().__init__(core, positions)
+        if positions is None:
+            raise ValueError("The A* solver needs node positions.")
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self.xs = positions[:, 0].tolist()
+        self.ys = positions[:, 1].tolist()
+        ends = np.array([(core.index[u], core.index[v]) for u, v in core.edges])
+        lengths = np.hypot(*(positions[ends[:, 0]] - positions[ends[:, 1]]).T)
+        longest = float(lengths.max()) if len(lengths) else 0.0
+        lightest = int(core.weights.min()) if len(core.weights) else 0
+        self.scale = lightest / longest if longest else 0.0
+
+    def search(self, source, target):
+        offsets, neighbor_ids, slot_weights = (
+            self.offsets,
+            self.neighbor_ids,
+            self.slot_weights,
+        )
+        xs, ys, scale = self.xs, self.ys, self.scale
+        tx, ty = xs[target], ys[target]
+        distances = {source: 0}
+        previous = {}
+        settled = set()
+        heap = [(0.0, 0, source)]
+        while heap:
+            _, distance, node = heapq.heappop(heap)
+            if node == target:
+                path = [target]
+                while path[-1] != source:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                return distance, path
+            if node in settled:
+                continue
+            settled.add(node)
+            for slot in range(offsets[node], offsets[node + 1]):
+                neighbor = neighbor_ids[slot]
+                candidate = distance + slot_weights[slot]
+                if candidate < distances.get(neighbor, math.inf):
+                    distances[neighbor] = candidate
+                    previous[neighbor] = node
+                    estimate = scale * math.hypot(xs[neighbor] - tx, ys[neighbor] - ty)
+                    heapq.heappush(heap, (candidate + estimate, candidate, neighbor))
+        return None
+
+
+SOLVERS = {
+    solver.name: solver
+    for solver in (DijkstraSolver, DialSolver, BidirectionalSolver, AStarSolver)
+}
+
+
+def make_solver(name: str, core: CompactGraph, positions=None) -> Solver:
+    """Build the solver registered under *name* for the current weights of *core*."""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown shortest path solver '{name}'.")
+    logger.debug(f"Building '{name}' solver for {len(core.nodes)} nodes")
+    return SOLVERS[name](core, positions)
@@ -0,0 +1,45 @@
+"""Uniform grid index for hit-testing nodes.
+
+Node centers are bucketed into square cells as large as the hit radius, so a query only
+looks at the 3x3 block of cells around the point. Each query costs the same whatever the
+number of nodes. The renderer builds one grid per layout, in display pixels.
+"""
+
+import math
+import numpy as np
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SpatialGrid:
+    """Answer nearest-point-within-radius queries over a fixed set of 2D points."""
+
+    def __init__(self, points, radius: float):
+        if radius <= 0:
+            raise ValueError(f"Hit radius must be positive, got {radius}.")
+        self.points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self.radius = float(radius)
+        self.cells = {}
+        for i, (x, y) in enumerate(self.points.tolist()):
+            self.cells.setdefault(self._cell(x, y), []).append(i)
+        logger.debug(
+            f"SpatialGrid built with {len(self.points)} points in {len(self.cells)} cells"
+        )
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        """Return the grid cell containing a point."""
+        return math.floor(x / self.radius), math.floor(y / self.radius)
+
+    def nearest(self, x: float, y: float) -> int | None:
+        """Return the index of the closest point within the radius, or None."""
+        cx, cy = self._cell(x, y)
+        best, best_distance = None, self.radius**2
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for i in self.cells.get((cx + dx, cy + dy), ()):
+                    px, py = self.points[i]
+                    distance = (px - x) ** 2 + (py - y) ** 2
+                    if distance <= best_distance:
+                        best, best_distance = i, distance
+        return best
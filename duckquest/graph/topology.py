@@ -0,0 +1,60 @@
+"""Static board topology shared by every game session of a process.
+
+A BoardTopology holds what never changes while a board is played: node and edge lists,
+positions, start and goal, the topology hash and the CSR adjacency of the compact core. It
+is built once and treated as read-only. GraphManager keeps only the per-session state on top
+of it (weights and path tables), so creating a GraphManager with the compact backend for a
+new session does not rebuild the board. The networkx backend stores the weights in the
+networkx graph itself, so it still builds one graph per session.
+"""
+
+import functools
+from types import MappingProxyType
+import numpy as np
+from duckquest.graph.bank import topology_hash
+from duckquest.graph.compact import CompactGraph
+from duckquest.graph.layout import BoardLayout, load_board
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BoardTopology:
+    """Read-only nodes, edges, positions and adjacency of one board."""
+
+    def __init__(self, layout: BoardLayout):
+        self.name = layout.name
+        self.nodes = tuple(layout.nodes)
+        self.edges = tuple(layout.edges)
+        self.positions = MappingProxyType(dict(layout.positions))
+        self.start = layout.start
+        self.end = layout.end
+        self.hash = topology_hash(self.nodes, self.edges)
+
+        compiled = layout.compiled
+        if compiled is not None:
+            # CSR arrays straight from the mapped compiled board
+            self.core = CompactGraph.from_csr(
+                self.nodes,
+                self.edges,
+                compiled.offsets,
+                compiled.neighbor_ids,
+                compiled.edge_ids,
+            )
+        else:
+            self.core = CompactGraph(self.nodes, self.edges)
+        self.core.weights.flags.writeable = False  # Sessions get their own weights
+        logger.debug(
+            f"Board topology '{self.name}' built: {len(self.nodes)} nodes, "
+            f"{len(self.edges)} edges"
+        )
+
+    def session_core(self) -> CompactGraph:
+        """Return a compact graph sharing this topology's arrays, with its own weights."""
+        return self.core.with_weights(np.zeros(len(self.edges), dtype=np.uint8))
+
+
+@functools.lru_cache(maxsize=None)
+def shared_topology(name: str = "classic") -> BoardTopology:
+    """Return the topology of a board from duckquest/data/boards/, built once per process."""
+    return BoardTopology(load_board(name))
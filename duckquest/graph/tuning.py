@@ -0,0 +1,306 @@
+"""Offline board generation for difficulty tuning.
+
+Draws large batches of candidate weight vectors, scores them in bulk with NumPy over the
+compact graph arrays and keeps the boards that make interesting puzzles:
+
+- optimal cost from start to goal (Bellman-Ford over the whole batch at once),
+- number of tied optimal paths (path counting on the tight edges),
+- gap between a greedy "cheapest next edge" walk and the optimal cost.
+
+Batches are spread over a process pool and the accepted boards, with one optimal path each,
+are written to a board bank (see bank.py) that GraphLogic can draw from at runtime.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+from duckquest.graph.bank import PATH_PAD
+from duckquest.graph.compact import CompactGraph
+from duckquest.graph.manager import GraphManager, sample_weights
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+GREEDY_STUCK = -1  # Greedy cost of a walk that reached a dead end
+
+
+@dataclass(frozen=True)
+class AcceptanceCriteria:
+    """Properties a candidate board must have to enter the bank."""
+
+    max_tied_paths: int = 1  # 1 means the optimal path must be unique
+    # Greedy walk must cost at least this much more than optimal
+    min_greedy_gap: int = 2
+    accept_greedy_stuck: bool = True  # Keep boards where the greedy walk dead-ends
+
+
+@dataclass
+class BatchScores:
+    """Scores of a batch of candidate boards, one entry per board."""
+
+    optimal_cost: np.ndarray
+    tied_paths: np.ndarray
+    greedy_cost: np.ndarray
+    distances: np.ndarray = None  # (boards, nodes) costs to the goal, to extract paths
+
+    @property
+    def greedy_gap(self) -> np.ndarray:
+        """Return greedy minus optimal cost, or GREEDY_STUCK where the walk dead-ended."""
+        return np.where(
+            self.greedy_cost == GREEDY_STUCK,
+            GREEDY_STUCK,
+            self.greedy_cost - self.optimal_cost,
+        )
+
+    def accepted(self, criteria: AcceptanceCriteria) -> np.ndarray:
+        """Return a boolean mask of the boards meeting the criteria."""
+        reachable = self.optimal_cost >= 0
+        unique_enough = (self.tied_paths >= 1) & (
+            self.tied_paths <= criteria.max_tied_paths
+        )
+        gap = self.greedy_gap
+        greedy_ok = gap >= criteria.min_greedy_gap
+        if criteria.accept_greedy_stuck:
+            greedy_ok |= gap == GREEDY_STUCK
+        return reachable & unique_enough & greedy_ok
+
+
+class BatchScorer:
+    """Score many weight vectors of the same topology at once."""
+
+    def __init__(self, core: CompactGraph, start: str, goal: str):
+        self.core = core
+        self.start = core.node_id(start)
+        self.goal = core.node_id(goal)
+        ends = np.array(
+            [(core.node_id(u), core.node_id(v)) for u, v in core.edges], dtype=np.intp
+        ).reshape(-1, 2)
+        self.heads = ends[:, 0]
+        self.tails = ends[:, 1]
+
+        # Padded (node, degree) neighbor table for the greedy walk
+        degrees = np.diff(core.offsets)
+        self.max_degree = int(degrees.max()) if len(degrees) else 0
+        self.pad_neighbors = np.full(
+            (len(core.nodes), self.max_degree), -1, dtype=np.intp
+        )
+        self.pad_edges = np.zeros((len(core.nodes), self.max_degree), dtype=np.intp)
+        for node in range(len(core.nodes)):
+            start, end = core.offsets[node], core.offsets[node + 1]
+            self.pad_neighbors[node, : end - start] = core.neighbor_ids[start:end]
+            self.pad_edges[node, : end - start] = core.edge_ids[start:end]
+
+    def distances_to_goal(self, weights: np.ndarray) -> np.ndarray:
+        """Return the (boards, nodes) optimal cost to the goal, -1 where unreachable."""
+        unreachable = np.iinfo(np.int32).max // 2
+        # Work on (nodes, boards) so that every per-node row is contiguous
+        distances = np.full(
+            (len(self.core.nodes), weights.shape[0]), unreachable, dtype=np.int32
+        )
+        distances[self.goal] = 0
+        edge_weights = np.ascontiguousarray(weights.T, dtype=np.int32)
+        candidate = np.empty(weights.shape[0], dtype=np.int32)
+        # Bellman-Ford: converges after at most (nodes - 1) sweeps, usually far fewer
+        for _ in range(len(self.core.nodes)):
+            changed = False
+            for edge, (u, v) in enumerate(zip(self.heads, self.tails)):
+                for a, b in ((u, v), (v, u)):
+                    np.add(distances[b], edge_weights[edge], out=candidate)
+                    if (candidate < distances[a]).any():
+                        np.minimum(distances[a], candidate, out=distances[a])
+                        changed = True
+            if not changed:
+                break
+        distances[distances >= unreachable] = -1
+        return np.ascontiguousarray(distances.T)
+
+    def count_optimal_paths(
+        self, weights: np.ndarray, distances: np.ndarray
+    ) -> np.ndarray:
+        """Return the number of optimal start-to-goal paths of each board."""
+        edge_weights = weights.T.astype(np.int32)
+        distances = distances.T
+        # An edge is tight in direction a -> b when it lies on an optimal path to the goal
+        tight = []
+        for edge, (u, v) in enumerate(zip(self.heads, self.tails)):
+            for a, b in ((u, v), (v, u)):
+                mask = (distances[a] == distances[b] + edge_weights[edge]) & (
+                    distances[b] >= 0
+                )
+                if mask.any():
+                    tight.append((a, b, mask.astype(np.int64)))
+
+        counts = np.zeros(distances.shape, dtype=np.int64)
+        counts[self.goal] = 1
+        for _ in range(len(self.core.nodes)):
+            updated = np.zeros_like(counts)
+            updated[self.goal] = 1
+            for a, b, mask in tight:
+                updated[a] += counts[b] * mask
+            if np.array_equal(updated, counts):
+                break
+            counts = updated
+        return counts[self.start]
+
+    def greedy_costs(self, weights: np.ndarray) -> np.ndarray:
+        """Return the cost of always taking the cheapest edge to an unvisited node.
+
+        Ties go to the first neighbor in edge order. Walks that reach a dead end before the
+        goal get GREEDY_STUCK.
+        """
+        boards = weights.shape[0]
+        rows = np.arange(boards)
+        current = np.full(boards, self.start, dtype=np.intp)
+        visited = np.zeros((boards, len(self.core.nodes)), dtype=bool)
+        visited[:, self.start] = True
+        cost = np.zeros(boards, dtype=np.int64)
+        active = current != self.goal
+        blocked = np.iinfo(np.int32).max
+
+        for _ in range(len(self.core.nodes)):
+            if not active.any():
+                break
+            neighbors = self.pad_neighbors[current]
+            slot_weights = weights[rows[:, None], self.pad_edges[current]].astype(
+                np.int64
+            )
+            open_slots = (neighbors >= 0) & ~visited[
+                rows[:, None], np.maximum(neighbors, 0)
+            ]
+            slot_weights[~open_slots] = blocked
+            choice = slot_weights.argmin(axis=1)
+            step = slot_weights[rows, choice]
+
+            stuck = active & (step == blocked)
+            cost[stuck] = GREEDY_STUCK
+            active &= ~stuck
+
+            moving = np.flatnonzero(active)
+            current[moving] = neighbors[moving, choice[moving]]
+            cost[moving] += step[moving]
+            visited[moving, current[moving]] = True
+            active &= current != self.goal
+        cost[active] = GREEDY_STUCK
+        return cost
+
+    def optimal_paths(self, weights: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """Return one optimal start-to-goal path per board, as node ids.
+
+        Paths are rows of a (boards, nodes) uint16 matrix padded with PATH_PAD; boards where
+        the goal is unreachable get an empty row. Ties go to the first neighbor in edge order.
+        """
+        boards = weights.shape[0]
+        rows = np.arange(boards)
+        paths = np.full((boards, len(self.core.nodes)), PATH_PAD, dtype=np.uint16)
+        current = np.full(boards, self.start, dtype=np.intp)
+        reachable = distances[:, self.start] >= 0
+        paths[reachable, 0] = self.start
+        active = reachable & (current != self.goal)
+
+        for step in range(1, len(self.core.nodes)):
+            if not active.any():
+                break
+            neighbors = self.pad_neighbors[current]
+            neighbor_distances = distances[rows[:, None], np.maximum(neighbors, 0)]
+            slot_weights = weights[rows[:, None], self.pad_edges[current]]
+            tight = (
+                (neighbors >= 0)
+                & (neighbor_distances >= 0)
+                & (
+                    neighbor_distances + slot_weights
+                    == distances[rows, current][:, None]
+                )
+            )
+            choice = tight.argmax(axis=1)
+            moving = np.flatnonzero(active)
+            current[moving] = neighbors[moving, choice[moving]]
+            paths[moving, step] = current[moving]
+            active &= current != self.goal
+        return paths
+
+    def score(self, weights: np.ndarray) -> BatchScores:
+        """Score a (boards, edges) weight matrix."""
+        distances = self.distances_to_goal(weights)
+        return BatchScores(
+            optimal_cost=distances[:, self.start].astype(np.int64),
+            tied_paths=self.count_optimal_paths(weights, distances),
+            greedy_cost=self.greedy_costs(weights),
+            distances=distances,
+        )
+
+
+_worker_scorer = None  # Per-process scorer, built once by the pool initializer
+
+
+def _init_worker() -> None:
+    """Build the stock board scorer once per worker process."""
+    global _worker_scorer
+    graph = GraphManager(backend="compact")
+    _worker_scorer = BatchScorer(graph.core, graph.start_node, graph.end_node)
+
+
+def _score_chunk(
+    seed: np.random.SeedSequence,
+    difficulty: int,
+    boards: int,
+    criteria: AcceptanceCriteria,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw and score one chunk of candidates.
+
+    Returns the accepted weights, their optimal costs and one optimal path each.
+    """
+    rng = np.random.default_rng(seed)
+    weights = sample_weights(
+        rng, difficulty, len(_worker_scorer.core.edges), boards=boards
+    )
+    scores = _worker_scorer.score(weights)
+    mask = scores.accepted(criteria)
+    weights = weights[mask]
+    paths = _worker_scorer.optimal_paths(weights, scores.distances[mask])
+    return weights, scores.optimal_cost[mask], paths
+
+
+def generate_boards(
+    difficulty: int,
+    candidates: int,
+    criteria: AcceptanceCriteria = AcceptanceCriteria(),
+    workers: int = None,
+    chunk_size: int = 20_000,
+    seed: int = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate *candidates* random boards in parallel and keep the accepted ones.
+
+    Returns the accepted (boards, edges) uint8 weight matrix, their optimal costs and their
+    optimal paths (see BatchScorer.optimal_paths). Duplicate boards are removed.
+    """
+    if candidates < 1:
+        raise ValueError("At least one candidate board is required.")
+    logger.info(
+        f"Generating {candidates} candidate boards (difficulty={difficulty}, seed={seed})"
+    )
+    chunks = [chunk_size] * (candidates // chunk_size)
+    if candidates % chunk_size:
+        chunks.append(candidates % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    accepted_weights, accepted_costs, accepted_paths = [], [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(_score_chunk, chunk_seed, difficulty, boards, criteria)
+            for chunk_seed, boards in zip(seeds, chunks)
+        ]
+        for future in futures:
+            weights, costs, paths = future.result()
+            accepted_weights.append(weights)
+            accepted_costs.append(costs)
+            accepted_paths.append(paths)
+
+    weights = np.concatenate(accepted_weights)
+    costs = np.concatenate(accepted_costs)
+    paths = np.concatenate(accepted_paths)
+    if not len(weights):
+        logger.warning("No candidate board met the acceptance criteria")
+        return weights, costs, paths
+    weights, unique = np.unique(weights, axis=0, return_index=True)
+    logger.info(f"Accepted {len(weights)} of {candidates} candidate boards")
+    return weights, costs[unique], paths[unique]
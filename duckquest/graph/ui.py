@@ -3,11 +3,12 @@
 This module defines the GUI layout, buttons, difficulty selector, and integrates with the renderer for dynamic graph updates.
 """
 
-import json
 import tkinter as tk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from duckquest.graph.help import HelpScreen
 from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import timings
 
 logger = setup_logger(__name__)
 
@@ -26,19 +27,29 @@ LABEL_STYLE = {
     "font": ("Arial", 15, "bold"),
 }
 
+OVERLAY_STYLE = {
+    "bg": "#282C34",
+    "fg": "#98C379",
+    "font": ("Courier", 10),
+    "justify": tk.LEFT,
+    "anchor": "w",
+}
+
+OVERLAY_REFRESH_MS = 500  # How often the latency overlay is updated while shown
+
 
 class GraphUI:
     """Handle the graphical interface for displaying and interacting with the graph."""
 
-    def __init__(self, game_manager):
+    def __init__(self, game_manager, root: tk.Tk = None):
         logger.info("Initializing GraphUI")
         self.game_manager = game_manager
         self.graph = self.game_manager.graph
         self.logic = self.game_manager.logic
         # self.audio_manager = self.game_manager.audio_manager
 
-        # Initialize the main Tkinter window
-        self.root = tk.Tk()
+        # Initialize the main Tkinter window, unless the splash screen already opened it
+        self.root = root or tk.Tk()
         self.root.title("DuckQuest - Game Modelling")
         self.root.configure(bg="#282C34")
 
@@ -105,6 +116,11 @@ class GraphUI:
         self.score_label.pack(side=tk.LEFT, padx=10)
         logger.debug("Score label initialized")
 
+        # Live cost of the path being built, against the best total reachable from here
+        self.path_label = tk.Label(self.top_frame, text="", **LABEL_STYLE)
+        self.path_label.pack(side=tk.LEFT, padx=10)
+        self.update_path_display()
+
         # Initialize the graph display area using Matplotlib
         self.figure, self.ax = plt.subplots(figsize=(12, 6))
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.root)
@@ -113,8 +129,11 @@ class GraphUI:
         )
         logger.debug("Matplotlib canvas initialized")
 
+        # Rules page, laid out once and shown over the graph
+        self.help = HelpScreen(self.ax, self.canvas)
+
         # Link the renderer to the UI for visualization
-        self.game_manager.graph_renderer.init_ui(self.ax, self.canvas)
+        self.game_manager.graph_renderer.init_ui(self.ax, self.canvas, self.help)
         self.game_manager.graph_renderer.display_graph()
 
         logger.info("UI setup complete - displaying help screen")
@@ -125,6 +144,13 @@ class GraphUI:
         self.canvas.mpl_connect("button_press_event", self.game_manager.on_click)
         logger.debug("Canvas click binding established")
 
+        # Latency debug overlay: F3 shows it and turns timing on, F4 saves the histograms
+        self.timing_label = tk.Label(self.root, text="", **OVERLAY_STYLE)
+        self.timing_overlay_shown = False
+        self._timings_were_enabled = timings.enabled
+        self.root.bind("<F3>", lambda event: self.toggle_timing_overlay())
+        self.root.bind("<F4>", lambda event: self.game_manager.dump_timings())
+
     def update_difficulty(self, value):
         """Update the difficulty."""
         new_difficulty = int(value)
@@ -137,59 +163,52 @@ class GraphUI:
         logger.info(f"Score updated: {score} pts")
         self.score_label.config(text=f"SCORE : {score} PTS")
 
-    def help_screen(self):
-        """Display the game rules in an organized and visually appealing way."""
-        logger.debug("Displaying help screen")
-        y_position = 1.1  # Start near the top
-        line_spacing = 0.04  # Space between lines
-        # Clear the current axis
-
-        self.ax.clear()
-        self.ax.set_facecolor("#282C34")  # Dark background for better visibility
-        self.ax.axis("off")  # Hide axes
-
-        try:
-            # Load rules from JSON
-            with open("duckquest/data/rules.json", "r") as file:
-                rules_data = json.load(file)
-            rules = rules_data["rules"]
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to load rules: {e}")
-            self.ax.text(0.5, 0.5, "Error loading rules.", ha="center", va="center")
-            self.canvas.draw()
+    def update_path_display(self):
+        """Update the path cost indicator from the logic's running totals."""
+        cost, best, estimate = self.logic.path_estimate()
+        if best is None:
+            text = f"PATH : {cost} | GOAL UNREACHABLE"
+        else:
+            text = f"PATH : {cost} | BEST FROM HERE : {best} ({estimate} %)"
+        self.path_label.config(text=text)
+
+    def toggle_timing_overlay(self):
+        """Show or hide the latency overlay, timing the hot paths while it is shown."""
+        if self.timing_overlay_shown:
+            self.timing_label.pack_forget()
+            timings.enabled = self._timings_were_enabled
+            self.timing_overlay_shown = False
+            logger.info("Latency overlay hidden")
             return
+        self._timings_were_enabled = timings.enabled
+        timings.enabled = True
+        self.timing_label.pack(
+            side=tk.BOTTOM, fill=tk.X, padx=10, before=self.canvas.get_tk_widget()
+        )
+        self.timing_overlay_shown = True
+        logger.info("Latency overlay shown")
+        self.update_timing_overlay()
 
-        for section in rules:
-            header = section["header"]
-            content = section["content"]
-            # Add section header
-            self.ax.text(
-                0.05,
-                y_position,
-                header,
-                fontsize=12,
-                fontweight="bold",
-                ha="left",
-                va="top",
-                transform=self.ax.transAxes,
-                color="black",
+    def update_timing_overlay(self):
+        """Refresh the latency overlay, then re-arm while it is shown."""
+        if not self.timing_overlay_shown:
+            return
+        report = self.game_manager.latency_report()
+        lines = [f"{'span':<28} {'count':>6} {'p50':>8} {'p99':>8} {'max':>8} (ms)"]
+        for name, summary in report["spans"].items():
+            lines.append(
+                f"{name:<28} {summary['count']:>6} {summary['p50_ms']:>8.2f} "
+                f"{summary['p99_ms']:>8.2f} {summary['max_ms']:>8.2f}"
+            )
+        if report["within_budget"] is not None:
+            lines.append(
+                f"Presses within the {report['input_budget_ms']} ms budget: "
+                f"{report['within_budget']:.1%}"
             )
-            y_position -= line_spacing * 1.5  # Add extra space after the header
-            for line in content:  # Add section content
-                self.ax.text(
-                    0.07,
-                    y_position,
-                    line,
-                    fontsize=10,
-                    ha="left",
-                    va="top",
-                    transform=self.ax.transAxes,
-                    wrap=True,
-                    color="black",
-                )
-                y_position -= line_spacing
-            y_position -= line_spacing * 0.5  # Extra spacing after each section
-
-        # Ensure the canvas updates
-        self.canvas.draw()
-        logger.info("Help screen rendered")
+        self.timing_label.config(text="\n".join(lines))
+        self.root.after(OVERLAY_REFRESH_MS, self.update_timing_overlay)
+
+    def help_screen(self):
+        """Display the game rules over the graph."""
+        logger.debug("Displaying help screen")
+        self.help.show()
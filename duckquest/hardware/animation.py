@@ -0,0 +1,216 @@
+"""Background LED animation engine.
+
+The Animator plays frame generators (see effects.py) on its own thread, so Tk callbacks only
+schedule effects and return immediately. A new effect can preempt the current one, or be
+queued behind it, and cancel() stops everything at the next frame boundary. Frames go
+through a FrameBuffer, which is flushed with one show() per frame, at a capped frame rate.
+
+AnimatedStrip is the shared base of the real and mock LEDStripManager: it maps the effect
+methods onto the animator for a given strip driver.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Iterator
+from duckquest.hardware.effects import (
+    BLACK,
+    Color,
+    Frame,
+    blink_frames,
+    fill_frames,
+    score_color,
+    score_frames,
+)
+from duckquest.hardware.framebuffer import MAX_FPS, FrameBuffer
+from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import timings
+
+logger = setup_logger(__name__)
+
+
+class Animator:
+    """Play frame generators one after another on a background thread."""
+
+    def __init__(
+        self,
+        framebuffer: FrameBuffer,
+        clock=time.monotonic,
+        sleep=None,
+        name: str = "led-animator",
+    ):
+        self.framebuffer = framebuffer
+        self._clock = clock
+        # Returns True when the wait was interrupted by a cancellation
+        self._sleep = sleep or self._wait_for_cancel
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._cancel = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def play(self, animation: Iterator[Frame], preempt: bool = True):
+        """Start an animation, aborting the current one unless *preempt* is False."""
+        with self._condition:
+            if preempt:
+                self._pending.clear()
+                self._cancel.set()
+            self._pending.append(animation)
+            self._idle.clear()
+            self._condition.notify()
+
+    def cancel(self) -> bool:
+        """Abort the current and queued animations; return True if one was running."""
+        with self._condition:
+            busy = not self._idle.is_set()
+            self._pending.clear()
+            self._cancel.set()
+        return busy
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until no animation is running; return False on timeout."""
+        return self._idle.wait(timeout)
+
+    def stop(self):
+        """Cancel everything and stop the animation thread."""
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._cancel.set()
+            self._condition.notify()
+        self._thread.join()
+        logger.debug("Animator stopped")
+
+    def _wait_for_cancel(self, seconds: float) -> bool:
+        """Default sleep: wait on the cancel flag so preemption is immediate."""
+        return self._cancel.wait(seconds)
+
+    def _run(self):
+        """Animation thread: play queued animations until stopped."""
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._idle.set()
+                    self._condition.wait()
+                if not self._running:
+                    self._idle.set()
+                    return
+                animation = self._pending.popleft()
+                self._cancel.clear()
+            self._play(animation)
+            with self._condition:
+                more = bool(self._pending)
+            if not more:
+                # Show what the last frames left in the buffer, within the frame-rate cap
+                self._present(max(self._clock(), self.framebuffer.next_show()))
+
+    def _play(self, animation: Iterator[Frame]):
+        """Write the frames of one animation on schedule, stopping early if cancelled."""
+        deadline = self._clock()
+        try:
+            for frame in animation:
+                if self._cancel.is_set():
+                    logger.debug("Animation preempted")
+                    break
+                self.framebuffer.update(frame.updates)
+                # Deadlines accumulate so that slow writes do not stretch the animation
+                deadline += frame.hold_ms / 1000.0
+                if not self._present(deadline):
+                    logger.debug("Animation preempted")
+                    break
+        except Exception as e:
+            logger.error(f"LED animation failed: {e}", exc_info=True)
+        finally:
+            if hasattr(animation, "close"):
+                animation.close()
+
+    def _present(self, deadline: float) -> bool:
+        """Show the buffer as soon as the frame-rate cap allows, then wait for *deadline*.
+
+        Changes are left in the buffer when the next frame is due before the cap allows a
+        show(), so short frames are merged. Returns False if cancelled while waiting.
+        """
+        if self.framebuffer.dirty:
+            show_at = self.framebuffer.next_show()
+            if show_at <= deadline:
+                if not self._sleep_until(show_at):
+                    return False
+                with timings.span("led.show"):
+                    self.framebuffer.flush(self._clock())
+        return self._sleep_until(deadline)
+
+    def _sleep_until(self, moment: float) -> bool:
+        """Sleep until *moment*; return False if cancelled."""
+        remaining = moment - self._clock()
+        if remaining <= 0:
+            return not self._cancel.is_set()
+        return not self._sleep(remaining)
+
+
+class AnimatedStrip:
+    """LED strip effects played without blocking the caller.
+
+    *strip* is the driver the frames are shown on (rpi_ws281x PixelStrip or a fake).
+    *clock* and *sleep* are passed to the Animator, so tests can run it on virtual time.
+    """
+
+    def __init__(
+        self, strip, max_fps: float = MAX_FPS, clock=time.monotonic, sleep=None
+    ):
+        self.strip = strip
+        self.framebuffer = FrameBuffer(strip, max_fps)
+        self.num_pixels = self.framebuffer.num_pixels
+        self.animator = Animator(self.framebuffer, clock=clock, sleep=sleep)
+
+    def play(self, animation: Iterator[Frame], preempt: bool = True):
+        """Play a frame generator on the animation thread."""
+        self.animator.play(animation, preempt)
+
+    def set_pixel_color(self, pixel: int, color: Color):
+        """Set a single pixel color, after the queued animations."""
+        if not (0 <= pixel < self.num_pixels):
+            logger.warning(f"Ignored invalid pixel index: {pixel}")
+            return
+        self.play(iter([Frame([(pixel, color)])]), preempt=False)
+
+    def set_all_pixels(self, color: Color):
+        """Set all pixels to the specified color, after the queued animations."""
+        self.play(fill_frames(self.num_pixels, color), preempt=False)
+
+    def score_effect(self, percentage: float = 1) -> Color:
+        """Start a progressive red-to-green effect and return its final color."""
+        logger.info(f"Starting score effect for {percentage*100:.1f}%")
+        self.play(score_frames(self.num_pixels, percentage))
+        return score_color(self.num_pixels, percentage)
+
+    def blink(self, color: Color, repetitions: int, wait_ms: float):
+        """Blink the whole strip in a color, after the queued animations."""
+        logger.info(f"Blinking {repetitions}x with color {color}")
+        self.play(
+            blink_frames(self.num_pixels, color, repetitions, wait_ms), preempt=False
+        )
+
+    def clear(self):
+        """Turn off all LEDs, after the queued animations."""
+        logger.info("Clearing LED strip")
+        self.set_all_pixels(BLACK)
+
+    def cancel(self) -> bool:
+        """Abort running effects and turn the strip off; return True if one was running."""
+        if not self.animator.cancel():
+            return False
+        logger.debug("LED effect interrupted")
+        self.play(fill_frames(self.num_pixels, BLACK))
+        return True
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until all queued effects have been played."""
+        return self.animator.wait(timeout)
+
+    def close(self, timeout: float = 1.0):
+        """Let the queued effects finish (up to *timeout* seconds) and stop the thread."""
+        self.animator.wait(timeout)
+        self.animator.stop()
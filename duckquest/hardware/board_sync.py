@@ -0,0 +1,131 @@
+"""Mirror the graph state on the LED strips of the physical board.
+
+Every edge of the board owns a run of pixels, described in duckquest/data/led_segments.json.
+After each state change BoardSync works out the color of every edge (weight color, user
+path or shortest path), compares it with what was last sent and pushes the pixels of the
+changed edges only, as a single frame.
+"""
+
+import json
+import os
+from duckquest.graph.manager import COLORS
+from duckquest.hardware.effects import Frame
+from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import timed
+
+logger = setup_logger(__name__)
+
+SEGMENTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "led_segments.json"
+)
+
+# Edge weight colors scaled to LED values
+WEIGHT_COLORS = {
+    weight: tuple(int(255 * c) for c in color) for weight, color in COLORS.items()
+}
+UNWEIGHTED_COLOR = (0, 0, 0)
+USER_PATH_COLOR = (0, 255, 255)  # Cyan, as on screen
+SHORTEST_PATH_COLOR = (128, 0, 128)  # Purple, as on screen
+
+
+class SegmentMap:
+    """Pixel ranges of the LED segment under each edge."""
+
+    def __init__(self, segments: dict[tuple[str, str], range], led_count: int):
+        self.led_count = led_count
+        self.segments = {}
+        used = {}
+        for edge, pixels in segments.items():
+            if pixels.start < 0 or pixels.stop > led_count:
+                raise ValueError(f"Segment of edge {edge} is outside the strip.")
+            for pixel in pixels:
+                if pixel in used:
+                    raise ValueError(
+                        f"Pixel {pixel} is used by edges {used[pixel]} and {edge}."
+                    )
+                used[pixel] = edge
+            self.segments[tuple(edge)] = pixels
+
+    @classmethod
+    def from_file(cls, path: str = SEGMENTS_PATH) -> "SegmentMap":
+        """Load a segment map from a JSON data file."""
+        with open(path, "r") as file:
+            data = json.load(file)
+        segments = {
+            tuple(entry["edge"]): range(entry["start"], entry["start"] + entry["count"])
+            for entry in data["segments"]
+        }
+        logger.info("Loaded %s LED segments from %s", len(segments), path)
+        return cls(segments, data["led_count"])
+
+    def pixels(self, u: str, v: str) -> range | None:
+        """Return the pixels of an edge in either direction, or None if it has none."""
+        pixels = self.segments.get((u, v))
+        return self.segments.get((v, u)) if pixels is None else pixels
+
+
+class BoardSync:
+    """Push graph state changes to the LED strip, one frame per change."""
+
+    def __init__(self, led_strip_manager, graph, logic, segment_map: SegmentMap = None):
+        self.led_strip_manager = led_strip_manager
+        self.graph = graph
+        self.logic = logic
+        self.segment_map = segment_map or SegmentMap.from_file()
+        self._shown = {}  # Edge -> color last pushed to the strip
+
+        missing = [
+            edge for edge in graph.edges if self.segment_map.pixels(*edge) is None
+        ]
+        if missing:
+            logger.warning("%s edges have no LED segment: %s", len(missing), missing)
+
+    def edge_colors(self, highlight: list = None) -> dict[tuple[str, str], tuple]:
+        """Return the color every edge should show, for edges that have LEDs."""
+        user_path = self.logic.path
+        path_edges = set()
+        if highlight:
+            path_edges = set(zip(highlight, highlight[1:]))
+
+        colors = {}
+        for (u, v), weight in zip(self.graph.edges, self.graph.weights.tolist()):
+            if self.segment_map.pixels(u, v) is None:
+                continue
+            if (u, v) in path_edges or (v, u) in path_edges:
+                colors[(u, v)] = SHORTEST_PATH_COLOR
+            elif user_path.has_edge(u, v):
+                colors[(u, v)] = USER_PATH_COLOR
+            else:
+                colors[(u, v)] = WEIGHT_COLORS.get(weight, UNWEIGHTED_COLOR)
+        return colors
+
+    @timed("led.board_sync")
+    def sync(self, highlight: list = None) -> int:
+        """Push the edges whose color changed; return how many there were.
+
+        *highlight* is a node path shown as the shortest path, like the renderer does.
+        """
+        changed = {
+            edge: color
+            for edge, color in self.edge_colors(highlight).items()
+            if self._shown.get(edge) != color
+        }
+        if not changed:
+            return 0
+        updates = [
+            (pixel, color)
+            for edge, color in changed.items()
+            for pixel in self.segment_map.pixels(*edge)
+        ]
+        # Queued behind running effects, so a celebration finishes before the board returns
+        self.led_strip_manager.play(iter([Frame(updates)]), preempt=False)
+        self._shown.update(changed)
+        logger.debug("Synced %d edge segments (%d pixels)", len(changed), len(updates))
+        return len(changed)
+
+    def invalidate(self):
+        """Forget what the strip shows, so the next sync repaints every edge.
+
+        Needed after effects that paint over the whole strip.
+        """
+        self._shown = {}
@@ -1,9 +1,11 @@
 """GPIO-based button manager for Raspberry Pi.
 
-Handles initialization and polling of multiple physical buttons using BCM pin numbers.
+Watches multiple physical buttons (BCM pin numbers) with edge detection. Presses are pushed
+from the GPIO callback thread into a debounced event queue that the game drains.
 """
 
 import RPi.GPIO as GPIO
+from duckquest.hardware.input_events import DEBOUNCE_MS, ButtonEventQueue
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -15,29 +17,37 @@ class ButtonManager:
     def __init__(self, pins: list[int]):
         """Initialize GPIO pins for button input."""
         self.pins = pins
+        self.events = ButtonEventQueue()
         logger.info(f"Initializing ButtonManager with pins: {self.pins}")
         GPIO.setmode(GPIO.BCM)
         self.setup_buttons()
 
     def setup_buttons(self):
-        """Configure pins as pull-up inputs."""
+        """Configure pins as pull-up inputs and watch them for presses."""
         for pin in self.pins:
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            logger.debug(f"Pin {pin} set as input with pull-up")
+            # Buttons pull the pin low: a press is a falling edge
+            GPIO.add_event_detect(
+                pin, GPIO.FALLING, callback=self._on_edge, bouncetime=DEBOUNCE_MS
+            )
+            logger.debug(f"Pin {pin} set as input with pull-up and edge detection")
+
+    def _on_edge(self, pin: int):
+        """GPIO callback thread: queue the press."""
+        self.events.push(pin)
+
+    def poll_events(self) -> list:
+        """Return the presses received since the last call, oldest first."""
+        return self.events.drain()
 
     def get_pressed_button(self) -> int | None:
-        """Return the GPIO pin of the pressed button, or None."""
-        for pin in self.pins:
-            state = GPIO.input(pin)
-            logger.debug(
-                f"Reading pin {pin}: {'LOW (pressed)' if state == GPIO.LOW else 'HIGH'}"
-            )
-            if state == GPIO.LOW:
-                logger.info(f"Button pressed on pin {pin}")
-                return pin
-        return None  # No button pressed
+        """Return the GPIO pin of the oldest unhandled press, or None."""
+        event = self.events.next_event()
+        return None if event is None else event.pin
 
     def cleanup(self):
         """Clean up GPIO state."""
+        for pin in self.pins:
+            GPIO.remove_event_detect(pin)
         GPIO.cleanup()
         logger.info("GPIO cleaned up")
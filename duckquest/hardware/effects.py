@@ -0,0 +1,59 @@
+"""LED strip effects described as frame generators.
+
+An effect yields Frame objects: the pixels to change and how long to hold the result. The
+generators never sleep or touch the hardware, so they can be played by the Animator, cut
+short at any frame, or inspected in tests.
+"""
+
+from typing import Iterator, NamedTuple
+
+Color = tuple[int, int, int]
+
+BLACK = (0, 0, 0)
+
+
+class Frame(NamedTuple):
+    """One animation step: pixel updates, then a pause before the next frame."""
+
+    updates: list[tuple[int, Color]]  # (pixel, color) pairs to change
+    hold_ms: float = 0
+
+
+def fill_frames(num_pixels: int, color: Color) -> Iterator[Frame]:
+    """Set the whole strip to one color."""
+    yield Frame([(i, color) for i in range(num_pixels)])
+
+
+def _score_steps(num_pixels: int, percentage: float) -> list[tuple[Color, float]]:
+    """Return the color and pause of every step of the score effect."""
+    pause = 60
+    steps = max(1, int(num_pixels * percentage))
+    progress = 0.0
+    result = []
+    for i in range(steps):
+        color = (int(255 * (1 - progress)), int(255 * progress), 0)
+        progress += percentage / steps
+        pause = max(10, pause - (i * percentage / 200))
+        result.append((color, pause))
+    return result
+
+
+def score_color(num_pixels: int, percentage: float) -> Color:
+    """Return the last color shown by the score effect."""
+    return _score_steps(num_pixels, percentage)[-1][0]
+
+
+def score_frames(num_pixels: int, percentage: float = 1) -> Iterator[Frame]:
+    """Progressive red-to-green fill whose length depends on the score percentage."""
+    for i, (color, pause) in enumerate(_score_steps(num_pixels, percentage)):
+        yield Frame([(i, color)], pause)
+    yield Frame([], 100)
+
+
+def blink_frames(
+    num_pixels: int, color: Color, repetitions: int, wait_ms: float
+) -> Iterator[Frame]:
+    """Blink the whole strip in a color, turning it off between blinks."""
+    for _ in range(repetitions):
+        yield Frame([(i, color) for i in range(num_pixels)], wait_ms)
+        yield Frame([(i, BLACK) for i in range(num_pixels)], wait_ms)
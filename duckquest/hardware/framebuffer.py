@@ -0,0 +1,66 @@
+"""Frame buffer between LED effects and the strip driver.
+
+Effects write into an RGB bytearray; pixels that really change are marked dirty. A flush
+sends only the dirty pixels to the strip and pushes them with a single show(). The Animator
+flushes at most MAX_FPS times per second, so steps shorter than one frame are merged.
+"""
+
+import math
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAX_FPS = 60  # Upper bound on show() calls per second
+
+
+def pack_color(red: int, green: int, blue: int) -> int:
+    """Pack an RGB color the way rpi_ws281x.Color does."""
+    return (red << 16) | (green << 8) | blue
+
+
+class FrameBuffer:
+    """RGB pixel buffer with dirty tracking, shown with one strip.show() per flush.
+
+    *strip* is anything with the rpi_ws281x PixelStrip interface: numPixels(),
+    setPixelColor() and show().
+    """
+
+    def __init__(self, strip, max_fps: float = MAX_FPS):
+        self.strip = strip
+        self.num_pixels = strip.numPixels()
+        self.pixels = bytearray(3 * self.num_pixels)  # What the strip shows (or will)
+        self.dirty = set()
+        self.frame_interval = 1.0 / max_fps
+        self.last_show = -math.inf
+        self.shows = 0
+
+    def update(self, updates: list[tuple[int, tuple[int, int, int]]]):
+        """Write pixel colors to the buffer, marking the changed ones dirty."""
+        for pixel, color in updates:
+            if not (0 <= pixel < self.num_pixels):
+                logger.warning(f"Ignored invalid pixel index: {pixel}")
+                continue
+            color = bytes(color)
+            if self.pixels[3 * pixel : 3 * pixel + 3] != color:
+                self.pixels[3 * pixel : 3 * pixel + 3] = color
+                self.dirty.add(pixel)
+
+    def color(self, pixel: int) -> tuple[int, int, int]:
+        """Return the buffered color of a pixel."""
+        return tuple(self.pixels[3 * pixel : 3 * pixel + 3])
+
+    def next_show(self) -> float:
+        """Return the earliest time the frame-rate cap allows the next show()."""
+        return self.last_show + self.frame_interval
+
+    def flush(self, now: float) -> bool:
+        """Send the dirty pixels and show them; return False if nothing changed."""
+        if not self.dirty:
+            return False
+        for pixel in sorted(self.dirty):
+            self.strip.setPixelColor(pixel, pack_color(*self.color(pixel)))
+        self.strip.show()
+        self.dirty.clear()
+        self.last_show = now
+        self.shows += 1
+        return True
@@ -0,0 +1,99 @@
+"""Thread-safe button event queue shared by the real and mock button managers.
+
+GPIO edge callbacks (or tests) push press events from any thread; the Tk main loop drains
+them. Presses closer together than the debounce window on the same pin are dropped, and the
+time from press to handling is recorded for latency statistics.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEBOUNCE_MS = 50  # Minimum time between two accepted presses of the same button
+LATENCY_SAMPLES = 1000  # Number of recent latencies kept for the statistics
+
+
+class ButtonEvent(NamedTuple):
+    """A debounced button press."""
+
+    pin: int
+    timestamp: float  # time.monotonic() at the edge
+
+
+class LatencyStats:
+    """Rolling press-to-handling latency statistics, in milliseconds."""
+
+    def __init__(self, size: int = LATENCY_SAMPLES):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+
+    def record(self, latency_ms: float):
+        """Add one latency sample."""
+        self.samples.append(latency_ms)
+        self.count += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a percentile of the recent samples, or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self) -> dict:
+        """Return the event count and the p50, p95 and max of the recent latencies."""
+        return {
+            "events": self.count,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": max(self.samples) if self.samples else None,
+        }
+
+
+class ButtonEventQueue:
+    """Debounce button presses and hand them over to the main thread."""
+
+    def __init__(self, debounce_ms: float = DEBOUNCE_MS):
+        self.debounce = debounce_ms / 1000.0
+        self.events = queue.SimpleQueue()
+        self.stats = LatencyStats()
+        self.dropped = 0  # Presses rejected as contact bounce
+        self._last_press = {}
+        self._lock = threading.Lock()
+
+    def push(self, pin: int, timestamp: float = None) -> bool:
+        """Queue a press on *pin*; return False if it was dropped as a bounce."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            last = self._last_press.get(pin)
+            if last is not None and timestamp - last < self.debounce:
+                self.dropped += 1
+                return False
+            self._last_press[pin] = timestamp
+        self.events.put(ButtonEvent(pin, timestamp))
+        return True
+
+    def next_event(self) -> ButtonEvent | None:
+        """Return the oldest queued event without blocking, or None."""
+        try:
+            return self.events.get_nowait()
+        except queue.Empty:
+            return None
+
+    def drain(self) -> list[ButtonEvent]:
+        """Return every queued event, oldest first, without blocking."""
+        events = []
+        while (event := self.next_event()) is not None:
+            events.append(event)
+        return events
+
+    def handled(self, event: ButtonEvent):
+        """Record that an event has been handled."""
+        latency_ms = (time.monotonic() - event.timestamp) * 1000
+        self.stats.record(latency_ms)
+        logger.debug("Button %s handled after %.1f ms", event.pin, latency_ms)
@@ -1,10 +1,12 @@
 """LED strip controller for WS2812 addressable LEDs.
 
 Provides animation effects and scoring feedback for DuckQuest using PWM-controlled LEDs.
+Effects are played by a background animator (see animation.py), so none of the methods block,
+and reach the strip through a frame buffer with one show() per frame.
 """
 
-import time
-from rpi_ws281x import PixelStrip, Color
+from rpi_ws281x import PixelStrip
+from duckquest.hardware.animation import AnimatedStrip
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -19,7 +21,7 @@ LED_INVERT = False  # True to invert signal
 LED_CHANNEL = 0  # 0 for GPIO 18; 1 for GPIOs 13/19/41/45/53
 
 
-class LEDStripManager:
+class LEDStripManager(AnimatedStrip):
     """Control an LED strip connected via PWM."""
 
     def __init__(self):
@@ -35,59 +37,5 @@ class LEDStripManager:
             LED_CHANNEL,
         )
         self.strip.begin()
+        super().__init__(self.strip)
         logger.debug(f"LED strip initialized with {LED_COUNT} LEDs")
-
-    def set_pixel_color(self, pixel: int, color: tuple[int, int, int]):
-        """Set a single pixel color and update the strip."""
-        if not (0 <= pixel < self.strip.numPixels()):
-            logger.warning(f"Ignored invalid pixel index: {pixel}")
-            return
-        self.strip.setPixelColor(pixel, Color(*color))
-        self.strip.show()
-        logger.debug(f"Set pixel {pixel} to color {color}")
-
-    def set_all_pixels(self, color: tuple[int, int, int]):
-        """Set all pixels to the specified color."""
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, Color(*color))
-        self.strip.show()
-        logger.debug(f"Set all pixels to color {color}")
-
-    def score_effect(self, percentage: float = 1) -> tuple[int, int, int]:
-        """Display a progressive red-to-green effect based on percentage."""
-        logger.info(f"Starting score effect for {percentage*100:.1f}%")
-        pause = 60
-        color = (0, 0, 0)
-        steps = max(1, int(self.strip.numPixels() * percentage))
-        progress = 0.0
-
-        for i in range(steps):
-            color = (
-                int(255 * (1 - progress)),
-                int(255 * progress),
-                0,
-            )
-            self.strip.setPixelColor(i, Color(*color))
-            self.strip.show()
-            progress += percentage / steps
-            pause = max(10, pause - (i * percentage / 200))
-            time.sleep(pause / 1000.0)
-
-        logger.debug(f"Score effect completed with final color: {color}")
-        time.sleep(0.1)
-        return color
-
-    def blink(self, color: tuple[int, int, int], repetitions: int, wait_ms: float):
-        """Blink the whole strip in a specified color."""
-        logger.info(f"Blinking {repetitions}x with color {color}")
-        for _ in range(repetitions):
-            self.set_all_pixels(color)
-            time.sleep(wait_ms / 1000.0)
-            self.set_all_pixels((0, 0, 0))  # Turn off LEDs between blinks
-            time.sleep(wait_ms / 1000.0)
-        logger.debug("Blink sequence finished")
-
-    def clear(self):
-        """Turn off all LEDs."""
-        logger.info("Clearing LED strip")
-        self.set_all_pixels((0, 0, 0))
@@ -3,36 +3,88 @@
 Provides dummy implementations of ButtonManager and LEDStripManager for development and testing.
 """
 
+import threading
+import time
+from duckquest.hardware.animation import AnimatedStrip
+from duckquest.hardware.input_events import ButtonEventQueue
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+LED_COUNT = 144  # Same length as the real strip
+
 
 class ButtonManager:
     """Mock ButtonManager for non-Raspberry Pi systems."""
 
     def __init__(self, pins):
+        self.pins = pins
+        self.events = ButtonEventQueue()
         logger.info(f"[MOCK] ButtonManager initialized with pins: {pins}")
 
+    def inject(self, pin: int, timestamp: float = None) -> bool:
+        """Simulate a press on *pin*, from any thread, like the GPIO edge callback."""
+        logger.debug(f"[MOCK] Press injected on pin {pin}")
+        return self.events.push(pin, timestamp)
+
+    def poll_events(self) -> list:
+        return self.events.drain()
+
     def get_pressed_button(self):
-        logger.debug("[MOCK] get_pressed_button() called")
-        return None
+        event = self.events.next_event()
+        return None if event is None else event.pin
 
     def cleanup(self):
         logger.info("[MOCK] ButtonManager cleanup called")
 
 
-class LEDStripManager:
-    """Mock LEDStripManager for non-Raspberry Pi systems."""
+class MockStrip:
+    """Fake rpi_ws281x PixelStrip that records what would be shown."""
+
+    def __init__(self, num_pixels: int = LED_COUNT, clock=time.monotonic):
+        self.colors = [0] * num_pixels  # Packed colors, as set by setPixelColor
+        self.pending = {}
+        self.timeline = []  # (clock(), {pixel: packed color}) per show()
+        self.clock = clock
+        self.set_calls = 0
+        self._lock = threading.Lock()
+
+    def numPixels(self) -> int:
+        return len(self.colors)
+
+    def setPixelColor(self, pixel: int, color: int):
+        self.set_calls += 1
+        self.pending[pixel] = color
+
+    def show(self):
+        with self._lock:
+            self.colors = list(self.colors)
+            for pixel, color in self.pending.items():
+                self.colors[pixel] = color
+            self.timeline.append((self.clock(), self.pending))
+            self.pending = {}
+
+
+class LEDStripManager(AnimatedStrip):
+    """Mock LEDStripManager for non-Raspberry Pi systems.
+
+    Frames are shown on a MockStrip, which records each show() with its time in
+    `timeline`, so effect timing can be checked in tests. A virtual *clock* and *sleep*
+    make that timeline independent of the machine's load.
+    """
 
-    def clear(self):
-        logger.info("[MOCK] LED Strip cleared")
+    def __init__(self, num_pixels: int = LED_COUNT, clock=time.monotonic, sleep=None):
+        super().__init__(MockStrip(num_pixels, clock), clock=clock, sleep=sleep)
+        logger.info(f"[MOCK] LEDStripManager initialized with {num_pixels} LEDs")
 
-    def blink(self, color, times, delay):
-        logger.info(
-            f"[MOCK] Blinking LED {times} times with color {color}, delay {delay}"
-        )
+    @property
+    def timeline(self) -> list:
+        return self.strip.timeline
 
-    def score_effect(self, score):
-        logger.info(f"[MOCK] score_effect called with score: {score}")
-        return "[MOCK] Score effect color"
+    @property
+    def pixels(self) -> list:
+        """Colors shown on the strip, as RGB tuples."""
+        return [
+            ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+            for color in self.strip.colors
+        ]
@@ -1,14 +1,58 @@
-"""Main entry point to launch the DuckQuest game."""
+"""Main entry point to launch the DuckQuest game.
 
+Only tkinter is imported before the window appears: the splash screen is shown first, and
+the game (matplotlib, networkx, numpy) is imported on a background thread meanwhile.
+
+With --profile, a sampling profiler runs for the whole session. Its collapsed stacks are
+written to logs/profiles/ when the game exits, and on every press of F5. With --record,
+every game action is written to a session file in logs/sessions/ for later replay.
+"""
+
+import argparse
 import platform
-from duckquest.utils.helpers import is_raspberry_pi
+import tkinter as tk
+from duckquest.splash import SplashScreen
+from duckquest.utils.helpers import BackgroundImport, is_raspberry_pi
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)  # Initialize module-level logger
 
+SPLASH_POLL_MS = 100  # How often the splash checks whether the game modules are loaded
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Launch the DuckQuest game.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample the stacks of every thread and write a flame graph profile",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=10,
+        metavar="MS",
+        help="Time between two profiler samples (default: 10 ms)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record every game action to logs/sessions/ for scripts.replay",
+    )
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv: list[str] = None):
     """Initialize and start the DuckQuest game."""
+    args = parse_args(argv)
+    profiler = None
+    if args.profile:
+        from duckquest.utils.profiler import SamplingProfiler
+
+        profiler = SamplingProfiler(args.profile_interval)
+        profiler.start()
+
     OS_NAME = platform.system()
     ON_RASPBERRY_PI = is_raspberry_pi()
 
@@ -22,17 +66,46 @@ def main():
         )
 
     try:
-        from duckquest.game_manager import GameManager
+        root = tk.Tk()
+        if profiler:
+            root.bind("<F5>", lambda event: profiler.write())
+        splash = SplashScreen(root)
+        loader = BackgroundImport("duckquest.game_manager")
+        started = {}  # Game instance, or the error that stopped it from starting
+
+        def start_when_loaded():
+            """Build the game once its modules are imported, keeping the splash alive."""
+            if not loader.done:
+                splash.tick()
+                root.after(SPLASH_POLL_MS, start_when_loaded)
+                return
+            try:
+                GameManager = loader.module().GameManager
+                splash.close()
+                logger.debug("Instantiating GameManager")
+                started["game"] = GameManager(
+                    ON_RASPBERRY_PI, root=root, record=args.record
+                )
+                logger.info("GameManager instantiated")
+            except Exception as e:
+                # Tk would only print errors raised in callbacks: stop and re-raise below
+                started["error"] = e
+                root.quit()
 
-        logger.debug("Instantiating GameManager")
-        game = GameManager(ON_RASPBERRY_PI)
-        logger.info("GameManager instantiated, launching mainloop.")
-        game.root.mainloop()
+        root.after(SPLASH_POLL_MS, start_when_loaded)
+        logger.info("Splash screen shown, launching mainloop.")
+        root.mainloop()
+        if "error" in started:
+            raise started["error"]
         logger.info("Main loop terminated cleanly.")
 
     except Exception as e:
         logger.critical(f"Unhandled exception in main: {e}", exc_info=True)
         raise
+    finally:
+        if profiler:
+            profiler.stop()
+            profiler.write()
 
 
 if __name__ == "__main__":
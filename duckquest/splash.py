@@ -0,0 +1,45 @@
+"""Splash screen shown while the game loads.
+
+Only depends on tkinter, so it can be on screen before matplotlib, networkx and numpy are
+imported.
+"""
+
+import tkinter as tk
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BACKGROUND = "#282C34"
+TITLE_STYLE = {"bg": BACKGROUND, "fg": "white", "font": ("Arial", 40, "bold")}
+STATUS_STYLE = {"bg": BACKGROUND, "fg": "#61AFEF", "font": ("Arial", 15, "bold")}
+
+
+class SplashScreen:
+    """Title and loading message displayed in the main window during startup."""
+
+    def __init__(self, root: tk.Tk, status: str = "Loading"):
+        self.root = root
+        self.root.title("DuckQuest - Game Modelling")
+        self.root.configure(bg=BACKGROUND)
+        self.frame = tk.Frame(root, bg=BACKGROUND)
+        self.frame.pack(expand=True, fill=tk.BOTH)
+        tk.Label(self.frame, text="DuckQuest", **TITLE_STYLE).pack(
+            expand=True, anchor=tk.S
+        )
+        self.status = status
+        self.status_label = tk.Label(self.frame, text=status, **STATUS_STYLE)
+        self.status_label.pack(expand=True, anchor=tk.N)
+        self._dots = 0
+        # Paint now: the main loop is not running yet
+        self.root.update()
+        logger.debug("Splash screen displayed")
+
+    def tick(self):
+        """Animate the loading message to show the game is not frozen."""
+        self._dots = (self._dots + 1) % 4
+        self.status_label.config(text=self.status + "." * self._dots)
+
+    def close(self):
+        """Remove the splash screen from the window."""
+        self.frame.destroy()
+        logger.debug("Splash screen closed")
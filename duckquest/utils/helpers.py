@@ -1,5 +1,8 @@
 """Helper functions for system detection and environment checks."""
 
+import importlib
+import threading
+
 
 def is_raspberry_pi():
     """Detect if the script is running on a Raspberry Pi."""
@@ -8,3 +11,34 @@ def is_raspberry_pi():
             return "Raspberry Pi" in f.read()
     except Exception:
         return False
+
+
+class BackgroundImport:
+    """Import a module on a worker thread while the caller keeps the UI responsive."""
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self._module = None
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._load, name=f"import-{module_name}", daemon=True
+        )
+        self._thread.start()
+
+    def _load(self):
+        try:
+            self._module = importlib.import_module(self.module_name)
+        except BaseException as e:  # Re-raised in the caller's thread by module()
+            self._error = e
+
+    @property
+    def done(self) -> bool:
+        """Return True once the import has finished, successfully or not."""
+        return not self._thread.is_alive()
+
+    def module(self):
+        """Wait for the import and return the module, re-raising any import error."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._module
@@ -1,11 +1,18 @@
 """Structured logging setup for the DuckQuest project.
 
 Configures a logger that outputs to both the console and a rotating log file, with different logging levels for each output.
+
+Loggers never write to the console or the SD card themselves: they push records into one
+bounded queue, and a background listener thread formats them and writes them out. When the
+queue is full, new DEBUG and INFO records are dropped and counted, while warnings and errors
+replace the oldest queued record; the listener logs how many records were lost.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
@@ -13,16 +20,90 @@ os.makedirs(LOG_DIR, exist_ok=True)
 
 LOG_FILE_PATH = os.path.join(LOG_DIR, "duck_quest.log")
 
+# Records waiting for the listener thread before the drop policy applies
+LOG_QUEUE_SIZE = int(os.environ.get("DUCKQUEST_LOG_QUEUE_SIZE", 10_000))
+# Level of every DuckQuest logger; INFO skips building DEBUG records altogether
+LOG_LEVEL = os.environ.get("DUCKQUEST_LOG_LEVEL", "DEBUG").upper()
 
-def setup_logger(name: str) -> logging.Logger:
-    """Configure and return a structured logger instance."""
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the calling thread."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments; timestamps and layout are left to the listener."""
+        # Updated in place rather than copied: handlers further up see the same message
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks hold frames alive: turn them into text right away
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno < logging.WARNING:
+                self.dropped += 1
+                return
+            # Make room for the warning by dropping the oldest record
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+
+class DropReportingListener(QueueListener):
+    """Queue listener that reports records dropped by the handler."""
 
-    if logger.hasHandlers():
-        return logger
+    def __init__(self, handler: DroppingQueueHandler, *handlers: logging.Handler):
+        super().__init__(handler.queue, *handlers, respect_handler_level=True)
+        self.source = handler
+        self.reported = 0
 
+    def handle(self, record: logging.LogRecord) -> None:
+        dropped = self.source.dropped
+        if dropped != self.reported:
+            super().handle(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": f"{dropped - self.reported} log records dropped, "
+                        f"queue full ({self.queue.maxsize} records)",
+                    }
+                )
+            )
+            self.reported = dropped
+        super().handle(record)
+
+    def start(self) -> None:
+        super().start()
+        self._thread.name = "log-listener"  # Shown by thread dumps and the profiler
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: the listener is still draining the queue
+        self.queue.put(self._sentinel)
+
+
+def _output_handlers(rotate: bool = True) -> list[logging.Handler]:
+    """Build the console and file handlers run by the listener thread.
+
+    Only the main process rotates the log file: forked workers append to it with
+    rotate=False, so that two processes never rename the same files.
+    """
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -34,13 +115,79 @@ def setup_logger(name: str) -> logging.Logger:
     console_handler.setFormatter(formatter)
 
     # File handler
-    file_handler = RotatingFileHandler(
-        LOG_FILE_PATH, maxBytes=5_000_000, backupCount=3, encoding="utf-8"
-    )
+    if rotate:
+        file_handler = RotatingFileHandler(
+            LOG_FILE_PATH, maxBytes=5_000_000, backupCount=3, encoding="utf-8"
+        )
+    else:
+        file_handler = logging.FileHandler(LOG_FILE_PATH, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    return [console_handler, file_handler]
+
+
+_queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+_listener = None
+
+
+def _start_listener() -> DropReportingListener:
+    """Start the listener thread the first time a logger is set up."""
+    global _listener
+    if _listener is None:
+        _listener = DropReportingListener(_queue_handler, *_output_handlers())
+        _listener.start()
+    return _listener
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written out."""
+    if _listener is not None:
+        _queue_handler.queue.join()
+        for handler in _listener.handlers:
+            handler.flush()
+
+
+def stop_logging() -> None:
+    """Write out the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _after_fork() -> None:
+    """Give a forked child its own queue, listener and handlers.
+
+    The parent's listener thread is not copied, and its handlers stay with the parent: a
+    child writing through the parent's RotatingFileHandler could rotate the log file
+    under it.
+    """
+    global _listener
+    if _listener is not None:
+        _queue_handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+        _queue_handler.dropped = 0
+        _listener = DropReportingListener(
+            _queue_handler, *_output_handlers(rotate=False)
+        )
+        _listener.start()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """Configure and return a structured logger instance."""
+
+    logger = logging.getLogger(name)
+    logger.setLevel(LOG_LEVEL)
+
+    if _queue_handler not in logger.handlers:
+        _start_listener()
+        logger.addHandler(_queue_handler)
 
     return logger
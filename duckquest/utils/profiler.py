@@ -0,0 +1,186 @@
+"""Sampling profiler for the running game.
+
+A background thread takes a snapshot of every thread's Python stack with
+sys._current_frames() at a fixed interval and counts identical stacks. Nothing is hooked
+into the profiled code, so the cost is the sampling itself (well under a millisecond per
+sample) and every thread is covered: the Tk main loop, the LED animation thread and the
+logging listener.
+
+Results are written in the collapsed-stack format read by flamegraph.pl, speedscope and
+similar tools: one line per distinct stack, "thread;outer frame;...;inner frame count".
+Each sample is also attributed to a component of the game (renderer, logic, LED effects,
+logging, idle) for a quick summary in the log.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from duckquest.utils.logger import LOG_DIR, PROJECT_ROOT, setup_logger
+
+logger = setup_logger(__name__)
+
+PROFILE_DIR = os.path.join(LOG_DIR, "profiles")
+DEFAULT_INTERVAL_MS = 10
+
+# Component of a frame, by source path; the first rule that matches wins
+COMPONENT_RULES = [
+    ("logging", (os.sep + "logging" + os.sep, os.path.join("utils", "logger.py"))),
+    (
+        "renderer",
+        (
+            os.path.join("graph", "renderer.py"),
+            os.path.join("graph", "ui.py"),
+            os.path.join("graph", "help.py"),
+            os.sep + "matplotlib" + os.sep,
+        ),
+    ),
+    (
+        "logic",
+        (os.path.join("duckquest", "graph") + os.sep, os.sep + "networkx" + os.sep),
+    ),
+    ("led", (os.path.join("duckquest", "hardware") + os.sep,)),
+]
+# Innermost frames of a thread that is waiting rather than working
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("__init__.py", "mainloop"),  # tkinter
+}
+
+
+def frame_label(code) -> str:
+    """Return the flame graph label of a code object: function (file:line)."""
+    filename = code.co_filename
+    if filename.startswith(PROJECT_ROOT):
+        filename = os.path.relpath(filename, PROJECT_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def component(stack: tuple) -> str:
+    """Return the game component a stack (outermost frame first) is spending time in."""
+    leaf = stack[-1]
+    if (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_FRAMES:
+        return "idle"
+    for code in reversed(stack):
+        for name, patterns in COMPONENT_RULES:
+            if any(pattern in code.co_filename for pattern in patterns):
+                return name
+    return "other"
+
+
+class SamplingProfiler:
+    """Count the Python stacks of every thread, sampled at a fixed interval."""
+
+    def __init__(self, interval_ms: float = DEFAULT_INTERVAL_MS):
+        self.interval = interval_ms / 1000.0
+        # (thread name, code objects outermost first) -> samples
+        self.stacks = Counter()
+        self.samples = 0
+        self.started = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        interval_ms = self.interval * 1000
+        logger.info("Sampling profiler started (%.0f ms interval)", interval_ms)
+
+    def stop(self) -> None:
+        """Stop sampling; the samples are kept."""
+        if self.running:
+            self._stop.set()
+            self._thread.join()
+            logger.info("Sampling profiler stopped after %s samples", self.samples)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread but the profiler's own."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        frames = sys._current_frames()
+        stacks = []
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            stacks.append((names.get(ident, f"thread-{ident}"), tuple(stack)))
+        del frames
+        with self._lock:
+            self.stacks.update(stacks)
+            self.samples += 1
+
+    def collapsed(self) -> list[str]:
+        """Return the samples in collapsed-stack format, most frequent stacks first."""
+        with self._lock:
+            stacks = self.stacks.most_common()
+        labels = {}
+        lines = []
+        for (thread, stack), count in stacks:
+            frames = [thread]
+            for code in stack:
+                if code not in labels:
+                    labels[code] = frame_label(code)
+                frames.append(labels[code])
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+    def components(self) -> dict[str, int]:
+        """Return the number of thread samples spent in each component."""
+        totals = Counter()
+        with self._lock:
+            stacks = list(self.stacks.items())
+        for (_, stack), count in stacks:
+            if stack:
+                totals[component(stack)] += count
+        return dict(totals.most_common())
+
+    def write(self, path: str = None) -> str:
+        """Write the collapsed stacks and log the summary by component; return the path."""
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(PROFILE_DIR, f"profile_{stamp}.folded")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        lines = self.collapsed()
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n" if lines else "")
+        elapsed = time.monotonic() - self.started if self.started else 0
+        logger.info(
+            "Profile of %s samples over %.0f s written to %s",
+            self.samples,
+            elapsed,
+            path,
+        )
+
+        totals = self.components()
+        busy = sum(count for name, count in totals.items() if name != "idle")
+        for name, count in totals.items():
+            if name != "idle":
+                share = count / busy
+                logger.info(
+                    "%-9s %7s samples (%.1f%% of busy time)", name, count, 100 * share
+                )
+        if "idle" in totals:
+            logger.info("%-9s %7s samples", "idle", totals["idle"])
+        return path
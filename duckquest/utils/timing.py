@@ -0,0 +1,234 @@
+"""Latency histograms of the game's hot paths.
+
+Named spans (a button action, a canvas draw, an LED frame...) are timed into log-linear
+histograms in the style of HdrHistogram: durations are counted to the microsecond below
+SUB_BUCKETS us, and every power of two above is split into SUB_BUCKETS / 2 buckets. A
+recorded duration keeps about 1.6 % of precision whatever its magnitude, and recording is
+one bit_length() and an increment.
+
+Timing is off by default. While off, `timed` functions call straight through after one
+attribute check and `span()` returns a shared no-op context manager. It is switched on by
+the DUCKQUEST_TIMINGS environment variable or at runtime (the F3 debug overlay).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from duckquest.utils.logger import LOG_DIR, setup_logger
+
+logger = setup_logger(__name__)
+
+TIMING_DIR = os.path.join(LOG_DIR, "timings")
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF = SUB_BUCKETS // 2  # Buckets per power of two above SUB_BUCKETS us
+INPUT_BUDGET_MS = 50  # Target time from a button press to the updated display
+
+_NO_SPAN = nullcontext()
+
+
+def bucket_index(value: int) -> int:
+    """Return the histogram bucket of a non-negative integer value."""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    # value >> shift keeps the SUB_BUCKET_BITS leading bits, the top one always set
+    return SUB_BUCKETS + (shift - 1) * HALF + (value >> shift) - HALF
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the lowest and highest value counted in a bucket."""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift, offset = divmod(index - SUB_BUCKETS, HALF)
+    shift += 1
+    low = (HALF + offset) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations in microseconds."""
+
+    def __init__(self):
+        self.counts = {}  # Bucket index -> count; only buckets that were hit
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()  # Spans are also recorded by the LED thread
+
+    def record(self, value_us: int) -> None:
+        """Add one duration, in whole microseconds."""
+        index = bucket_index(value_us)
+        with self._lock:
+            self.counts[index] = self.counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value_us
+            if self.min is None or value_us < self.min:
+                self.min = value_us
+            if self.max is None or value_us > self.max:
+                self.max = value_us
+
+    def _buckets(self) -> list[tuple[int, int]]:
+        """Return a snapshot of the (bucket index, count) pairs, in bucket order."""
+        with self._lock:
+            return sorted(self.counts.items())
+
+    def percentile(self, fraction: float) -> int | None:
+        """Return the upper bound of the bucket holding a percentile, or None if empty."""
+        if not self.count:
+            return None
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, count in self._buckets():
+            seen += count
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def fraction_below(self, limit_us: int) -> float | None:
+        """Return the share of durations at or under *limit_us* (to bucket precision)."""
+        if not self.count:
+            return None
+        below = sum(
+            count
+            for index, count in self._buckets()
+            if bucket_bounds(index)[1] <= limit_us
+        )
+        return below / self.count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram."""
+        with self._lock:
+            for index, count in other.counts.items():
+                self.counts[index] = self.counts.get(index, 0) + count
+            self.count += other.count
+            self.total += other.total
+            for bound in (other.min, other.max):
+                if bound is not None:
+                    self.min = bound if self.min is None else min(self.min, bound)
+                    self.max = bound if self.max is None else max(self.max, bound)
+
+    def summary(self) -> dict:
+        """Return the count, mean, percentiles and extremes, in milliseconds."""
+
+        def ms(value):
+            return None if value is None else value / 1000
+
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.total / self.count) if self.count else None,
+            "min_ms": ms(self.min),
+            "p50_ms": ms(self.percentile(0.5)),
+            "p90_ms": ms(self.percentile(0.9)),
+            "p99_ms": ms(self.percentile(0.99)),
+            "p999_ms": ms(self.percentile(0.999)),
+            "max_ms": ms(self.max),
+        }
+
+    def to_dict(self) -> dict:
+        """Return the summary and the non-empty buckets, keyed by their lowest value."""
+        data = self.summary()
+        data["buckets_us"] = {
+            str(bucket_bounds(index)[0]): count for index, count in self._buckets()
+        }
+        return data
+
+
+class Timings:
+    """Registry of named latency histograms."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Return the histogram of a span, created on first use."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """Add a duration in nanoseconds to a span."""
+        self.histogram(name).record(duration_ns // 1000)
+
+    def span(self, name: str):
+        """Return a context manager timing its block into *name*, if timing is on."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def reset(self) -> None:
+        """Forget every recorded duration."""
+        self.histograms = {}
+
+    def report(self) -> dict:
+        """Return the summary of every span, by name."""
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.histograms.items())
+        }
+
+    def dump(self, path: str = None) -> str:
+        """Write every histogram to a JSON file and return its path."""
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(TIMING_DIR, f"timings_{stamp}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {
+            "created": time.time(),
+            "input_budget_ms": INPUT_BUDGET_MS,
+            "spans": {
+                name: histogram.to_dict()
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        logger.info(f"Timings of {len(self.histograms)} spans written to {path}")
+        return path
+
+
+class _Span:
+    """Context manager recording the time spent in its block."""
+
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings: Timings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+# Process-wide registry used by the game
+timings = Timings(enabled=os.environ.get("DUCKQUEST_TIMINGS", "") not in ("", "0"))
+
+
+def timed(name: str):
+    """Decorator timing every call of a function into the span *name*."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not timings.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.record(name, time.perf_counter_ns() - start)
+
+        return wrapper
+
+    return decorate
@@ -19,8 +19,10 @@ common_requirements = [
     "black==23.10.1",
     "matplotlib~=3.10",
     "networkx~=3.4",
+    "numpy>=1.26",
     "pygame~=2.6",
     "pytest~=8.0",
+    "pytest-benchmark~=5.1",
 ]
 
 # Add Raspberry Pi-specific dependencies if necessary
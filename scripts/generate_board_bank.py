@@ -0,0 +1,70 @@
+"""Script to pre-generate board banks for the DuckQuest game.
+
+Draws random candidate boards for each difficulty level, keeps the ones with a unique optimal
+path and a large enough gap between a greedy walk and the optimal cost, and writes them to
+the board bank directory loaded by the game at startup.
+"""
+
+import argparse
+import time
+from duckquest.graph.bank import BANK_DIR, bank_path, write_bank
+from duckquest.graph.manager import WEIGHTS_MAP, GraphManager
+from duckquest.graph.tuning import AcceptanceCriteria, generate_boards
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--difficulty",
+        type=int,
+        nargs="*",
+        default=sorted(WEIGHTS_MAP),
+        help="Difficulty levels to generate (default: all)",
+    )
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-tied-paths", type=int, default=1)
+    parser.add_argument("--min-greedy-gap", type=int, default=2)
+    parser.add_argument("--output", default=BANK_DIR)
+    return parser.parse_args()
+
+
+def run_generator() -> None:
+    """Main entry point to generate the board banks."""
+    args = parse_args()
+    topology = GraphManager(backend="compact").topology_hash
+    criteria = AcceptanceCriteria(
+        max_tied_paths=args.max_tied_paths, min_greedy_gap=args.min_greedy_gap
+    )
+    for difficulty in args.difficulty:
+        start = time.perf_counter()
+        weights, costs, paths = generate_boards(
+            difficulty,
+            args.candidates,
+            criteria,
+            workers=args.workers,
+            seed=args.seed,
+        )
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Difficulty {difficulty}: {len(weights)} boards accepted in {elapsed:.1f}s "
+            f"({args.candidates / elapsed:,.0f} candidates/s)"
+        )
+        if len(weights):
+            write_bank(
+                bank_path(difficulty, args.output),
+                difficulty,
+                topology,
+                weights,
+                costs,
+                paths,
+            )
+
+
+if __name__ == "__main__":
+    run_generator()
@@ -0,0 +1,86 @@
+"""Profile the cold-start import time of DuckQuest modules.
+
+Runs a fresh interpreter with `python -X importtime`, parses the per-module timings it
+prints and reports the total and the slowest imports. The startup test uses the same
+functions to keep the time before the splash screen appears under a budget.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import NamedTuple
+from duckquest.utils.logger import PROJECT_ROOT, setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ImportRecord(NamedTuple):
+    """One line of -X importtime output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level: 0 for modules imported directly by the profiled code
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the stderr of `python -X importtime`."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # One space after the separator, then two more per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(
+            ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return records
+
+
+def profile_import(module: str) -> list[ImportRecord]:
+    """Import *module* in a fresh interpreter and return its import timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def cold_start_ms(records: list[ImportRecord], module: str) -> float:
+    """Return the time spent importing *module* and its parent packages, in ms.
+
+    Interpreter startup imports (encodings, site...) are left out.
+    """
+    return (
+        sum(
+            record.cumulative_us
+            for record in records
+            if record.depth == 0
+            and (record.module == module or module.startswith(record.module + "."))
+        )
+        / 1000
+    )
+
+
+def run_profile(module: str = "duckquest.main", top: int = 15) -> None:
+    """Main entry point to print the import profile of a module."""
+    records = profile_import(module)
+    logger.info(f"Cold import of {module}: {cold_start_ms(records, module):.1f} ms")
+    logger.info("Slowest imports (cumulative):")
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        logger.info(
+            f"{record.cumulative_us / 1000:8.1f} ms | self {record.self_us / 1000:6.1f} ms"
+            f" | {record.module}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="duckquest.main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    run_profile(args.module, args.top)
@@ -0,0 +1,127 @@
+"""Count the strip writes made by each LED effect.
+
+Plays every effect on a fake strip twice: once the way LEDStripManager used to drive the
+strip (show() after every pixel step or fill), and once through the frame buffer and the
+animator, with a virtual clock so the run takes no real time. No Raspberry Pi is required.
+"""
+
+import logging
+from duckquest.hardware.animation import Animator
+from duckquest.hardware.effects import (
+    BLACK,
+    Frame,
+    _score_steps,
+    blink_frames,
+    fill_frames,
+    score_frames,
+)
+from duckquest.hardware.framebuffer import MAX_FPS, FrameBuffer, pack_color
+from duckquest.hardware.mock import LED_COUNT, MockStrip
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SCORE_COLOR = (204, 51, 0)
+
+
+class VirtualClock:
+    """Clock whose sleep() returns at once and moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> bool:
+        self.now += seconds
+        return False  # Never cancelled
+
+
+def legacy_effects() -> dict:
+    """Return the effects as the old LEDStripManager drove them, one show() per step."""
+
+    def fill(strip, color):
+        for i in range(strip.numPixels()):
+            strip.setPixelColor(i, pack_color(*color))
+        strip.show()
+
+    def score(strip):
+        for i, (color, _) in enumerate(_score_steps(strip.numPixels(), 1)):
+            strip.setPixelColor(i, pack_color(*color))
+            strip.show()
+
+    def blink(strip):
+        for _ in range(5):
+            fill(strip, SCORE_COLOR)
+            fill(strip, BLACK)
+
+    def wipe(strip):
+        # set_pixel_color called once per pixel
+        for i in range(strip.numPixels()):
+            strip.setPixelColor(i, pack_color(*SCORE_COLOR))
+            strip.show()
+
+    return {
+        "score": score,
+        "blink x5": blink,
+        "clear": lambda strip: fill(strip, BLACK),
+        "pixel wipe": wipe,
+    }
+
+
+def frame_effects() -> dict:
+    """Return the same effects as frame generators."""
+    return {
+        "score": lambda: score_frames(LED_COUNT, 1),
+        "blink x5": lambda: blink_frames(LED_COUNT, SCORE_COLOR, 5, 200),
+        "clear": lambda: fill_frames(LED_COUNT, BLACK),
+        "pixel wipe": lambda: (Frame([(i, SCORE_COLOR)]) for i in range(LED_COUNT)),
+    }
+
+
+def count_framebuffer(effect, lit: bool) -> tuple[int, int]:
+    """Play an effect through the animator; return (show, setPixelColor) calls."""
+    strip = MockStrip(LED_COUNT)
+    framebuffer = FrameBuffer(strip, MAX_FPS)
+    if lit:
+        framebuffer.update([(i, SCORE_COLOR) for i in range(LED_COUNT)])
+        framebuffer.flush(now=-1.0)
+        strip.timeline.clear()
+        strip.set_calls = 0
+    clock = VirtualClock()
+    animator = Animator(framebuffer, clock=clock, sleep=clock.sleep)
+    animator.play(effect())
+    animator.wait()
+    animator.stop()
+    return len(strip.timeline), strip.set_calls
+
+
+def count_legacy(effect) -> tuple[int, int]:
+    """Run an effect the old way; return (show, setPixelColor) calls."""
+    strip = MockStrip(LED_COUNT)
+    effect(strip)
+    return len(strip.timeline), strip.set_calls
+
+
+def run_benchmark() -> None:
+    """Main entry point to compare strip writes per effect."""
+    logging.disable(logging.INFO)
+    legacy = {name: count_legacy(effect) for name, effect in legacy_effects().items()}
+    buffered = {
+        name: count_framebuffer(effect, lit=name == "clear")
+        for name, effect in frame_effects().items()
+    }
+    logging.disable(logging.NOTSET)
+
+    logger.info(f"Strip writes per effect ({LED_COUNT} LEDs, {MAX_FPS} FPS cap):")
+    logger.info(f"{'effect':<12} {'show() before':>14} {'after':>6} | setPixelColor")
+    for name, (shows, sets) in legacy.items():
+        new_shows, new_sets = buffered[name]
+        logger.info(
+            f"{name:<12} {shows:>14} {new_shows:>6} | {sets:>5} -> {new_sets:<5}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,119 @@
+"""Benchmark the per-call cost of a log statement on the calling thread.
+
+Logs the same DEBUG message, a node and its neighbors as GraphManager.neighbors does, through:
+
+- "synchronous": the former setup, a RotatingFileHandler writing and flushing every record
+  on the calling thread, with an f-string built before the call;
+- "queued": the bounded queue of duckquest.utils.logger, with lazy %-style arguments; the
+  file is written by the listener thread;
+- "disabled": a logger above DEBUG, where a lazy call returns after the level check.
+
+Log files go to a temporary directory, so the real log is left untouched.
+"""
+
+import logging
+import os
+import queue
+import statistics
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from duckquest.utils.logger import (
+    DropReportingListener,
+    DroppingQueueHandler,
+    setup_logger,
+)
+
+logger = setup_logger(__name__)
+
+NODE = "F4"
+NEIGHBORS = ["E3", "E5", "G3", "G5", "F2", "F6"]
+
+
+def _file_handler(directory: str, name: str) -> logging.Handler:
+    """Return a file handler formatted like the game's log file."""
+    handler = RotatingFileHandler(
+        os.path.join(directory, name), maxBytes=5_000_000, backupCount=3
+    )
+    handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    return handler
+
+
+def _bench_logger(name: str, handler: logging.Handler, level: int) -> logging.Logger:
+    """Return a logger that only writes to *handler*."""
+    bench = logging.getLogger(f"{__name__}.{name}")
+    bench.handlers.clear()
+    bench.propagate = False
+    bench.setLevel(level)
+    bench.addHandler(handler)
+    return bench
+
+
+def measure(call, calls: int) -> list[float]:
+    """Return the time in microseconds of each call."""
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def summarize(label: str, timings: list[float]) -> None:
+    """Log mean and percentile costs."""
+    ordered = sorted(timings)
+    p99 = ordered[int(0.99 * (len(ordered) - 1))]
+    logger.info(
+        f"{label:<12} mean {statistics.mean(timings):7.2f} us | "
+        f"median {statistics.median(timings):7.2f} us | p99 {p99:8.2f} us"
+    )
+
+
+def run_benchmark(calls: int = 20_000) -> None:
+    """Main entry point to compare synchronous, queued and disabled logging."""
+    with tempfile.TemporaryDirectory() as directory:
+        sync_handler = _file_handler(directory, "sync.log")
+        sync = _bench_logger("sync", sync_handler, logging.DEBUG)
+        synchronous = measure(
+            lambda: sync.debug(f"Neighbors of {NODE}: {NEIGHBORS}"), calls
+        )
+        sync_handler.close()
+
+        # Large enough that no record is dropped during the run
+        queue_handler = DroppingQueueHandler(queue.Queue(calls + 1))
+        listener = DropReportingListener(
+            queue_handler, _file_handler(directory, "queued.log")
+        )
+        listener.start()
+        queued_logger = _bench_logger("queued", queue_handler, logging.DEBUG)
+        queued = measure(
+            lambda: queued_logger.debug("Neighbors of %s: %s", NODE, NEIGHBORS), calls
+        )
+        start = time.perf_counter()
+        listener.stop()
+        drain_ms = (time.perf_counter() - start) * 1000
+        for handler in listener.handlers:
+            handler.close()
+
+        muted = _bench_logger("disabled", logging.NullHandler(), logging.INFO)
+        disabled = measure(
+            lambda: muted.debug("Neighbors of %s: %s", NODE, NEIGHBORS), calls
+        )
+
+    logger.info(f"Caller-side cost of one DEBUG record over {calls} calls:")
+    summarize("synchronous", synchronous)
+    summarize("queued", queued)
+    summarize("disabled", disabled)
+    logger.info(
+        f"Speed-up: {statistics.median(synchronous) / statistics.median(queued):.1f}x "
+        f"(listener drained the queue {drain_ms:.0f} ms after the last call)"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,82 @@
+"""Benchmark the per-press latency of the graph renderer.
+
+Compares a full redraw on every button press (the renderer is invalidated before each
+press, which is how every update used to be drawn) with the incremental dirty-region
+update. Runs on an offscreen Agg canvas, so no display or Raspberry Pi is required.
+"""
+
+import logging
+import statistics
+import time
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.renderer import GraphRenderer
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class BenchmarkGame:
+    """Minimal stand-in for GameManager without Tk or hardware."""
+
+    def __init__(self, difficulty: int = 6):
+        self.difficulty = difficulty
+        self.graph = GraphManager()
+        self.logic = GraphLogic(self)
+        self.graph_renderer = GraphRenderer(self)
+        self.figure, self.ax = plt.subplots(figsize=(12, 6))
+        self.graph_renderer.init_ui(self.ax, self.figure.canvas)
+        self.graph_renderer.display_user_path()
+
+    def next_node(self):
+        """Same state change as GameManager.next_node."""
+        self.logic.next_node()
+        self.graph_renderer.display_user_path()
+
+
+def measure(game: BenchmarkGame, presses: int, full_redraw: bool) -> list[float]:
+    """Return the latency in milliseconds of each simulated button press."""
+    timings = []
+    for _ in range(presses):
+        if full_redraw:
+            game.graph_renderer.invalidate()
+        start = time.perf_counter()
+        game.next_node()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(label: str, timings: list[float]) -> None:
+    """Log mean and percentile latencies."""
+    ordered = sorted(timings)
+    p95 = ordered[int(0.95 * (len(ordered) - 1))]
+    logger.info(
+        f"{label:<12} mean {statistics.mean(timings):7.2f} ms | "
+        f"median {statistics.median(timings):7.2f} ms | p95 {p95:7.2f} ms"
+    )
+
+
+def run_benchmark(presses: int = 50) -> None:
+    """Main entry point to compare full and incremental redraws."""
+    # Keep the per-press log lines out of the measurement
+    logging.disable(logging.INFO)
+    game = BenchmarkGame()
+    before = measure(game, presses, full_redraw=True)
+    after = measure(game, presses, full_redraw=False)
+    logging.disable(logging.NOTSET)
+
+    logger.info(f"Per-press latency over {presses} presses:")
+    summarize("full redraw", before)
+    summarize("incremental", after)
+    logger.info(
+        f"Speed-up: {statistics.median(before) / statistics.median(after):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
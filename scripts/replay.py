@@ -0,0 +1,72 @@
+"""Script to replay recorded game sessions headlessly and check that they play out the same.
+
+Feeds the events of session files from logs/sessions/ into GraphLogic at full speed and
+reports the replay speed, the latency of each action and every divergence from the
+recording. Exits with status 1 if a session diverged.
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+from duckquest.graph.recording import SESSION_DIR, read_session, replay_session
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "sessions",
+        nargs="*",
+        help="Session files or directories (default: the latest recorded session)",
+    )
+    parser.add_argument("--backend", choices=("networkx", "compact"), default="compact")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Replays of each session, for timing"
+    )
+    return parser.parse_args()
+
+
+def session_files(arguments: list[str]) -> list[str]:
+    """Expand the command line into session files, oldest first."""
+    if not arguments:
+        recorded = glob.glob(os.path.join(SESSION_DIR, "*.dqev"))
+        return sorted(recorded, key=os.path.getmtime)[-1:]
+    files = []
+    for argument in arguments:
+        if os.path.isdir(argument):
+            files.extend(sorted(glob.glob(os.path.join(argument, "*.dqev"))))
+        else:
+            files.append(argument)
+    return files
+
+
+def run_replay() -> None:
+    """Main entry point to replay the sessions."""
+    args = parse_args()
+    files = session_files(args.sessions)
+    if not files:
+        logger.error(f"No session to replay in {SESSION_DIR}")
+        sys.exit(1)
+
+    diverged = 0
+    for path in files:
+        session = read_session(path)
+        # Per-call log lines would dominate the measured latencies
+        logging.disable(logging.WARNING)
+        reports = [replay_session(session, args.backend) for _ in range(args.repeat)]
+        logging.disable(logging.NOTSET)
+        report = min(reports, key=lambda report: report.duration_s)
+        report.log(path)
+        diverged += bool(report.mismatches)
+
+    logger.info(f"{len(files)} sessions replayed, {diverged} diverged")
+    sys.exit(1 if diverged else 0)
+
+
+if __name__ == "__main__":
+    run_replay()
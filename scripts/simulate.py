@@ -0,0 +1,59 @@
+"""Script to play DuckQuest games headlessly and report throughput and score statistics.
+
+Runs the game logic without Tk, rendering or hardware, with simulated players, and is used
+as the regression benchmark of the game core.
+"""
+
+import argparse
+from duckquest.graph.layout import BOARD_KINDS, END_MODES, generate_board
+from duckquest.graph.manager import WEIGHTS_MAP
+from duckquest.graph.simulator import POLICIES, Simulator
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--policy",
+        nargs="*",
+        choices=sorted(POLICIES),
+        default=sorted(POLICIES),
+        help="Simulated players to run (default: all)",
+    )
+    parser.add_argument("--episodes", type=int, default=10_000)
+    parser.add_argument(
+        "--difficulty", type=int, choices=sorted(WEIGHTS_MAP), default=6
+    )
+    parser.add_argument("--backend", choices=("networkx", "compact"), default="compact")
+    parser.add_argument("--banks", action="store_true", help="Draw boards from banks")
+    parser.add_argument("--board", choices=BOARD_KINDS, default="classic")
+    parser.add_argument(
+        "--nodes", type=int, default=1000, help="Size of generated boards"
+    )
+    parser.add_argument("--ends", choices=END_MODES, default="left-right")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def run_simulation() -> None:
+    """Main entry point to run the simulations."""
+    args = parse_args()
+    layout = generate_board(args.board, args.nodes, args.ends, seed=args.seed)
+    simulator = Simulator(
+        difficulty=args.difficulty,
+        backend=args.backend,
+        use_banks=args.banks,
+        workers=args.workers,
+        max_steps=max(500, 4 * len(layout.nodes)),
+        layout=layout,
+    )
+    for policy in args.policy:
+        simulator.run(policy, args.episodes, seed=args.seed).log()
+
+
+if __name__ == "__main__":
+    run_simulation()
@@ -0,0 +1,202 @@
+"""pytest-benchmark suite for the graph renderer on an offscreen Agg canvas.
+
+Times a full redraw (display_graph after invalidate), an incremental button press update
+(display_user_path) and the shortest path highlight on the stock board and on generated
+boards, without Tk or a display. Each case records its frame rate and the peak Python
+memory allocated during one frame (tracemalloc, so Agg's own C++ buffers are not counted).
+The button press case also records its speed-up over the full redraw in the same run.
+
+Run with `python -m pytest tests/benchmarks --benchmark-only`. The 5k node board takes
+seconds per frame; set DUCKQUEST_LARGE_BENCHMARKS=1 to include it.
+
+Results are compared with renderer_baseline.json. Frame rates depend on the machine and
+are only logged; the peak memory and the speed-up do not, and can be checked anywhere.
+DUCKQUEST_RENDER_BASELINE selects what is done with the comparison:
+- unset: the ratios are only logged
+- "check": a case using more memory, or a button press gaining less over a full redraw,
+  than the baseline allows fails
+- "update": the measured values are written back to the baseline file
+DUCKQUEST_RENDER_TOLERANCE overrides the tolerances stored in the baseline (a fraction).
+"""
+
+import json
+import logging
+import os
+import statistics
+import tracemalloc
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from duckquest.graph.layout import generate_board
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.renderer import GraphRenderer
+from duckquest.utils.logger import setup_logger
+
+pytest.importorskip("pytest_benchmark")
+
+logger = setup_logger(__name__)
+
+LARGE = os.environ.get("DUCKQUEST_LARGE_BENCHMARKS") == "1"
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "renderer_baseline.json")
+BASELINE_MODE = os.environ.get("DUCKQUEST_RENDER_BASELINE", "")
+# Board name -> (generate_board kind, nodes, rounds per case)
+BOARDS = {
+    "stock": ("classic", 0, 20),
+    "500": ("delaunay", 500, 3),
+    "5k": ("delaunay", 5000, 2),
+}
+
+
+class RenderGame:
+    """Minimal stand-in for GameManager drawing a board on an Agg canvas."""
+
+    def __init__(self, kind: str, nodes: int, difficulty: int = 6):
+        self.difficulty = difficulty
+        layout = None if kind == "classic" else generate_board(kind, nodes, seed=0)
+        self.graph = GraphManager(layout=layout)
+        self.graph.assign_weights_and_colors(difficulty, seed=0)
+        self.logic = GraphLogic(self, seed=0)
+        self.graph_renderer = GraphRenderer(self)
+        self.figure = Figure(figsize=(12, 6))
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.graph_renderer.init_ui(self.figure.add_subplot(), self.canvas)
+        self.graph_renderer.display_user_path()
+        self.shortest_path = self.graph.shortest_path(
+            self.logic.start_node, self.logic.end_node
+        )
+
+
+def load_baseline() -> dict:
+    """Return the stored baseline, or an empty one."""
+    if not os.path.exists(BASELINE_PATH):
+        return {"tolerance": {"peak_kib": 0.25, "speedup": 0.5}, "cases": {}}
+    with open(BASELINE_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Measured cases by name; written to the baseline file in update mode."""
+    measured = {}
+    yield measured
+    if BASELINE_MODE == "update" and measured:
+        baseline = load_baseline()
+        baseline["cases"].update(measured)
+        baseline["cases"] = dict(sorted(baseline["cases"].items()))
+        with open(BASELINE_PATH, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+            file.write("\n")
+        logger.info(f"Renderer baseline of {len(measured)} cases written")
+
+
+@pytest.fixture(scope="module", params=list(BOARDS))
+def board(request):
+    """A rendered board, with its name and number of benchmark rounds."""
+    kind, nodes, rounds = BOARDS[request.param]
+    if nodes >= 5000 and not LARGE:
+        pytest.skip("Set DUCKQUEST_LARGE_BENCHMARKS=1 to run boards of 5k nodes")
+    logger.info(f"Building {request.param} board for the renderer benchmark")
+    return request.param, RenderGame(kind, nodes), rounds
+
+
+def peak_kib(setup, frame) -> float:
+    """Return the peak Python memory allocated while drawing one frame, in KiB."""
+    setup()
+    tracemalloc.start()
+    try:
+        frame()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(benchmark, results, board, case, setup, frame):
+    """Benchmark one kind of frame and compare it with the baseline."""
+    name, game, rounds = board
+    benchmark.group = f"{name} board"
+    # Keep the per-frame log lines out of the measurement
+    logging.disable(logging.INFO)
+    try:
+        benchmark.pedantic(frame, setup=setup, rounds=rounds, iterations=1)
+        if benchmark.stats is None:  # --benchmark-disable
+            return
+        memory = peak_kib(setup, frame)
+    finally:
+        logging.disable(logging.NOTSET)
+    measured = {
+        "fps": round(1 / statistics.median(benchmark.stats.stats.data), 2),
+        "peak_kib": round(memory),
+    }
+    full = results.get(f"{name}/display_graph")
+    if case == "display_user_path" and full is not None:
+        measured["speedup"] = round(measured["fps"] / full["fps"], 2)
+    benchmark.extra_info.update(measured)
+    key = f"{name}/{case}"
+    results[key] = measured
+
+    baseline = load_baseline()
+    expected = baseline["cases"].get(key)
+    if expected is None:
+        logger.info(f"{key}: {measured['fps']} fps, {measured['peak_kib']} KiB")
+        return
+    tolerance = dict(baseline["tolerance"])
+    if "DUCKQUEST_RENDER_TOLERANCE" in os.environ:
+        override = float(os.environ["DUCKQUEST_RENDER_TOLERANCE"])
+        tolerance = {metric: override for metric in tolerance}
+    fps_ratio = measured["fps"] / expected["fps"]
+    memory_ratio = measured["peak_kib"] / expected["peak_kib"]
+    logger.info(
+        f"{key}: {measured['fps']} fps ({fps_ratio:.0%} of baseline), "
+        f"{measured['peak_kib']} KiB ({memory_ratio:.0%} of baseline)"
+    )
+    gained = "speedup" in measured and "speedup" in expected
+    if gained:
+        logger.info(
+            f"{key}: {measured['speedup']}x faster than a full redraw "
+            f"(baseline {expected['speedup']}x)"
+        )
+    if BASELINE_MODE != "check":
+        return
+    assert memory_ratio <= 1 + tolerance["peak_kib"], f"{key} memory regressed"
+    if gained:
+        assert measured["speedup"] >= expected["speedup"] * (
+            1 - tolerance["speedup"]
+        ), f"{key} gains less over a full redraw"
+
+
+def test_full_redraw(benchmark, results, board):
+    renderer = board[1].graph_renderer
+    run(
+        benchmark,
+        results,
+        board,
+        "display_graph",
+        renderer.invalidate,
+        renderer.display_graph,
+    )
+
+
+def test_button_press(benchmark, results, board):
+    game = board[1]
+    run(
+        benchmark,
+        results,
+        board,
+        "display_user_path",
+        game.logic.next_node,
+        game.graph_renderer.display_user_path,
+    )
+
+
+def test_shortest_path_highlight(benchmark, results, board):
+    game = board[1]
+    renderer = game.graph_renderer
+    run(
+        benchmark,
+        results,
+        board,
+        "highlight_shortest_path",
+        renderer.display_user_path,
+        lambda: renderer.highlight_shortest_path(game.shortest_path),
+    )
@@ -0,0 +1,68 @@
+"""pytest-benchmark suite comparing the shortest path solvers.
+
+Run with `python -m pytest tests/benchmarks --benchmark-only`. Boards of 100k nodes and
+more take a while to build; set DUCKQUEST_LARGE_BENCHMARKS=1 to include them.
+"""
+
+import os
+import numpy as np
+import pytest
+from duckquest.graph.compact import CompactGraph
+from duckquest.graph.layout import grid_board
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.solvers import SOLVERS, make_solver
+from duckquest.utils.logger import setup_logger
+
+pytest.importorskip("pytest_benchmark")
+
+logger = setup_logger(__name__)
+
+LARGE = os.environ.get("DUCKQUEST_LARGE_BENCHMARKS") == "1"
+GRID_SIDES = {"1k": 32, "10k": 100, "100k": 317, "1M": 1000}
+
+
+@pytest.fixture(scope="module")
+def game_board():
+    """The game board with a fixed difficulty 11 board."""
+    graph = GraphManager(backend="compact")
+    graph.assign_weights_and_colors(difficulty=11, seed=0)
+    positions = [graph.node_positions[node] for node in graph.core.nodes]
+    start = graph.core.node_id(graph.start_node)
+    end = graph.core.node_id(graph.end_node)
+    return graph.core, positions, start, end
+
+
+@pytest.fixture(scope="module", params=list(GRID_SIDES))
+def grid(request):
+    """A full square grid board with random weights, queried from start to end."""
+    side = GRID_SIDES[request.param]
+    if side * side >= 100_000 and not LARGE:
+        pytest.skip("Set DUCKQUEST_LARGE_BENCHMARKS=1 to run boards of 100k+ nodes")
+    logger.info(f"Building {side}x{side} grid board")
+    layout = grid_board(side, side, holes=0, seed=0)
+    core = CompactGraph(layout.nodes, layout.edges)
+    core.set_weights(np.random.default_rng(0).integers(1, 6, size=len(core.edges)))
+    positions = [layout.positions[node] for node in layout.nodes]
+    return core, positions, core.node_id(layout.start), core.node_id(layout.end)
+
+
+def run(benchmark, name, board):
+    """Benchmark one solver query and check its cost against heap Dijkstra."""
+    core, positions, source, target = board
+    solver = make_solver(name, core, positions)
+    cost, _ = benchmark(solver.search, source, target)
+    expected, _ = make_solver("dijkstra", core).search(source, target)
+    assert cost == expected
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_game_board(benchmark, name, game_board):
+    benchmark.group = "game board"
+    run(benchmark, name, game_board)
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_grid(benchmark, name, grid):
+    core = grid[0]
+    benchmark.group = f"grid {len(core.nodes)} nodes"
+    run(benchmark, name, grid)
@@ -1,6 +1,10 @@
 import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from duckquest.graph.help import HelpScreen
 from duckquest.graph.logic import GraphLogic
 from duckquest.graph.manager import GraphManager
+from duckquest.graph.renderer import GraphRenderer
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -15,6 +19,22 @@ class DummyGameManager:
         logger.debug("DummyGameManager initialized successfully")
 
 
+class CountingCanvas(FigureCanvasAgg):
+    """Offscreen Agg canvas that records blit calls and counts full draws."""
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.blits = []
+        self.draws = 0
+
+    def blit(self, bbox=None):
+        self.blits.append(bbox)
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+
 @pytest.fixture
 def graph_manager():
     """Provide a fresh instance of GraphManager for each test."""
@@ -24,6 +44,15 @@ def graph_manager():
     return manager
 
 
+@pytest.fixture
+def compact_graph_manager():
+    """Provide a GraphManager using the array-backed compact backend."""
+    logger.info("Creating compact GraphManager fixture")
+    manager = GraphManager(backend="compact")
+    logger.debug("Compact GraphManager fixture ready")
+    return manager
+
+
 @pytest.fixture
 def logic():
     """Fixture for initializing GraphLogic with a dummy game manager."""
@@ -32,3 +61,27 @@ def logic():
     logic_instance = GraphLogic(game_manager)
     logger.debug("GraphLogic fixture ready")
     return logic_instance
+
+
+@pytest.fixture
+def renderer(logic):
+    """Fixture for a GraphRenderer drawing on an offscreen Agg canvas."""
+    logger.info("Creating GraphRenderer fixture on an Agg canvas")
+    game_manager = logic.game_manager
+    game_manager.logic = logic
+    renderer_instance = GraphRenderer(game_manager)
+    figure = Figure(figsize=(12, 6))
+    canvas = CountingCanvas(figure)
+    renderer_instance.init_ui(figure.add_subplot(), canvas)
+    logger.debug("GraphRenderer fixture ready")
+    return renderer_instance
+
+
+@pytest.fixture
+def help_screen(renderer):
+    """Fixture for a HelpScreen drawn over the renderer fixture's graph."""
+    logger.info("Creating HelpScreen fixture")
+    help_instance = HelpScreen(renderer.ax, renderer.canvas)
+    renderer.overlay = help_instance
+    logger.debug("HelpScreen fixture ready")
+    return help_instance
@@ -0,0 +1,80 @@
+import networkx as nx
+import numpy as np
+import pytest
+from duckquest.graph.compact import CompactGraph
+from duckquest.graph.manager import COLORS, GraphManager
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_csr_arrays_match_edge_list(graph_manager):
+    """Test that every edge appears once in each direction of the CSR arrays."""
+    core = CompactGraph(graph_manager.nodes, graph_manager.edges)
+    assert core.offsets[-1] == 2 * len(graph_manager.edges)
+    for k, (u, v) in enumerate(graph_manager.edges):
+        assert core.edge_id(u, v) == k
+        assert core.edge_id(v, u) == k
+
+
+def test_neighbors_match_networkx_backend(graph_manager, compact_graph_manager):
+    """Test that both backends list neighbors in the same order."""
+    for node in graph_manager.nodes:
+        assert compact_graph_manager.neighbors(node) == graph_manager.neighbors(node)
+
+
+def test_lookup_tables_are_shared_with_weighted_copies(graph_manager):
+    """Test that sessions of one topology build the scalar lookup tables only once."""
+    core = CompactGraph(graph_manager.nodes, graph_manager.edges)
+    session = core.with_weights(np.ones(len(core.edges)))
+    u, v = graph_manager.edges[0]
+    assert session.edge_weight(u, v) == 1
+    assert core._lookups and core._lookups is session._lookups
+    assert core.neighbors(u) == session.neighbors(u)
+
+
+def test_graph_view_is_lazy(compact_graph_manager):
+    """Test that the networkx view is only built on demand and refreshed with weights."""
+    compact_graph_manager.assign_weights_and_colors(difficulty=6)
+    assert compact_graph_manager._graph is None
+    view = compact_graph_manager.graph
+    for u, v in compact_graph_manager.edges:
+        weight = compact_graph_manager.edge_weight(u, v)
+        assert view[u][v]["weight"] == weight
+        assert view[u][v]["color"] == COLORS[weight]
+    compact_graph_manager.assign_weights_and_colors(difficulty=6)
+    assert compact_graph_manager._graph is None
+
+
+def test_compact_shortest_path_matches_networkx(compact_graph_manager):
+    """Test that the CSR Dijkstra gives networkx's optimal costs."""
+    compact_graph_manager.assign_weights_and_colors(difficulty=11)
+    graph = compact_graph_manager.graph
+    for node in compact_graph_manager.nodes:
+        expected = nx.shortest_path_length(graph, node, "Q2", weight="weight")
+        assert compact_graph_manager.shortest_path_cost(node, "Q2") == expected
+        path = compact_graph_manager.shortest_path(node, "Q2")
+        cost = sum(
+            compact_graph_manager.edge_weight(u, v) for u, v in zip(path, path[1:])
+        )
+        assert cost == expected
+
+
+def test_compact_missing_edge_and_node(compact_graph_manager):
+    """Test that unknown edges and nodes behave like the networkx backend."""
+    assert compact_graph_manager.edge_weight("A1", "Q2") is None
+    assert compact_graph_manager.shortest_path("A1", "ZZZ") is None
+    with pytest.raises(ValueError):
+        compact_graph_manager.neighbors("ZZZ")
+
+
+def test_set_weights_rejects_wrong_length(compact_graph_manager):
+    """Test that a weight vector must cover every edge."""
+    with pytest.raises(ValueError):
+        compact_graph_manager.core.set_weights(np.ones(3))
+
+
+def test_unknown_backend():
+    """Test that an unknown backend name is rejected."""
+    with pytest.raises(ValueError):
+        GraphManager(backend="sparse")
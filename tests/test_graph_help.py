@@ -0,0 +1,58 @@
+from matplotlib.backend_bases import ResizeEvent
+from duckquest.graph.help import load_rules
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_rules_load_from_any_directory(tmp_path, monkeypatch):
+    """Rules are read from the package, not the working directory, and only once."""
+    monkeypatch.chdir(tmp_path)
+    rules = load_rules()
+    assert rules[0]["header"].startswith("Welcome to DuckQuest")
+    assert load_rules() is rules
+
+
+def test_help_is_drawn_once_then_blitted(renderer, help_screen):
+    """Only the first display lays the page out; later ones copy the cached bitmap."""
+    renderer.display_graph()
+    help_screen.show()
+    assert help_screen.visible
+    assert not renderer.ax.get_visible()
+    draws = renderer.canvas.draws
+
+    renderer.display_user_path()
+    help_screen.show()
+
+    assert renderer.canvas.draws == draws
+    assert renderer.canvas.blits[-1] == renderer.canvas.figure.bbox
+
+
+def test_graph_comes_back_without_redraw(renderer, help_screen):
+    """Leaving the help page repaints the graph from its cached background."""
+    renderer.display_user_path()
+    help_screen.show()
+    draws = renderer.canvas.draws
+
+    renderer.display_user_path()
+
+    assert not help_screen.visible
+    assert renderer.ax.get_visible()
+    assert renderer.canvas.draws == draws
+    assert renderer.canvas.blits[-1] == renderer.canvas.figure.bbox
+
+
+def test_resize_invalidates_cached_help(renderer, help_screen):
+    """After a resize, the page and the graph are laid out again."""
+    renderer.display_graph()
+    help_screen.show()
+    renderer.display_graph()
+
+    renderer.canvas.figure.set_size_inches(8, 4)
+    ResizeEvent("resize_event", renderer.canvas)._process()
+    draws = renderer.canvas.draws
+    help_screen.show()
+    assert renderer.canvas.draws == draws + 1
+
+    renderer.display_graph()
+    assert renderer.canvas.draws == draws + 2
@@ -0,0 +1,146 @@
+import networkx as nx
+import numpy as np
+import pytest
+from duckquest.graph.layout import (
+    _board_path,
+    classic_board,
+    delaunay_board,
+    generate_board,
+    grid_board,
+    load_board,
+    node_name,
+    parse_board,
+    save_board,
+)
+from duckquest.graph.manager import GraphManager
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def as_networkx(layout) -> nx.Graph:
+    """Build a networkx graph from a layout."""
+    graph = nx.Graph()
+    graph.add_nodes_from(layout.nodes)
+    graph.add_edges_from(layout.edges)
+    return graph
+
+
+def test_classic_board_is_the_default(graph_manager):
+    """GraphManager uses the classic board when no layout is given"""
+    layout = classic_board()
+    assert list(graph_manager.nodes) == layout.nodes
+    assert list(graph_manager.edges) == layout.edges
+    assert (graph_manager.start_node, graph_manager.end_node) == ("A1", "Q2")
+
+
+def test_node_names_follow_the_classic_scheme():
+    """Generated names count A1 to Z1, then A2 and so on"""
+    assert [node_name(i) for i in (0, 25, 26, 27)] == ["A1", "Z1", "A2", "B2"]
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: grid_board(12, 24, holes=0.2, jitter=0.3, seed=1),
+        lambda: delaunay_board(400, seed=1),
+    ],
+)
+def test_generated_boards_are_connected_and_planar(build):
+    """Generated boards are one connected, planar graph with a position per node"""
+    layout = build()
+    graph = as_networkx(layout)
+    assert nx.is_connected(graph)
+    assert nx.check_planarity(graph)[0]
+    assert set(layout.positions) == set(layout.nodes)
+    assert layout.start != layout.end
+
+
+def test_generation_is_seeded():
+    """The same seed gives the same board"""
+    assert delaunay_board(200, seed=5) == delaunay_board(200, seed=5)
+
+
+def test_end_selection_modes():
+    """Start and goal are the leftmost/rightmost nodes or a long hop distance apart"""
+    layout = grid_board(5, 10, holes=0, ends="left-right", seed=0)
+    assert layout.positions[layout.start][0] == 0
+    assert layout.positions[layout.end][0] == 9
+
+    layout = grid_board(5, 10, holes=0, ends="diameter", seed=0)
+    graph = as_networkx(layout)
+    assert nx.shortest_path_length(graph, layout.start, layout.end) == 13
+
+    with pytest.raises(ValueError):
+        grid_board(5, 10, ends="middle")
+
+
+def test_graph_manager_plays_generated_board():
+    """A generated board plugs into GraphManager in place of the classic one"""
+    layout = generate_board("delaunay", 300, seed=2)
+    graph = GraphManager(backend="compact", layout=layout)
+    graph.assign_weights_and_colors(difficulty=11, seed=0)
+    path = graph.shortest_path(graph.start_node, graph.end_node)
+    assert path[0] == layout.start and path[-1] == layout.end
+
+
+def test_board_file_is_compiled_once(tmp_path):
+    """The first load compiles the definition, the next ones map the cached file"""
+    cache = tmp_path / "cache"
+    first = load_board("classic", cache_dir=str(cache))
+    files = list(cache.iterdir())
+    assert len(files) == 1
+    mtime = files[0].stat().st_mtime_ns
+
+    second = load_board("classic", cache_dir=str(cache))
+    assert second.compiled is not None
+    assert files[0].stat().st_mtime_ns == mtime
+    assert (second.nodes, second.edges, second.start, second.end) == (
+        first.nodes,
+        first.edges,
+        first.start,
+        first.end,
+    )
+
+
+def test_edited_board_is_recompiled(tmp_path):
+    """Changing the definition changes its hash and compiles it again"""
+    layout = grid_board(4, 6, holes=0, seed=0)
+    path = tmp_path / "small.json"
+    save_board(layout, str(path))
+    cache = tmp_path / "cache"
+    loaded = load_board(str(path), cache_dir=str(cache))
+    assert (loaded.nodes, loaded.edges, loaded.positions) == (
+        layout.nodes,
+        layout.edges,
+        layout.positions,
+    )
+
+    layout.edges = layout.edges[:-1]
+    save_board(layout, str(path))
+    assert load_board(str(path), cache_dir=str(cache)).edges == layout.edges
+    assert len(list(cache.iterdir())) == 2
+
+
+def test_compact_backend_maps_compiled_arrays(tmp_path):
+    """The compact backend uses the compiled CSR arrays as they are"""
+    layout = load_board("classic", cache_dir=str(tmp_path))
+    graph = GraphManager(backend="compact", layout=layout)
+    assert graph.core.offsets is graph.topology.core.offsets
+    assert np.shares_memory(graph.core.offsets, layout.compiled.offsets)
+    with open(_board_path("classic"), "rb") as file:
+        definition = parse_board(file.read())
+    reference = GraphManager(backend="compact", layout=definition)
+    for node in graph.nodes:
+        assert graph.neighbors(node) == reference.neighbors(node)
+
+
+def test_invalid_board_definition():
+    """Definitions with unknown nodes or another format are rejected"""
+    with pytest.raises(ValueError):
+        parse_board(b'{"format": 99}')
+    with pytest.raises(ValueError):
+        parse_board(
+            b'{"format": 1, "nodes": ["A1"], "edges": [["A1", "B1"]], '
+            b'"positions": {"A1": [0, 0]}, "start": "A1", "end": "A1"}'
+        )
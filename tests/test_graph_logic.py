@@ -45,12 +45,13 @@ def test_handle_node_click_add_remove(logic):
 def test_reset_selection(logic):
     """Test reset_selection resets paths and index"""
     logic.selected_path = ["A1", "B1"]
-    logic.user_path_edges = [("A1", "B1")]
-    logic.selected_nodes = {"A1", "B1"}
+    assert logic.user_path_edges == [("A1", "B1")]
+    assert logic.selected_nodes == {"A1", "B1"}
     logic.selection_index = 2
     logic.reset_selection()
     assert logic.selected_path == []
     assert logic.user_path_edges == []
+    assert logic.path.cost == 0
     assert logic.selected_nodes == set()
     assert logic.selection_index == 0
     assert logic.current_node == "A1"
@@ -63,7 +64,6 @@ def test_calculate_score_optimal(logic):
         logger.warning("No valid path between A1 and Q2 — skipping")
         pytest.skip("No valid path between A1 and Q2")
     logic.selected_path = optimal_path
-    logic.user_path_edges = list(zip(optimal_path, optimal_path[1:]))
     msg, score = logic.calculate_score()
     assert score == 100
     assert "100" in msg
@@ -72,7 +72,6 @@ def test_calculate_score_optimal(logic):
 def test_calculate_score_invalid_start_end(logic):
     """Test score is 0% when path does not start at A1 or end at Q2"""
     logic.selected_path = ["B1", "C1"]
-    logic.user_path_edges = [("B1", "C1")]
     msg, score = logic.calculate_score()
     assert score == 0
     assert "must start at the beginning" in msg
@@ -85,7 +84,6 @@ def test_check_shortest_path_success(logic):
         logger.warning("No valid path between A1 and Q2 — skipping")
         pytest.skip("No valid path between A1 and Q2")
     logic.selected_path = path
-    logic.user_path_edges = list(zip(path, path[1:]))
     msg, score = logic.check_shortest_path()
     assert score == 100
     assert "Congratulations" in msg
@@ -126,7 +124,6 @@ def test_check_shortest_path_failure(logic):
                     continue
 
                 logic.selected_path = detour
-                logic.user_path_edges = list(zip(detour, detour[1:]))
                 _, score = logic.calculate_score()
 
                 if score < 100:
@@ -153,7 +150,6 @@ def test_check_shortest_path_failure(logic):
             pytest.skip("No valid suboptimal detour found")
 
         logic.selected_path = bad_path
-        logic.user_path_edges = list(zip(bad_path, bad_path[1:]))
         msg, final_score = logic.check_shortest_path()
 
         # Save debug info in case of fail
@@ -177,3 +173,24 @@ def test_check_shortest_path_failure(logic):
         for k, v in debug_info.items():
             logger.error(f"{k}: {v}")
         raise
+
+
+def test_optimal_cost_cached_per_board(logic):
+    """The optimal cost is stored with the board and refreshed on restart"""
+    assert logic.optimal_cost == logic.graph.shortest_path_cost("A1", "Q2")
+    logic.restart_game()
+    assert logic.optimal_cost == logic.graph.shortest_path_cost("A1", "Q2")
+
+
+def test_path_estimate_follows_moves(logic):
+    """The live estimate adds the cost so far to the best cost from the current node"""
+    cost, best, estimate = logic.path_estimate()
+    assert (cost, best, estimate) == (0, logic.optimal_cost, 100)
+
+    neighbor = logic.graph.neighbors("A1")[0]
+    logic.selection_index = logic.available_nodes.index(neighbor)
+    logic.change_current_node()
+    cost, best, estimate = logic.path_estimate()
+    assert cost == logic.graph.edge_weight("A1", neighbor)
+    assert best == cost + logic.graph.shortest_path_cost(neighbor, "Q2")
+    assert estimate == min(100, int(100 * logic.optimal_cost / best))
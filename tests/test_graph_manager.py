@@ -1,5 +1,7 @@
 import pytest
-from duckquest.graph.manager import COLORS
+import networkx as nx
+import numpy as np
+from duckquest.graph.manager import COLORS, WEIGHTS_MAP, sample_weights
 from duckquest.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -88,3 +90,47 @@ def test_neighbors_invalid_node(graph_manager):
     """Test that querying neighbors of an invalid node raises ValueError."""
     with pytest.raises(ValueError):
         graph_manager.neighbors("ZZZ")
+
+
+def test_shortest_path_cost_matches_dijkstra(graph_manager):
+    """Test that the cached table gives the same cost as a direct Dijkstra run."""
+    graph_manager.assign_weights_and_colors(difficulty=11)
+    for node in graph_manager.nodes:
+        expected = nx.shortest_path_length(
+            graph_manager.graph, node, "Q2", weight="weight"
+        )
+        assert graph_manager.shortest_path_cost(node, "Q2") == expected
+        path = graph_manager.shortest_path(node, "Q2")
+        assert path[0] == node and path[-1] == "Q2"
+        assert sum(graph_manager.edge_weight(u, v) for u, v in zip(path, path[1:])) == (
+            expected
+        )
+
+
+def test_path_table_dropped_on_reassign(graph_manager):
+    """Test that the table is reused until the weights are reassigned."""
+    graph_manager.assign_weights_and_colors(difficulty=6)
+    table = graph_manager.path_table("Q2")
+    assert graph_manager.path_table("Q2") is table
+    graph_manager.assign_weights_and_colors(difficulty=6)
+    assert graph_manager.path_table("Q2") is not table
+
+
+def test_assign_weights_with_seed_is_reproducible(graph_manager):
+    """Test that the same seed replays the same board."""
+    graph_manager.assign_weights_and_colors(difficulty=11, seed=1234)
+    first = graph_manager.weights.copy()
+    graph_manager.assign_weights_and_colors(difficulty=11)
+    graph_manager.assign_weights_and_colors(difficulty=11, seed=1234)
+    assert graph_manager.seed == 1234
+    assert np.array_equal(graph_manager.weights, first)
+    for (u, v), weight in zip(graph_manager.edges, first):
+        assert graph_manager.graph[u][v]["weight"] == weight
+
+
+def test_sample_weights_batch():
+    """Test that a batch draw covers every board and only uses allowed weights."""
+    rng = np.random.default_rng(0)
+    weights = sample_weights(rng, 9, num_edges=70, boards=1000)
+    assert weights.shape == (1000, 70)
+    assert set(np.unique(weights)) == set(WEIGHTS_MAP[9])
@@ -0,0 +1,44 @@
+from duckquest.graph.path import UserPath
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_add_tracks_edges_and_cost(graph_manager):
+    """Selecting adjacent nodes adds their edges and weights"""
+    graph_manager.assign_weights_and_colors(seed=0)
+    path = UserPath.from_nodes(graph_manager, ["A1", "C1"])
+    assert list(path) == ["A1", "C1"]
+    assert path.has_edge("C1", "A1")
+    assert path.cost == graph_manager.edge_weight("A1", "C1")
+
+
+def test_non_adjacent_nodes_add_no_edge(graph_manager):
+    """A node that is not a neighbor of the last one is added without an edge"""
+    path = UserPath.from_nodes(graph_manager, ["A1", "Q2"])
+    assert "Q2" in path
+    assert not path.edges
+    assert path.cost == 0
+
+
+def test_remove_middle_node(graph_manager):
+    """Removing a node drops both of its edges and their weights"""
+    graph_manager.assign_weights_and_colors(seed=0)
+    first, middle = "A1", "C1"
+    last = next(node for node in graph_manager.neighbors(middle) if node != first)
+    path = UserPath.from_nodes(graph_manager, [first, middle, last])
+    path.remove(middle)
+    assert list(path) == [first, last]
+    assert not path.edges
+    assert path.cost == 0
+    assert path.last == last
+
+
+def test_clear(graph_manager):
+    """Clearing empties the path"""
+    graph_manager.assign_weights_and_colors(seed=0)
+    path = UserPath.from_nodes(graph_manager, ["A1", "C1"])
+    path.clear()
+    assert len(path) == 0
+    assert path.last is None
+    assert path.cost == 0
@@ -0,0 +1,171 @@
+import os
+from types import SimpleNamespace
+import pytest
+from duckquest import game_manager
+from duckquest.game_manager import GameManager
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.recording import (
+    QUIT,
+    SessionRecorder,
+    prune_sessions,
+    read_session,
+    replay_session,
+)
+from duckquest.graph.simulator import step_towards
+from duckquest.hardware.mock import LEDStripManager
+from duckquest.main import parse_args
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@pytest.fixture
+def recorded_game(tmp_path, monkeypatch):
+    """GameManager without Tk or rendering, recording to a temporary session file."""
+    monkeypatch.setattr(game_manager.messagebox, "showinfo", lambda *args: None)
+    monkeypatch.setattr(game_manager.messagebox, "showerror", lambda *args: None)
+    manager = GameManager.__new__(GameManager)
+    manager.score = 0
+    manager.difficulty = 6
+    manager.graph = GraphManager(backend="compact")
+    manager.logic = GraphLogic(manager, seed=7)
+    manager.recorder = SessionRecorder(str(tmp_path / "session.dqev"), manager.graph)
+    manager.recorder.board(manager.difficulty, manager.graph)
+    manager.led_strip_manager = LEDStripManager()
+    manager.board_sync = SimpleNamespace(
+        invalidate=lambda: None, sync=lambda highlight=None: None
+    )
+    manager.graph_renderer = SimpleNamespace(highlight_shortest_path=lambda path: None)
+    manager.graph_ui = SimpleNamespace(update_score_display=lambda score: None)
+    manager.update_display = lambda: None
+    yield manager
+    manager.led_strip_manager.cancel()
+    manager.led_strip_manager.close()
+
+
+def play_to_goal(manager: GameManager, optimal: bool):
+    """Press buttons until the goal is selected, on the shortest path or not."""
+    logic = manager.logic
+    buttons = {
+        "select": manager.select_node,
+        "next": manager.next_node,
+        "previous": manager.previous_node,
+    }
+    if not logic.path:
+        manager.select_node()  # Start again after a restart
+    while logic.current_node != logic.end_node:
+        path = manager.graph.shortest_path(logic.current_node, logic.end_node)
+        target = path[1]
+        if not optimal:
+            # Take the first unvisited detour, then head for the goal
+            detours = [n for n in logic.available_nodes[1:] if n not in logic.path]
+            target = detours[0] if detours and len(logic.path) < 3 else target
+        buttons[step_towards(logic, target)]()
+
+
+def play_session(manager: GameManager) -> list[int]:
+    """Play an optimal and a detoured game, and return the scores."""
+    play_to_goal(manager, optimal=True)
+    first = manager.logic.calculate_score()[1]
+    manager.check_path()
+    manager.toggle_shortest_path()
+    manager.toggle_shortest_path()
+    play_to_goal(manager, optimal=False)
+    second = manager.logic.calculate_score()[1]
+    manager.check_path()
+    manager.recorder.write(QUIT)
+    manager.recorder.close()
+    return [first, second]
+
+
+def test_session_round_trip(recorded_game):
+    """Every action is read back in order with its payload."""
+    play_session(recorded_game)
+    session = read_session(recorded_game.recorder.path)
+
+    assert session.topology_hash == recorded_game.graph.topology_hash
+    assert not session.truncated
+    names = [event.name for event in session.events]
+    assert names[0] == "board"
+    assert names[-1] == "quit"
+    assert names.count("check") == 2
+    assert names.count("board") == 2  # The optimal game restarted the board
+    assert names.count("show_path") == 2
+    times = [event.time_us for event in session.events]
+    assert times == sorted(times)
+
+
+def test_replay_reproduces_the_session(recorded_game):
+    """Replaying the recording selects the same nodes and gets the same scores."""
+    scores = play_session(recorded_game)
+    report = replay_session(read_session(recorded_game.recorder.path))
+
+    assert report.mismatches == []
+    assert report.games == 2
+    assert report.scores == scores
+    assert scores[0] == 100
+    assert 0 < scores[1] < 100
+    assert len(report.latencies_ns["select"]) > 0
+
+
+def test_replay_reports_divergence(recorded_game):
+    """A recorded score that the logic does not reproduce is reported."""
+    play_session(recorded_game)
+    session = read_session(recorded_game.recorder.path)
+    check = next(i for i, e in enumerate(session.events) if e.name == "check")
+    session.events[check] = session.events[check]._replace(values=(42, 1, 2))
+
+    report = replay_session(session)
+    assert len(report.mismatches) == 1
+    assert "recorded 42" in report.mismatches[0]
+
+
+def test_truncated_session_keeps_complete_events(recorded_game):
+    """A file cut in the middle of a record, as after a power loss, is still readable."""
+    play_session(recorded_game)
+    path = recorded_game.recorder.path
+    complete = read_session(path)
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 1)
+
+    session = read_session(path)
+    assert session.truncated
+    assert len(session.events) == len(complete.events) - 1
+    assert session.events[-1].time_us == complete.events[-2].time_us
+
+
+def test_session_from_another_board_is_rejected(recorded_game):
+    """A replay refuses a session whose node ids refer to another board."""
+    recorded_game.recorder.close()
+    session = read_session(recorded_game.recorder.path)
+    session.topology_hash = bytes(16)
+    with pytest.raises(ValueError):
+        replay_session(session)
+
+
+def test_old_sessions_are_pruned(tmp_path):
+    """Only the most recent session files are kept, and other files are left alone."""
+    for i in range(5):
+        path = tmp_path / f"session_{i}.dqev"
+        path.write_bytes(b"")
+        os.utime(path, (1000 + i, 1000 + i))
+    (tmp_path / "notes.txt").write_text("kept")
+
+    deleted = prune_sessions(str(tmp_path), keep=2)
+    assert sorted(os.path.basename(path) for path in deleted) == [
+        "session_0.dqev",
+        "session_1.dqev",
+        "session_2.dqev",
+    ]
+    assert sorted(os.listdir(tmp_path)) == [
+        "notes.txt",
+        "session_3.dqev",
+        "session_4.dqev",
+    ]
+
+
+def test_recording_is_opt_in():
+    """Sessions are only recorded when the game is started with --record."""
+    assert not parse_args([]).record
+    assert parse_args(["--record"]).record
@@ -0,0 +1,65 @@
+import numpy as np
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.colors import to_rgba
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_display_graph_builds_artists(renderer):
+    """The first display creates retained artists and caches a background."""
+    renderer.display_graph()
+    assert isinstance(renderer.node_artist, PathCollection)
+    assert isinstance(renderer.edge_artist, LineCollection)
+    assert len(renderer.label_artists) == renderer.graph.graph.number_of_nodes()
+    assert renderer._background is not None
+
+
+def test_display_user_path_reuses_artists(renderer):
+    """Later displays recolor the existing artists instead of rebuilding them."""
+    renderer.display_user_path()
+    node_artist, edge_artist = renderer.node_artist, renderer.edge_artist
+
+    renderer.logic.selection_index = 1
+    renderer.display_user_path()
+
+    assert renderer.node_artist is node_artist
+    assert renderer.edge_artist is edge_artist
+    highlighted = renderer.logic.available_nodes[1]
+    index = renderer._nodes.index(highlighted)
+    assert tuple(node_artist.get_facecolor()[index]) == to_rgba("green")
+
+
+def test_unchanged_display_does_not_blit(renderer):
+    """Redisplaying the same state does not touch the canvas."""
+    renderer.display_user_path()
+    renderer.canvas.blits.clear()
+    renderer.display_user_path()
+    assert renderer.canvas.blits == []
+
+
+def test_blit_is_limited_to_dirty_region(renderer):
+    """Changing one node blits a region much smaller than the axis."""
+    renderer.display_user_path()
+    renderer.canvas.blits.clear()
+
+    renderer.logic.selection_index = 1
+    renderer.display_user_path()
+
+    assert len(renderer.canvas.blits) == 1
+    dirty = renderer.canvas.blits[0]
+    logger.info(f"Dirty region: {dirty.width:.0f}x{dirty.height:.0f} px")
+    assert (
+        dirty.width * dirty.height
+        < 0.5 * renderer.ax.bbox.width * renderer.ax.bbox.height
+    )
+
+
+def test_cleared_axis_triggers_rebuild(renderer):
+    """Clearing the axis (e.g. for the help screen) invalidates the artists."""
+    renderer.display_graph()
+    old_artist = renderer.node_artist
+    renderer.ax.clear()
+    renderer.display_user_path()
+    assert renderer.node_artist is not old_artist
+    assert np.all(renderer.node_artist.get_facecolor()[:, 3] == 1)
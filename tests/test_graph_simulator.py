@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from duckquest.graph.simulator import (
+    HeadlessGame,
+    OptimalPolicy,
+    Policy,
+    RandomPolicy,
+    Simulator,
+    play_episodes,
+)
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@pytest.fixture
+def headless_game():
+    """Provide a headless game with a fixed seed."""
+    logger.info("Creating HeadlessGame fixture")
+    return HeadlessGame(seed=0)
+
+
+def test_next_and_previous_node_wrap_around(headless_game):
+    """Next and previous cycle through the available nodes"""
+    logic = headless_game.logic
+    count = len(logic.available_nodes)
+    logic.previous_node()
+    assert logic.selection_index == count - 1
+    logic.next_node()
+    assert logic.selection_index == 0
+
+
+def test_optimal_policy_scores_100(headless_game):
+    """The optimal player finds the shortest path on every board"""
+    rng = np.random.default_rng(0)
+    batch = play_episodes(headless_game, OptimalPolicy(), 20, rng)
+    assert np.all(batch.scores == 100)
+    assert set(batch.latencies_ns) >= {"select", "check", "restart"}
+    assert len(batch.latencies_ns["restart"]) == 20
+
+
+def test_episodes_end_within_max_steps(headless_game):
+    """Games that do not reach the goal are checked at the step limit"""
+    rng = np.random.default_rng(0)
+    batch = play_episodes(headless_game, RandomPolicy(), 10, rng, max_steps=30)
+    assert np.all(batch.steps <= 30)
+    assert np.all((batch.scores >= 0) & (batch.scores <= 100))
+
+
+def test_seeded_games_are_replayable():
+    """The same seed gives the same boards and the same scores"""
+    scores = [
+        play_episodes(
+            HeadlessGame(seed=3), RandomPolicy(), 10, np.random.default_rng(3)
+        ).scores
+        for _ in range(2)
+    ]
+    assert np.array_equal(*scores)
+
+
+def test_simulator_report():
+    """A small run in a process pool reports every episode"""
+    report = Simulator(workers=1).run("optimal", 30, chunk_size=20, seed=0)
+    assert len(report.batch.scores) == 30
+    assert report.score_histogram().sum() == 30
+    assert report.episodes_per_second > 0
+    assert "select" in report.latency_percentiles()
+
+
+def test_simulator_rejects_unknown_policy():
+    """Unknown policies raise a ValueError"""
+    with pytest.raises(ValueError):
+        Simulator().run("cheater", 10)
+    with pytest.raises(TypeError):
+        Policy()  # choose() is abstract
@@ -0,0 +1,103 @@
+import itertools
+import networkx as nx
+import numpy as np
+import pytest
+from duckquest.graph.compact import CompactGraph
+from duckquest.graph.layout import grid_board as layout_grid
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.solvers import SOLVERS, Solver, make_solver
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def grid_board(rows: int, cols: int, seed: int = 0):
+    """Return a weighted full grid CompactGraph and its node positions."""
+    layout = layout_grid(rows, cols, holes=0, seed=seed)
+    core = CompactGraph(layout.nodes, layout.edges)
+    core.set_weights(np.random.default_rng(seed).integers(1, 6, size=len(core.edges)))
+    return core, [layout.positions[node] for node in layout.nodes]
+
+
+def path_cost(core: CompactGraph, path: list[int]) -> int:
+    """Sum the weights along a path of node ids."""
+    return sum(
+        core.edge_weight(core.nodes[u], core.nodes[v]) for u, v in zip(path, path[1:])
+    )
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_agree_on_game_board(name, compact_graph_manager):
+    """Every solver finds the optimal cost, along a real path, on the game board"""
+    graph = compact_graph_manager
+    for seed in range(5):
+        graph.assign_weights_and_colors(difficulty=11, seed=seed)
+        core = graph.core
+        positions = [graph.node_positions[node] for node in core.nodes]
+        solver = make_solver(name, core, positions)
+        reference = graph.graph
+        for start, end in itertools.islice(
+            itertools.combinations(core.nodes, 2), 0, None, 97
+        ):
+            expected = nx.shortest_path_length(reference, start, end, weight="weight")
+            cost, path = solver.search(core.node_id(start), core.node_id(end))
+            assert cost == expected
+            assert path[0] == core.node_id(start) and path[-1] == core.node_id(end)
+            assert path_cost(core, path) == cost
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_solvers_agree_on_grid(name):
+    """Every solver agrees with heap Dijkstra on a synthetic grid"""
+    core, positions = grid_board(30, 40)
+    reference = make_solver("dijkstra", core)
+    solver = make_solver(name, core, positions)
+    rng = np.random.default_rng(1)
+    for source, target in rng.integers(len(core.nodes), size=(20, 2)).tolist():
+        expected = reference.search(source, target)
+        cost, path = solver.search(source, target)
+        assert cost == expected[0]
+        assert path_cost(core, path) == cost
+
+
+def test_dial_table_matches_heap_table():
+    """Dial's bucket queue builds the same distance table as the heap"""
+    core, _ = grid_board(20, 20, seed=3)
+    expected, _ = make_solver("dijkstra", core).table(0)
+    distances, next_hops = make_solver("dial", core).table(0)
+    assert np.array_equal(distances, expected)
+    assert next_hops[0] == -1
+
+
+def test_unreachable_target():
+    """Solvers report None when the target cannot be reached"""
+    core = CompactGraph(["a", "b", "c"], [("a", "b")])
+    core.set_weights([1])
+    positions = [(0, 0), (1, 0), (5, 5)]
+    for name in SOLVERS:
+        assert make_solver(name, core, positions).search(0, 2) is None
+
+
+@pytest.mark.parametrize("name", sorted(SOLVERS))
+def test_graph_manager_solver(name, compact_graph_manager):
+    """GraphManager answers queries with the selected solver"""
+    graph = compact_graph_manager
+    graph.assign_weights_and_colors(difficulty=11, seed=7)
+    expected = graph.shortest_path_cost("A1", "Q2")
+    graph.set_solver(name)
+    assert graph.shortest_path_cost("A1", "Q2") == expected
+    path = graph.shortest_path("A1", "Q2")
+    assert sum(graph.edge_weight(u, v) for u, v in zip(path, path[1:])) == expected
+    assert graph.path_table("Q2")[0]["A1"] == expected
+
+
+def test_solver_selection_errors(graph_manager, compact_graph_manager):
+    """Unknown solvers, and solvers other than Dijkstra on networkx, are rejected"""
+    with pytest.raises(ValueError):
+        compact_graph_manager.set_solver("bellman-ford")
+    with pytest.raises(ValueError):
+        graph_manager.set_solver("dial")
+    with pytest.raises(ValueError):
+        GraphManager(solver="astar")
+    with pytest.raises(TypeError):
+        Solver(compact_graph_manager.core)  # search() is abstract
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from duckquest.graph.spatial import SpatialGrid
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def brute_force_nearest(points, x, y, radius):
+    distances = np.hypot(points[:, 0] - x, points[:, 1] - y)
+    best = int(distances.argmin())
+    return best if distances[best] <= radius else None
+
+
+def test_grid_matches_brute_force():
+    """The grid returns the same node as a linear scan for random queries."""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 1000, size=(500, 2))
+    grid = SpatialGrid(points, radius=12)
+    for x, y in rng.uniform(-20, 1020, size=(2000, 2)):
+        assert grid.nearest(x, y) == brute_force_nearest(points, x, y, 12)
+
+
+def test_grid_rejects_bad_radius():
+    """A zero radius is refused."""
+    with pytest.raises(ValueError):
+        SpatialGrid([(0, 0)], radius=0)
+
+
+def test_node_at_hits_node_centers(renderer):
+    """Clicking on a node center in display pixels returns that node."""
+    renderer.display_graph()
+    transform = renderer.ax.transData
+    for node, position in renderer.graph.node_positions.items():
+        x, y = transform.transform(position)
+        assert renderer.node_at(x, y) == node
+    assert renderer.node_at(0, 0) is None
+
+
+def test_node_at_follows_resize(renderer):
+    """The grid is rebuilt when the figure is resized."""
+    renderer.display_graph()
+    renderer.node_at(0, 0)
+    grid = renderer._hit_grid
+
+    renderer.canvas.figure.set_size_inches(6, 3)
+    renderer.canvas.draw()
+    x, y = renderer.ax.transData.transform(renderer.graph.node_positions["Q2"])
+
+    assert renderer.node_at(x, y) == "Q2"
+    assert renderer._hit_grid is not grid
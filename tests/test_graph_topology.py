@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from duckquest.graph.layout import grid_board
+from duckquest.graph.manager import GraphManager
+from duckquest.graph.topology import BoardTopology, shared_topology
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_sessions_share_the_classic_topology(graph_manager):
+    """Every GraphManager of the process uses the same topology object"""
+    other = GraphManager(backend="compact")
+    assert graph_manager.topology is other.topology is shared_topology()
+    assert other.nodes is graph_manager.nodes
+
+
+def test_topology_is_read_only():
+    """The shared lists and positions cannot be modified"""
+    topology = shared_topology()
+    with pytest.raises(TypeError):
+        topology.positions["A1"] = (0, 0)
+    with pytest.raises(AttributeError):
+        topology.nodes.append("Z9")
+    with pytest.raises(ValueError):
+        topology.core.weights[0] = 1
+
+
+def test_compact_sessions_have_their_own_weights():
+    """Weights of one session never leak into another"""
+    first = GraphManager(backend="compact")
+    second = GraphManager(backend="compact")
+    first.assign_weights_and_colors(difficulty=11, seed=0)
+    assert first.core.neighbor_ids is second.core.neighbor_ids
+    assert np.all(second.core.weights == 0)
+    assert second.edge_weight("A1", "B1") is None
+
+
+def test_explicit_topology_is_reused():
+    """A generated board's topology can be shared by passing it in"""
+    topology = BoardTopology(grid_board(5, 8, holes=0, seed=0))
+    graph = GraphManager(backend="compact", topology=topology)
+    assert graph.topology is topology
+    assert (graph.start_node, graph.end_node) == (topology.start, topology.end)
@@ -0,0 +1,155 @@
+import mmap
+import networkx as nx
+import numpy as np
+from duckquest.graph.bank import PATH_PAD, BoardBank, bank_path, write_bank
+from duckquest.graph.manager import sample_weights
+from duckquest.graph.tuning import (
+    GREEDY_STUCK,
+    AcceptanceCriteria,
+    BatchScorer,
+    BatchScores,
+    generate_boards,
+)
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def greedy_walk(manager, start, goal):
+    """Reference greedy walk: cheapest edge to an unvisited neighbor, first on ties."""
+    current, visited, cost = start, {start}, 0
+    while current != goal:
+        options = [n for n in manager.neighbors(current) if n not in visited]
+        if not options:
+            return GREEDY_STUCK
+        weights = [manager.edge_weight(current, n) for n in options]
+        best = options[weights.index(min(weights))]
+        cost += manager.edge_weight(current, best)
+        visited.add(best)
+        current = best
+    return cost
+
+
+def test_batch_scores_match_networkx(compact_graph_manager):
+    """Test the vectorized scores against networkx and a scalar greedy walk."""
+    manager = compact_graph_manager
+    scorer = BatchScorer(manager.core, manager.start_node, manager.end_node)
+    weights = sample_weights(np.random.default_rng(7), 11, len(manager.edges), 25)
+    scores = scorer.score(weights)
+
+    for board, board_weights in enumerate(weights):
+        manager.apply_weights(board_weights)
+        graph = manager.graph
+        paths = list(
+            nx.all_shortest_paths(graph, "A1", "Q2", weight="weight", method="dijkstra")
+        )
+        optimal = nx.shortest_path_length(graph, "A1", "Q2", weight="weight")
+        assert scores.optimal_cost[board] == optimal
+        assert scores.tied_paths[board] == len(paths)
+        assert scores.greedy_cost[board] == greedy_walk(manager, "A1", "Q2")
+
+
+def test_acceptance_mask():
+    """Test that the criteria combine tie count and greedy gap."""
+    scores = BatchScores(
+        optimal_cost=np.array([10, 10, 10, 10]),
+        tied_paths=np.array([1, 2, 1, 1]),
+        greedy_cost=np.array([14, 14, 11, GREEDY_STUCK]),
+    )
+    mask = scores.accepted(AcceptanceCriteria(max_tied_paths=1, min_greedy_gap=2))
+    assert mask.tolist() == [True, False, False, True]
+
+
+def test_optimal_paths_are_optimal(compact_graph_manager):
+    """Test that the extracted paths walk from start to goal at the optimal cost."""
+    manager = compact_graph_manager
+    scorer = BatchScorer(manager.core, manager.start_node, manager.end_node)
+    weights = sample_weights(np.random.default_rng(5), 11, len(manager.edges), 25)
+    distances = scorer.distances_to_goal(weights)
+    paths = scorer.optimal_paths(weights, distances)
+
+    for board_weights, cost, row in zip(weights, distances[:, scorer.start], paths):
+        manager.apply_weights(board_weights)
+        path = [manager.nodes[i] for i in row if i != PATH_PAD]
+        assert path[0] == "A1" and path[-1] == "Q2"
+        assert sum(manager.edge_weight(u, v) for u, v in zip(path, path[1:])) == cost
+
+
+def test_generate_and_load_bank(tmp_path, logic):
+    """Test that generated boards round-trip through a bank and feed restarts."""
+    weights, costs, paths = generate_boards(
+        11, 2000, workers=1, chunk_size=1000, seed=3
+    )
+    assert len(weights) > 0
+    path = bank_path(11, str(tmp_path))
+    write_bank(path, 11, logic.graph.topology_hash, weights, costs, paths)
+
+    bank = BoardBank(path)
+    assert len(bank) == len(weights)
+    assert isinstance(bank.records.base.obj, mmap.mmap)
+    board = bank.board(0)
+    assert np.array_equal(board.weights, weights[0])
+    assert board.cost == costs[0]
+    assert board.path.tolist() == [i for i in paths[0] if i != PATH_PAD]
+
+    logic.graph.load_board_banks(str(tmp_path))
+    logic.restart_game()
+    rows = (weights == logic.graph.weights).all(axis=1)
+    assert rows.any()
+    expected = costs[np.argmax(rows)]
+    assert logic.graph.shortest_path_cost("A1", "Q2") == expected
+    path = logic.graph.shortest_path("A1", "Q2")
+    graph = logic.graph.graph
+    assert nx.path_weight(graph, path, weight="weight") == expected
+    assert nx.shortest_path_length(graph, "A1", "Q2", weight="weight") == expected
+
+
+def test_banks_are_unmapped_on_close_and_reload(tmp_path, logic):
+    """Test that banks release their mapping, and that reloading closes the old ones."""
+    graph = logic.graph
+    weights = np.ones((3, len(graph.edges)), dtype=np.uint8)
+    route = nx.shortest_path(graph.graph, graph.start_node, graph.end_node)
+    paths = np.array([[graph.nodes.index(node) for node in route]] * 3)
+    path = bank_path(11, str(tmp_path))
+    write_bank(path, 11, graph.topology_hash, weights, [len(route) - 1] * 3, paths)
+
+    with BoardBank(path) as bank:
+        assert bank.board(2).cost == len(route) - 1
+    assert bank._mmap.closed
+
+    graph.load_board_banks(str(tmp_path))
+    first = graph.board_banks[11]
+    logic.restart_game()  # The graph keeps a copy of the bank board's weights
+    graph.load_board_banks(str(tmp_path))
+    assert first._mmap.closed
+    assert not graph.board_banks[11]._mmap.closed
+    assert graph.weights.tolist() == weights[0].tolist()
+
+
+def test_rewriting_a_mapped_bank(tmp_path, graph_manager):
+    """Test that a bank is replaced, not rewritten, under a game that has it mapped."""
+    weights = np.ones((2, len(graph_manager.edges)), dtype=np.uint8)
+    paths = np.full((2, 4), PATH_PAD, dtype=np.uint16)
+    path = bank_path(6, str(tmp_path))
+    write_bank(path, 6, graph_manager.topology_hash, weights, [1, 2], paths)
+
+    with BoardBank(path) as bank:
+        write_bank(
+            path, 6, graph_manager.topology_hash, weights[:1] * 5, [3], paths[:1]
+        )
+        assert [bank.board(i).cost for i in range(2)] == [1, 2]
+        assert bank.board(1).weights.tolist() == weights[1].tolist()
+    with BoardBank(path) as bank:
+        assert len(bank) == 1 and bank.board(0).cost == 3
+    assert [entry.name for entry in tmp_path.iterdir()] == ["difficulty_6.bank"]
+
+
+def test_bank_for_another_graph_is_skipped(tmp_path, graph_manager):
+    """Test that banks are tied to the node and edge lists they were built for."""
+    weights = np.ones((1, len(graph_manager.edges)), dtype=np.uint8)
+    paths = np.full((1, 4), PATH_PAD, dtype=np.uint16)
+    write_bank(bank_path(6, str(tmp_path)), 6, b"x" * 16, weights, [1], paths)
+    (tmp_path / "difficulty_7.bank").write_bytes(b"")
+
+    graph_manager.load_board_banks(str(tmp_path))
+    assert graph_manager.board_banks == {}
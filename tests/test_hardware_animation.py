@@ -0,0 +1,159 @@
+import threading
+import pytest
+from duckquest.hardware.animation import Animator
+from duckquest.hardware.effects import BLACK, Frame, score_color
+from duckquest.hardware.framebuffer import FrameBuffer
+from duckquest.hardware.mock import LEDStripManager, MockStrip
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class VirtualClock:
+    """Clock for the animator that only moves when the animator sleeps.
+
+    With *hold* set, the first sleep longer than *hold* seconds blocks until release(), so
+    a test can act while an effect is known to be waiting between two frames.
+    """
+
+    def __init__(self, hold: float = None):
+        self.now = 0.0
+        self.hold = hold
+        self.holding = threading.Event()
+        self._released = threading.Event()
+        self._interrupted = False
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> bool:
+        """Advance the clock; return True if the sleep was interrupted."""
+        if self.hold is not None and seconds > self.hold:
+            self.hold = None
+            self.holding.set()
+            self._released.wait(5)
+            if self._interrupted:
+                return True
+        self.now += seconds
+        return False
+
+    def release(self, interrupted: bool = True) -> None:
+        """End the held sleep, as a cancellation or as the end of the wait."""
+        self._interrupted = interrupted
+        self._released.set()
+
+
+def virtual_strip(num_pixels: int, hold: float = None):
+    """Return a mock strip running on a virtual clock, and the clock."""
+    clock = VirtualClock(hold)
+    return LEDStripManager(num_pixels, clock=clock, sleep=clock.sleep), clock
+
+
+def test_effects_do_not_block():
+    """Effects are scheduled and return before their frames are played."""
+    strip, clock = virtual_strip(20, hold=0)
+    color = strip.score_effect(0.25)
+    strip.blink(color, 3, 20)
+    strip.clear()
+    # The animator is still waiting after the first score frame
+    assert clock.holding.wait(5)
+    assert len(strip.timeline) == 1
+    clock.release(interrupted=False)
+
+    assert strip.wait(timeout=5)
+    # 5 score steps and 6 blink frames; the strip is already off when clear() runs
+    assert len(strip.timeline) == 5 + 6
+    assert color == score_color(20, 0.25)
+    assert strip.pixels == [BLACK] * 20
+    strip.close()
+
+
+def test_blink_timeline_follows_hold_times():
+    """Blink frames are written wait_ms apart."""
+    strip, _ = virtual_strip(5)
+    strip.blink((255, 0, 0), 3, 30)
+    assert strip.wait(timeout=5)
+
+    times = [t for t, _ in strip.timeline]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert len(times) == 6
+    assert gaps == pytest.approx([0.03] * 5)
+    strip.close()
+
+
+def test_cancel_preempts_running_effect():
+    """Cancelling stops a long effect at once and turns the strip off."""
+    strip, clock = virtual_strip(5, hold=1)
+    strip.blink((0, 255, 0), 100, 5000)
+    strip.blink((0, 0, 255), 100, 5000)
+    assert clock.holding.wait(5)
+    assert strip.cancel()
+    clock.release()
+
+    assert strip.wait(timeout=5)
+    # The first green frame, then the strip turned off
+    assert len(strip.timeline) == 2
+    assert strip.pixels == [BLACK] * 5
+    strip.close()
+
+
+def test_new_effect_preempts_current_one():
+    """play() aborts the current animation unless asked to queue."""
+    strip, clock = virtual_strip(3, hold=1)
+    strip.play(iter([Frame([(0, (1, 1, 1))], 5000)]))
+    assert clock.holding.wait(5)
+    strip.play(iter([Frame([(1, (2, 2, 2))])]))
+    clock.release()
+
+    assert strip.wait(timeout=5)
+    assert strip.pixels == [(1, 1, 1), (2, 2, 2), BLACK]
+    assert clock.now < 1  # The 5 s hold was cut short
+    strip.close()
+
+
+def test_framebuffer_shows_only_changed_pixels():
+    """A flush sends the dirty pixels once and calls show() a single time."""
+    strip = MockStrip(num_pixels=10)
+    framebuffer = FrameBuffer(strip)
+    framebuffer.update([(i, (255, 0, 0)) for i in range(10)])
+    assert framebuffer.flush(now=0)
+    framebuffer.update([(3, (255, 0, 0)), (4, (0, 0, 255))])
+    assert framebuffer.flush(now=1)
+    assert not framebuffer.flush(now=2)
+
+    assert framebuffer.shows == 2
+    assert strip.set_calls == 10 + 1
+    assert strip.timeline[-1][1] == {4: 0x0000FF}
+
+
+def test_frames_shorter_than_the_cap_are_merged():
+    """With a virtual clock, a 60 FPS cap bounds the show() calls of fast effects."""
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+        return False
+
+    strip = MockStrip(num_pixels=144)
+    framebuffer = FrameBuffer(strip, max_fps=60)
+    animator = Animator(framebuffer, clock=lambda: now[0], sleep=sleep)
+    animator.play(iter([Frame([(i, (0, 255, 0))], 1) for i in range(144)]))
+    assert animator.wait(timeout=5)
+    animator.stop()
+
+    # 144 one-pixel steps of 1 ms last 144 ms: about 9 frames at 60 FPS
+    assert framebuffer.shows <= 10
+    assert all(framebuffer.color(i) == (0, 255, 0) for i in range(144))
+
+
+def test_queued_pixel_writes_share_a_show():
+    """Single-pixel writes queued back to back do not each call show()."""
+    strip, clock = virtual_strip(144, hold=0)
+    for i in range(144):
+        strip.set_pixel_color(i, (0, 0, 255))
+    assert clock.holding.wait(5)  # Waiting for the frame-rate cap after the first show
+    clock.release(interrupted=False)
+    assert strip.wait(timeout=5)
+    assert len(strip.timeline) <= 3
+    assert strip.pixels == [(0, 0, 255)] * 144
+    strip.close()
@@ -0,0 +1,81 @@
+import pytest
+from duckquest.hardware.board_sync import (
+    SHORTEST_PATH_COLOR,
+    USER_PATH_COLOR,
+    WEIGHT_COLORS,
+    BoardSync,
+    SegmentMap,
+)
+from duckquest.hardware.mock import LEDStripManager
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@pytest.fixture
+def board(logic):
+    """BoardSync driving a mock LED strip from the GraphLogic fixture."""
+    strip = LEDStripManager()
+    sync = BoardSync(strip, logic.graph, logic)
+    yield sync
+    strip.close()
+
+
+def test_default_segment_map_covers_every_edge(graph_manager):
+    """The shipped data file gives every edge its own pixels on the strip."""
+    segment_map = SegmentMap.from_file()
+    assert segment_map.led_count == 144
+    for edge in graph_manager.edges:
+        assert len(segment_map.pixels(*edge)) > 0
+        assert segment_map.pixels(*reversed(edge)) == segment_map.pixels(*edge)
+
+
+def test_overlapping_segments_are_rejected():
+    """Two edges cannot share a pixel."""
+    with pytest.raises(ValueError):
+        SegmentMap({("A1", "B1"): range(0, 3), ("A1", "C1"): range(2, 4)}, 10)
+    with pytest.raises(ValueError):
+        SegmentMap({("A1", "B1"): range(8, 12)}, 10)
+
+
+def test_sync_pushes_only_changed_edges(board):
+    """The first sync paints the board, later ones only the edges that changed."""
+    graph, logic, strip = board.graph, board.logic, board.led_strip_manager
+    assert board.sync() == len(graph.edges)
+    assert board.sync() == 0
+
+    neighbor = graph.neighbors(logic.current_node)[0]
+    logic.handle_node_click(neighbor)
+    assert board.sync() == 1
+    assert strip.wait(timeout=1)
+
+    edge = logic.user_path_edges[-1]
+    pixels = board.segment_map.pixels(*edge)
+    assert all(strip.pixels[i] == USER_PATH_COLOR for i in pixels)
+    # Two frames: the whole board, then the pixels of the one new edge
+    assert len(strip.timeline) == 2
+    assert len(strip.timeline[-1][1]) == len(pixels)
+
+
+def test_sync_highlights_shortest_path(board):
+    """Shortest path edges are shown in purple, the others in their weight color."""
+    graph, logic, strip = board.graph, board.logic, board.led_strip_manager
+    path = graph.shortest_path(logic.start_node, logic.end_node)
+    board.sync(highlight=path)
+    assert strip.wait(timeout=1)
+
+    on_path = set(zip(path, path[1:]))
+    for (u, v), weight in zip(graph.edges, graph.weights.tolist()):
+        expected = (
+            SHORTEST_PATH_COLOR
+            if (u, v) in on_path or (v, u) in on_path
+            else WEIGHT_COLORS[weight]
+        )
+        assert strip.pixels[board.segment_map.pixels(u, v)[0]] == expected
+
+
+def test_invalidate_repaints_everything(board):
+    """After an effect covered the strip, the next sync repaints every edge."""
+    board.sync()
+    board.invalidate()
+    assert board.sync() == len(board.graph.edges)
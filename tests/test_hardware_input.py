@@ -0,0 +1,58 @@
+import threading
+from duckquest.game_manager import GameManager
+from duckquest.hardware.input_events import ButtonEventQueue
+from duckquest.hardware.mock import ButtonManager, LEDStripManager
+from duckquest.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def test_bounces_are_dropped():
+    """A second edge on the same pin inside the debounce window is ignored."""
+    events = ButtonEventQueue(debounce_ms=50)
+    assert events.push(17, timestamp=1.000)
+    assert not events.push(17, timestamp=1.020)
+    assert events.push(22, timestamp=1.020)
+    assert events.push(17, timestamp=1.060)
+    assert [event.pin for event in events.drain()] == [17, 22, 17]
+    assert events.dropped == 1
+    assert events.drain() == []
+
+
+def test_presses_from_other_threads_are_queued():
+    """Presses injected from several threads all reach the consumer."""
+    buttons = ButtonManager([17, 22])
+
+    def press_many(pin):
+        for i in range(100):
+            buttons.inject(pin, timestamp=i)
+
+    threads = [threading.Thread(target=press_many, args=(pin,)) for pin in (17, 22)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(buttons.poll_events()) == 200
+
+
+def test_game_manager_dispatches_queued_presses():
+    """Queued presses run their actions in order and record their latency."""
+    manager = GameManager.__new__(GameManager)
+    manager.button_manager = ButtonManager([17, 22, 23, 27, 16])
+    manager.led_strip_manager = LEDStripManager()
+    calls = []
+    manager.select_node = lambda: calls.append("select")
+    manager.next_node = lambda: calls.append("next")
+    manager.previous_node = lambda: calls.append("previous")
+    manager.reset_selection = lambda: calls.append("reset")
+    manager.check_path = lambda: calls.append("check")
+
+    for pin in (22, 22, 17, 5):
+        manager.button_manager.inject(pin)
+    manager.handle_button_events()
+
+    # The second press on 22 is a bounce and pin 5 is not mapped
+    assert calls == ["next", "select"]
+    stats = manager.button_manager.events.stats.summary()
+    assert stats["events"] == 2
+    assert stats["max_ms"] >= 0
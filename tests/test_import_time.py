@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+from duckquest.utils.logger import PROJECT_ROOT, setup_logger
+from scripts.import_profile import cold_start_ms, parse_importtime, profile_import
+
+logger = setup_logger(__name__)
+
+# Time allowed before the splash screen can appear; raise it on slow machines
+STARTUP_BUDGET_MS = float(os.environ.get("DUCKQUEST_STARTUP_BUDGET_MS", 300))
+HEAVY_MODULES = ("matplotlib", "networkx", "numpy")
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       131 |        131 |   _io
+import time:       293 |        834 | _frozen_importlib_external
+import time:        50 |         50 | duckquest
+import time:       400 |        400 |     duckquest.utils.logger
+import time:       100 |        500 |   duckquest.utils
+import time:       200 |        700 | duckquest.main
+"""
+
+
+def test_parse_importtime():
+    """Records keep their nesting level and only the profiled module is counted."""
+    records = parse_importtime(SAMPLE)
+    assert [record.depth for record in records] == [1, 0, 0, 2, 1, 0]
+    assert records[-1].module == "duckquest.main"
+    assert cold_start_ms(records, "duckquest.main") == 0.75
+
+
+def test_entry_point_does_not_import_heavy_modules():
+    """The splash screen can be shown before matplotlib, networkx and numpy load."""
+    code = (
+        "import sys, duckquest.main; "
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_cold_start_within_budget():
+    """Importing the entry point stays under the startup budget."""
+    elapsed = cold_start_ms(profile_import("duckquest.main"), "duckquest.main")
+    logger.info(f"Cold import of duckquest.main: {elapsed:.1f} ms")
+    assert elapsed < STARTUP_BUDGET_MS
@@ -0,0 +1,139 @@
+import logging
+import multiprocessing
+import os
+import queue
+from logging.handlers import RotatingFileHandler
+import pytest
+from duckquest.utils import logger as logger_module
+from duckquest.utils.logger import (
+    DropReportingListener,
+    DroppingQueueHandler,
+    flush_logs,
+    setup_logger,
+)
+
+logger = setup_logger(__name__)
+
+
+class ListHandler(logging.Handler):
+    """Handler that keeps the formatted messages."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def queued_logger(handler: logging.Handler, level: int = logging.DEBUG):
+    """Return a logger that only writes to *handler*."""
+    test_logger = logging.getLogger(f"{__name__}.queued")
+    test_logger.handlers.clear()
+    test_logger.propagate = False
+    test_logger.setLevel(level)
+    test_logger.addHandler(handler)
+    return test_logger
+
+
+def test_setup_logger_shares_one_queue_handler():
+    """Every logger pushes into the same queue, and only once."""
+    first = setup_logger("duckquest.tests.first")
+    second = setup_logger("duckquest.tests.second")
+    setup_logger("duckquest.tests.first")
+    assert len(first.handlers) == 1
+    assert isinstance(first.handlers[0], DroppingQueueHandler)
+    assert first.handlers[0] is second.handlers[0]
+
+
+def test_full_queue_drops_debug_records():
+    """New low-level records are dropped and counted when the queue is full."""
+    handler = DroppingQueueHandler(queue.Queue(2))
+    test_logger = queued_logger(handler)
+    for i in range(5):
+        test_logger.debug("Record %d", i)
+    assert handler.dropped == 3
+    assert [handler.queue.get_nowait().getMessage() for _ in range(2)] == [
+        "Record 0",
+        "Record 1",
+    ]
+
+
+def test_full_queue_keeps_warnings():
+    """A warning replaces the oldest queued record instead of being dropped."""
+    handler = DroppingQueueHandler(queue.Queue(2))
+    test_logger = queued_logger(handler)
+    test_logger.debug("Record 0")
+    test_logger.debug("Record 1")
+    test_logger.warning("Something went wrong")
+    assert handler.dropped == 1
+    assert [handler.queue.get_nowait().getMessage() for _ in range(2)] == [
+        "Record 1",
+        "Something went wrong",
+    ]
+
+
+def test_records_are_merged_before_queueing():
+    """Arguments and tracebacks are turned into text on the calling thread."""
+    handler = DroppingQueueHandler(queue.Queue())
+    test_logger = queued_logger(handler)
+    path = ["A1", "B1"]
+    test_logger.debug("Path: %s", path)
+    path.append("C1")  # Mutated after the call: the record keeps what was logged
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        test_logger.error("Failed", exc_info=True)
+
+    record = handler.queue.get_nowait()
+    assert record.getMessage() == "Path: ['A1', 'B1']"
+    assert record.args is None
+    error = handler.queue.get_nowait()
+    assert error.exc_info is None
+    assert "ValueError: boom" in error.exc_text
+
+
+def test_disabled_level_skips_formatting():
+    """A record below the logger level never formats its arguments."""
+
+    class Unprintable:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    handler = DroppingQueueHandler(queue.Queue())
+    test_logger = queued_logger(handler, level=logging.INFO)
+    test_logger.debug("Value: %s", Unprintable())
+    assert handler.queue.empty()
+
+
+def test_listener_writes_records_and_reports_drops():
+    """The listener thread writes queued records, preceded by the number of drops."""
+    handler = DroppingQueueHandler(queue.Queue(1))
+    output = ListHandler()
+    test_logger = queued_logger(handler)
+    test_logger.info("Kept")
+    test_logger.info("Dropped")
+
+    listener = DropReportingListener(handler, output)
+    listener.start()
+    listener.stop()
+    assert output.messages == ["1 log records dropped, queue full (1 records)", "Kept"]
+
+
+def worker_handlers() -> list[tuple[str, int]]:
+    """Log from a forked worker and return its listener's handler types and ids."""
+    setup_logger(f"{__name__}.worker").info("Logged from worker %d", os.getpid())
+    flush_logs()
+    return [(type(h).__name__, id(h)) for h in logger_module._listener.handlers]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs fork()")
+def test_forked_workers_do_not_rotate_the_log_file():
+    """A forked worker writes through its own handlers, none of which rotate."""
+    setup_logger(__name__)
+    parent = [id(h) for h in logger_module._listener.handlers]
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        child = pool.apply(worker_handlers)
+    assert not {handler_id for _, handler_id in child} & set(parent)
+    assert "FileHandler" in [name for name, _ in child]
+    assert RotatingFileHandler.__name__ not in [name for name, _ in child]
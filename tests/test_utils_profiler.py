@@ -0,0 +1,71 @@
+import logging
+import threading
+import time
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.renderer import GraphRenderer
+from duckquest.hardware.framebuffer import FrameBuffer
+from duckquest.main import parse_args
+from duckquest.utils.logger import setup_logger
+from duckquest.utils.profiler import SamplingProfiler, component
+
+logger = setup_logger(__name__)
+
+
+def spin(stop: threading.Event):
+    """Busy loop for the profiler to find."""
+    total = 0
+    while not stop.is_set():
+        total += sum(range(100))
+    return total
+
+
+def test_profiler_samples_other_threads(tmp_path):
+    """A busy thread shows up under its name, with its function, in collapsed stacks."""
+    stop = threading.Event()
+    worker = threading.Thread(target=spin, args=(stop,), name="busy-worker")
+    worker.start()
+    profiler = SamplingProfiler(interval_ms=1)
+    profiler.start()
+    time.sleep(0.2)
+    profiler.stop()
+    stop.set()
+    worker.join()
+
+    assert profiler.samples > 10
+    lines = profiler.collapsed()
+    busy = [line for line in lines if line.startswith("busy-worker;")]
+    assert busy
+    assert any("spin (tests/test_utils_profiler.py:" in line for line in busy)
+    assert not any(line.startswith("profiler;") for line in lines)
+
+    path = profiler.write(str(tmp_path / "profile.folded"))
+    with open(path, encoding="utf-8") as file:
+        written = file.read().splitlines()
+    assert written == lines
+    stack, count = written[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+
+
+def test_samples_are_attributed_to_components():
+    """The innermost frame of a known part of the game names the component."""
+    render = GraphRenderer.display_graph.__wrapped__.__code__
+    click = GraphLogic.handle_node_click.__code__
+    log = logging.Logger.debug.__code__
+    flush = FrameBuffer.flush.__code__
+    wait = threading.Condition.wait.__code__
+    outer = test_samples_are_attributed_to_components.__code__
+
+    assert component((outer, render)) == "renderer"
+    assert component((outer, click)) == "logic"
+    assert component((outer, click, log)) == "logging"
+    assert component((outer, flush)) == "led"
+    assert component((outer, flush, wait)) == "idle"
+    assert component((outer,)) == "other"
+
+
+def test_profile_options():
+    """The game runs unprofiled unless asked to."""
+    assert not parse_args([]).profile
+    args = parse_args(["--profile", "--profile-interval", "5"])
+    assert args.profile
+    assert args.profile_interval == 5
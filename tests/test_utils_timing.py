@@ -0,0 +1,181 @@
+import json
+import time
+import numpy as np
+import pytest
+from duckquest import game_manager
+from duckquest.game_manager import GameManager
+from duckquest.graph.logic import GraphLogic
+from duckquest.graph.manager import GraphManager
+from duckquest.hardware.mock import ButtonManager, LEDStripManager
+from duckquest.utils.logger import setup_logger
+from duckquest.utils.timing import (
+    LatencyHistogram,
+    Timings,
+    bucket_bounds,
+    bucket_index,
+    timed,
+    timings,
+)
+
+logger = setup_logger(__name__)
+
+
+@pytest.fixture
+def timing_on(monkeypatch):
+    """Turn the process-wide timings on, starting from empty histograms."""
+    monkeypatch.setattr(timings, "enabled", True)
+    monkeypatch.setattr(timings, "histograms", {})
+    return timings
+
+
+def test_buckets_cover_values_with_bounded_error():
+    """Every value falls in its bucket, and buckets stay within 1/64 of the value."""
+    values = [*range(5000), 65_535, 1_000_000, 60_000_000]
+    for value in values:
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+        assert high - low <= max(0, value // 64)
+    indices = [bucket_index(value) for value in range(100_000)]
+    assert indices == sorted(indices)
+
+
+def test_percentiles_match_exact_values():
+    """Histogram percentiles agree with numpy to bucket precision."""
+    rng = np.random.default_rng(3)
+    values = rng.lognormal(mean=8, sigma=1.5, size=20_000).astype(int)
+    histogram = LatencyHistogram()
+    for value in values.tolist():
+        histogram.record(value)
+    for fraction in (0.5, 0.9, 0.99):
+        exact = np.percentile(values, 100 * fraction)
+        assert histogram.percentile(fraction) == pytest.approx(exact, rel=0.03)
+    assert histogram.count == len(values)
+    assert histogram.max == values.max()
+    assert histogram.fraction_below(2 * int(values.max())) == 1.0
+
+
+def test_merge_adds_counts():
+    """Merging two histograms gives the histogram of all their values."""
+    first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 3000, 7):
+        (first if value % 2 else second).record(value)
+        both.record(value)
+    first.merge(second)
+    assert first.counts == both.counts
+    assert (first.min, first.max, first.total) == (both.min, both.max, both.total)
+
+
+def test_disabled_timings_record_nothing(monkeypatch):
+    """With timing off, timed calls go straight through and spans are shared no-ops."""
+    monkeypatch.setattr(timings, "enabled", False)
+    monkeypatch.setattr(timings, "histograms", {})
+
+    @timed("test.disabled")
+    def add(a, b):
+        return a + b
+
+    assert add(2, 3) == 5
+    assert timings.span("test.a") is timings.span("test.b")
+    with timings.span("test.a"):
+        pass
+    assert timings.histograms == {}
+
+
+def test_spans_and_dump(timing_on, tmp_path):
+    """Timed calls and spans are counted and written to JSON."""
+
+    @timed("test.call")
+    def work():
+        return sum(range(1000))
+
+    for _ in range(10):
+        work()
+    with timing_on.span("test.block"):
+        work()
+
+    path = timing_on.dump(str(tmp_path / "timings.json"))
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    assert data["input_budget_ms"] == 50
+    assert data["spans"]["test.call"]["count"] == 11  # Also called inside the block
+    assert sum(data["spans"]["test.call"]["buckets_us"].values()) == 11
+    assert data["spans"]["test.block"]["count"] == 1
+    assert set(data["spans"]) == {"test.call", "test.block"}
+
+
+def test_registry_is_independent():
+    """A Timings instance only counts its own spans."""
+    local = Timings(enabled=True)
+    with local.span("test.local"):
+        pass
+    assert list(local.report()) == ["test.local"]
+    assert local.report()["test.local"]["count"] == 1
+
+
+def test_game_manager_reports_press_latency(timing_on):
+    """Button presses are timed per action and from press to display."""
+    manager = GameManager.__new__(GameManager)
+    manager.difficulty = 6
+    manager.graph = GraphManager(backend="compact")
+    manager.logic = GraphLogic(manager, seed=1)
+    manager.button_manager = ButtonManager([17, 22, 23, 27, 16])
+    manager.led_strip_manager = LEDStripManager()
+    manager.update_display = lambda: None
+
+    for pin in (22, 23, 17):
+        manager.button_manager.inject(pin)
+    manager.handle_button_events()
+    manager.led_strip_manager.close()
+
+    report = manager.latency_report()
+    spans = report["spans"]
+    assert spans["action.next_node"]["count"] == 1
+    assert spans["action.previous_node"]["count"] == 1
+    assert spans["action.select_node"]["count"] == 1
+    assert spans["input.press_to_display"]["count"] == 3
+    assert report["within_budget"] == 1.0
+
+
+def test_press_latency_excludes_the_result_dialog(timing_on, monkeypatch):
+    """Checking the path is timed up to the result dialog, not until it is closed."""
+    waited = []
+
+    def dialog(*args):
+        time.sleep(0.2)  # The player reading the result
+        waited.append(args[0])
+
+    monkeypatch.setattr(game_manager.messagebox, "showinfo", dialog)
+    monkeypatch.setattr(game_manager.messagebox, "showerror", dialog)
+    manager = GameManager.__new__(GameManager)
+    manager.difficulty = 6
+    manager.score = 0
+    manager.graph = GraphManager(backend="compact")
+    manager.logic = GraphLogic(manager, seed=1)
+    manager.button_manager = ButtonManager([17, 22, 23, 27, 16])
+    manager.led_strip_manager = LEDStripManager()
+    manager.board_sync = type("Sync", (), {"invalidate": lambda self: None})()
+    manager.graph_ui = type("UI", (), {"update_score_display": lambda self, s: None})()
+    manager.update_display = lambda: None
+
+    manager.button_manager.inject(16)
+    manager.handle_button_events()
+    manager.led_strip_manager.cancel()
+    manager.led_strip_manager.close()
+
+    assert waited
+    presses = timing_on.histograms["input.press_to_display"]
+    assert presses.count == 1
+    assert presses.fraction_below(150_000) == 1.0
+    assert manager.button_manager.events.stats.count == 1
+    assert manager.pending_press is None
+
+
+def test_renderer_spans(timing_on, renderer):
+    """Redraws time the whole update and the canvas work inside it."""
+    renderer.display_graph()
+    renderer.logic.next_node()
+    renderer.display_user_path()
+    spans = timing_on.report()
+    assert spans["render.display_graph"]["count"] == 2
+    assert spans["render.canvas_draw"]["count"] >= 1
+    assert spans["render.blit"]["count"] == 1